@@ -1,3 +1,5 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -6,9 +8,31 @@ from .labels.api import router as labels_router
 from .statuses.api import router as statuses_router
 from .priorities.api import router as priorities_router
 from .users.api import router as users_router
+from .metrics.api import router as metrics_router
+
+from ..db.changes import NOTIFY_ENABLED
+from ..db.notifications import CHANGE_LISTENER
+from ..services.counters import COUNTER_RECONCILER
+from ..services.reminders import REMINDER_SCHEDULER
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if NOTIFY_ENABLED:
+        await CHANGE_LISTENER.start()
+    if REMINDER_SCHEDULER is not None:
+        await REMINDER_SCHEDULER.start()
+    if COUNTER_RECONCILER is not None:
+        await COUNTER_RECONCILER.start()
+    yield
+    if COUNTER_RECONCILER is not None:
+        await COUNTER_RECONCILER.stop()
+    if REMINDER_SCHEDULER is not None:
+        await REMINDER_SCHEDULER.stop()
+    await CHANGE_LISTENER.stop()
 
 
-app = FastAPI(title="Tasks Managment System API")
+app = FastAPI(title="Tasks Managment System API", lifespan=lifespan)
 
 
 app.add_middleware(
@@ -24,4 +48,5 @@ app.include_router(labels_router)
 app.include_router(statuses_router)
 app.include_router(priorities_router)
 app.include_router(users_router)
+app.include_router(metrics_router)
 
@@ -0,0 +1,52 @@
+import hashlib
+import json
+
+from typing import Iterable
+
+from fastapi import Depends, HTTPException, Request, Response, status
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..db.dbase import get_unit_of_work
+from ..db.versions import DatabaseVersions
+
+
+def get_database_versions(session: AsyncSession = Depends(get_unit_of_work, scope="function")) -> DatabaseVersions:
+    # Same cached dependency as the services, so the stamp is read on the request's own session.
+    return DatabaseVersions(session)
+
+
+def make_etag(stamp: str, parameters: BaseModel, media_type: str | None = None) -> str:
+    # Each negotiated representation gets its own validator.
+    parts = [stamp, parameters.model_dump(mode="json")]
+    if media_type is not None:
+        parts.append(media_type)
+    key = json.dumps(parts, sort_keys=True)
+    return f'"{hashlib.sha256(key.encode()).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or any(tag.removeprefix("W/") == etag for tag in tags)
+
+
+async def conditional_get(
+    request: Request,
+    response: Response,
+    versions: DatabaseVersions,
+    tables: Iterable[str],
+    parameters: BaseModel,
+    media_type: str | None = None,
+) -> dict[str, str]:
+    etag = make_etag(await versions.stamp(*tables), parameters, media_type)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if media_type is not None:
+        headers["Vary"] = "Accept"
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
+    return headers
@@ -0,0 +1,61 @@
+from typing import Sequence
+
+from fastapi import HTTPException, Request, status
+
+from ..services.formats import ALIASES, COLUMNAR, JSON, MSGPACK, media_types
+
+
+# Documented on the list routes next to the JSON model.
+BINARY_CONTENT = {MSGPACK: {}, **{media_type: {} for media_type in COLUMNAR}}
+
+
+def _accepted(accept: str) -> list[tuple[str, float]]:
+    ranges = []
+    for part in accept.split(","):
+        media_range, *options = (piece.strip() for piece in part.split(";"))
+        if not media_range:
+            continue
+        quality = 1.0
+        for option in options:
+            name, _, value = option.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        media_range = media_range.lower()
+        ranges.append((ALIASES.get(media_range, media_range), quality))
+    return ranges
+
+
+def _quality(media_type: str, ranges: list[tuple[str, float]]) -> float:
+    # The most specific matching range decides, so "*/*, application/msgpack;q=0" refuses msgpack.
+    precedence, quality = -1, 0.0
+    wildcard = media_type.split("/")[0] + "/*"
+    for media_range, range_quality in ranges:
+        specificity = {media_type: 2, wildcard: 1, "*/*": 0}.get(media_range)
+        if specificity is not None and specificity > precedence:
+            precedence, quality = specificity, range_quality
+    return quality
+
+
+def negotiate(request: Request, offered: Sequence[str] | None = None) -> str:
+    offered = media_types() if offered is None else offered
+    accept = request.headers.get("accept")
+    if not accept:
+        return JSON
+
+    ranges = _accepted(accept)
+    best, chosen = 0.0, None
+    for media_type in offered:
+        # Ties go to the earlier offer, so JSON wins plain wildcards.
+        quality = _quality(media_type, ranges)
+        if quality > best:
+            best, chosen = quality, media_type
+
+    if chosen is None:
+        raise HTTPException(
+            status_code=status.HTTP_406_NOT_ACCEPTABLE,
+            detail=f"Supported media types: {', '.join(offered)}",
+        )
+    return chosen
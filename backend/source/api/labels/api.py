@@ -1,8 +1,12 @@
 from typing import Annotated
-from fastapi import APIRouter, Depends, status
-from .api_settings import Paths, PREFIX
+from fastapi import APIRouter, Depends, status, Request, Response
+from .api_settings import Paths, PREFIX, ETAG_TABLES, JSON_PASSTHROUGH
+
+from ..conditional import DatabaseVersions, conditional_get, get_database_versions
+from ..encoding import BINARY_CONTENT, negotiate
 
 from ...schemas.label import params, responses
+from ...services.formats import JSON
 from ...services import LabelService, get_label_service
 
 
@@ -15,15 +19,23 @@ router = APIRouter(prefix=PREFIX, tags=TAGS)  # type: ignore
     name="Get Label",
     status_code=status.HTTP_200_OK,
     responses={
-        status.HTTP_200_OK: {"model": responses.GetLabels},
+        status.HTTP_200_OK: {"model": responses.GetLabels, "content": BINARY_CONTENT},
         status.HTTP_404_NOT_FOUND: {},
-        status.HTTP_400_BAD_REQUEST: {}
+        status.HTTP_400_BAD_REQUEST: {},
+        status.HTTP_406_NOT_ACCEPTABLE: {}
     }
 )
 async def get_labels(
+    request: Request,
+    response: Response,
     parameters: params.GetLabels = Depends(),
-    service: LabelService = Depends(get_label_service)
+    service: LabelService = Depends(get_label_service),
+    versions: DatabaseVersions = Depends(get_database_versions)
 ):
+    media_type = negotiate(request)
+    headers = await conditional_get(request, response, versions, ETAG_TABLES, parameters, media_type)
+    if JSON_PASSTHROUGH or media_type != JSON:
+        return Response(await service.encode_labels(media_type), media_type=media_type, headers=headers)
     return await service.get_labels(parameters)
 
 
@@ -34,7 +46,8 @@ async def get_labels(
     responses={
         status.HTTP_201_CREATED: {"model": responses.Label},
         status.HTTP_404_NOT_FOUND: {},
-        status.HTTP_400_BAD_REQUEST: {}
+        status.HTTP_400_BAD_REQUEST: {},
+        status.HTTP_409_CONFLICT: {}
     }
 )
 async def create_label(
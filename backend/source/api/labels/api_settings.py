@@ -1,4 +1,9 @@
+import os
+
+
 PREFIX = "/labels"
+ETAG_TABLES = ("labels",)
+JSON_PASSTHROUGH = os.getenv("LABELS_JSON_PASSTHROUGH", "0") == "1"
 
 
 class Paths:
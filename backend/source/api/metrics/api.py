@@ -0,0 +1,51 @@
+from fastapi import APIRouter, Depends, status
+from .api_settings import Paths, PREFIX
+
+from ...schemas.metrics import responses
+from ...services import MetricsService, get_metrics_service
+
+
+TAGS = ["Metrics"]
+router = APIRouter(prefix=PREFIX, tags=TAGS)  # type: ignore
+
+
+@router.get(
+    path=Paths.GetPoolStats,
+    name="Get Pool Stats",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {"model": responses.PoolStats},
+    }
+)
+async def get_pool_stats(
+    service: MetricsService = Depends(get_metrics_service)
+):
+    return await service.get_pool_stats()
+
+
+@router.get(
+    path=Paths.GetCacheStats,
+    name="Get Cache Stats",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {"model": responses.CacheStats},
+    }
+)
+async def get_cache_stats(
+    service: MetricsService = Depends(get_metrics_service)
+):
+    return await service.get_cache_stats()
+
+
+@router.get(
+    path=Paths.GetReminderStats,
+    name="Get Reminder Stats",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {"model": responses.ReminderStats},
+    }
+)
+async def get_reminder_stats(
+    service: MetricsService = Depends(get_metrics_service)
+):
+    return await service.get_reminder_stats()
@@ -0,0 +1,7 @@
+PREFIX = "/metrics"
+
+
+class Paths:
+    GetPoolStats = "/pool"
+    GetCacheStats = "/cache"
+    GetReminderStats = "/reminders"
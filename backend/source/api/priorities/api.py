@@ -1,7 +1,11 @@
-from fastapi import APIRouter, Depends, status
-from .api_settings import Paths, PREFIX
+from fastapi import APIRouter, Depends, status, Request, Response
+from .api_settings import Paths, PREFIX, ETAG_TABLES, JSON_PASSTHROUGH
+
+from ..conditional import DatabaseVersions, conditional_get, get_database_versions
+from ..encoding import BINARY_CONTENT, negotiate
 
 from ...schemas.priority import params, responses
+from ...services.formats import JSON
 from ...services import PriorityService, get_priority_service
 
 
@@ -14,15 +18,23 @@ router = APIRouter(prefix=PREFIX, tags=TAGS)  # type: ignore
     name="Get Priority",
     status_code=status.HTTP_200_OK,
     responses={
-        status.HTTP_200_OK: {"model": responses.GetPriorities},
+        status.HTTP_200_OK: {"model": responses.GetPriorities, "content": BINARY_CONTENT},
         status.HTTP_404_NOT_FOUND: {},
-        status.HTTP_400_BAD_REQUEST: {}
+        status.HTTP_400_BAD_REQUEST: {},
+        status.HTTP_406_NOT_ACCEPTABLE: {}
     }
 )
 async def get_priority(
+    request: Request,
+    response: Response,
     parameters: params.GetPriorities = Depends(),
-    service: PriorityService = Depends(get_priority_service)
+    service: PriorityService = Depends(get_priority_service),
+    versions: DatabaseVersions = Depends(get_database_versions)
 ):
+    media_type = negotiate(request)
+    headers = await conditional_get(request, response, versions, ETAG_TABLES, parameters, media_type)
+    if JSON_PASSTHROUGH or media_type != JSON:
+        return Response(await service.encode_priorities(media_type), media_type=media_type, headers=headers)
     return await service.get_priorities(parameters)
 
 
@@ -33,7 +45,8 @@ async def get_priority(
     responses={
         status.HTTP_201_CREATED: {"model": responses.Priority},
         status.HTTP_404_NOT_FOUND: {},
-        status.HTTP_400_BAD_REQUEST: {}
+        status.HTTP_400_BAD_REQUEST: {},
+        status.HTTP_409_CONFLICT: {}
     }
 )
 async def create_priority(
@@ -1,4 +1,9 @@
+import os
+
+
 PREFIX = "/priorities"
+ETAG_TABLES = ("priorities",)
+JSON_PASSTHROUGH = os.getenv("PRIORITIES_JSON_PASSTHROUGH", "0") == "1"
 
 
 class Paths:
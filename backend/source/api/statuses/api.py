@@ -1,7 +1,11 @@
-from fastapi import APIRouter, Depends, status
-from .api_settings import Paths, PREFIX
+from fastapi import APIRouter, Depends, status, Request, Response
+from .api_settings import Paths, PREFIX, ETAG_TABLES, JSON_PASSTHROUGH
+
+from ..conditional import DatabaseVersions, conditional_get, get_database_versions
+from ..encoding import BINARY_CONTENT, negotiate
 
 from ...schemas.status import params, responses
+from ...services.formats import JSON
 from ...services import StatusService, get_status_service
 
 
@@ -14,15 +18,23 @@ router = APIRouter(prefix=PREFIX, tags=TAGS)  # type: ignore
     name="Get Status",
     status_code=status.HTTP_200_OK,
     responses={
-        status.HTTP_200_OK: {"model": responses.GetStatuses},
+        status.HTTP_200_OK: {"model": responses.GetStatuses, "content": BINARY_CONTENT},
         status.HTTP_404_NOT_FOUND: {},
-        status.HTTP_400_BAD_REQUEST: {}
+        status.HTTP_400_BAD_REQUEST: {},
+        status.HTTP_406_NOT_ACCEPTABLE: {}
     }
 )
 async def get_status(
+    request: Request,
+    response: Response,
     parameters: params.GetStatuses = Depends(),
-    service: StatusService = Depends(get_status_service)
+    service: StatusService = Depends(get_status_service),
+    versions: DatabaseVersions = Depends(get_database_versions)
 ):
+    media_type = negotiate(request)
+    headers = await conditional_get(request, response, versions, ETAG_TABLES, parameters, media_type)
+    if JSON_PASSTHROUGH or media_type != JSON:
+        return Response(await service.encode_statuses(media_type), media_type=media_type, headers=headers)
     return await service.get_statuses(parameters)
 
 
@@ -33,7 +45,8 @@ async def get_status(
     responses={
         status.HTTP_201_CREATED: {"model": responses.Status},
         status.HTTP_404_NOT_FOUND: {},
-        status.HTTP_400_BAD_REQUEST: {}
+        status.HTTP_400_BAD_REQUEST: {},
+        status.HTTP_409_CONFLICT: {}
     }
 )
 async def create_status(
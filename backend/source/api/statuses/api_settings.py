@@ -1,4 +1,9 @@
+import os
+
+
 PREFIX = "/statuses"
+ETAG_TABLES = ("statuses",)
+JSON_PASSTHROUGH = os.getenv("STATUSES_JSON_PASSTHROUGH", "0") == "1"
 
 
 class Paths:
@@ -1,29 +1,195 @@
-from fastapi import APIRouter, Depends, status
-from .api_settings import Paths, PREFIX
+import io
 
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, status, Request, Response
+from fastapi.responses import StreamingResponse
+from .api_settings import Paths, PREFIX, ETAG_TABLES, BULK_MAX_ITEMS, JSON_PASSTHROUGH
+
+from ..conditional import DatabaseVersions, conditional_get, get_database_versions
+from ..encoding import BINARY_CONTENT, negotiate
+from ..users.user_manager import current_superuser
 from ...schemas.task import responses, params
-from ...services import TaskService, get_task_service
+from ...services import TaskService, get_task_service, get_task_export_service, TaskImporter, get_task_importer
+from ...services.task import EXPORT_MEDIA_TYPES
+from ...services.task_import import FORMATS
+from ...services.task_stream import TASK_STREAM_HUB
 
 
 TAGS = ["Tasks"]
 router = APIRouter(prefix=PREFIX, tags=TAGS)  # type: ignore
 
 
+def check_batch_size(size: int):
+    if size > BULK_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"At most {BULK_MAX_ITEMS} items per request",
+        )
+
+
 @router.get(
     path=Paths.GetTasks,
     name="Get Task",
     status_code=status.HTTP_200_OK,
     responses={
-        status.HTTP_200_OK: {"model": responses.GetTasks},
+        status.HTTP_200_OK: {"model": responses.GetTasks, "content": BINARY_CONTENT},
         status.HTTP_404_NOT_FOUND: {},
-        status.HTTP_400_BAD_REQUEST: {}
+        status.HTTP_400_BAD_REQUEST: {},
+        status.HTTP_406_NOT_ACCEPTABLE: {}
     }
 )
 async def get_task(
+    request: Request,
+    response: Response,
     parameters: params.GetTasks = Depends(),
+    service: TaskService = Depends(get_task_service),
+    versions: DatabaseVersions = Depends(get_database_versions)
+):
+    media_type = negotiate(request)
+    headers = await conditional_get(request, response, versions, ETAG_TABLES, parameters, media_type)
+    body = await service.encode_tasks(parameters, passthrough=JSON_PASSTHROUGH, media_type=media_type)
+    return Response(body, media_type=media_type, headers=headers)
+
+
+@router.get(
+    path=Paths.SearchTasks,
+    name="Search Tasks",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {"model": responses.SearchTasks},
+        status.HTTP_400_BAD_REQUEST: {}
+    }
+)
+async def search_tasks(
+    request: Request,
+    response: Response,
+    parameters: params.SearchTasks = Depends(),
+    service: TaskService = Depends(get_task_service),
+    versions: DatabaseVersions = Depends(get_database_versions)
+):
+    await conditional_get(request, response, versions, ETAG_TABLES, parameters)
+    return await service.search_tasks(parameters)
+
+
+@router.get(
+    path=Paths.Typeahead,
+    name="Typeahead",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {"model": responses.Typeahead},
+    }
+)
+async def typeahead(
+    request: Request,
+    response: Response,
+    parameters: params.Typeahead = Depends(),
+    service: TaskService = Depends(get_task_service),
+    versions: DatabaseVersions = Depends(get_database_versions)
+):
+    await conditional_get(request, response, versions, ETAG_TABLES, parameters)
+    return await service.typeahead(parameters)
+
+
+@router.get(
+    path=Paths.DueTasks,
+    name="Get Due Tasks",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {"model": responses.DueTasks},
+        status.HTTP_400_BAD_REQUEST: {}
+    }
+)
+async def get_due_tasks(
+    parameters: params.DueTasks = Depends(),
+    service: TaskService = Depends(get_task_service)
+):
+    # No conditional GET: what is overdue changes with the clock, not only with the tables.
+    return await service.get_due_tasks(parameters)
+
+
+@router.get(
+    path=Paths.TaskStats,
+    name="Get Task Stats",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {"model": responses.TaskStats},
+    }
+)
+async def get_task_stats(
+    parameters: params.TaskStats = Depends(),
+    service: TaskService = Depends(get_task_service)
+):
+    return await service.get_stats(parameters)
+
+
+@router.get(
+    path=Paths.CountTasks,
+    name="Count Tasks",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {"model": responses.TaskCount},
+    }
+)
+async def count_tasks(
+    parameters: params.TaskFilters = Depends(),
+    service: TaskService = Depends(get_task_service)
+):
+    return await service.count_tasks(parameters)
+
+
+@router.get(
+    path=Paths.TaskChanges,
+    name="Get Task Changes",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {"model": responses.TaskChanges},
+        status.HTTP_400_BAD_REQUEST: {}
+    }
+)
+async def get_task_changes(
+    parameters: params.GetTaskChanges = Depends(),
     service: TaskService = Depends(get_task_service)
 ):
-    return await service.get_tasks(parameters)
+    return await service.get_changes(parameters)
+
+
+@router.get(
+    path=Paths.ExportTasks,
+    name="Export Tasks",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {"content": {media_type: {} for media_type in EXPORT_MEDIA_TYPES.values()}},
+        status.HTTP_400_BAD_REQUEST: {}
+    }
+)
+async def export_tasks(
+    parameters: params.ExportTasks = Depends(),
+    service: TaskService = Depends(get_task_export_service)
+):
+    return StreamingResponse(
+        service.export_tasks(parameters),
+        media_type=EXPORT_MEDIA_TYPES[parameters.format],
+        headers={"Content-Disposition": f'attachment; filename="tasks.{parameters.format}"'},
+    )
+
+
+@router.get(
+    path=Paths.StreamTasks,
+    name="Stream Task Changes",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {"content": {"text/event-stream": {}}},
+        status.HTTP_503_SERVICE_UNAVAILABLE: {}
+    }
+)
+async def stream_tasks():
+    if TASK_STREAM_HUB.full:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Too many stream subscribers")
+
+    return StreamingResponse(
+        TASK_STREAM_HUB.events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.post(
@@ -43,6 +209,84 @@ async def create_task(
     return await service.create_task(parameters)
 
 
+@router.post(
+    path=Paths.BulkTasks,
+    name="Bulk Create Tasks",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {"model": responses.BulkResult},
+        status.HTTP_413_REQUEST_ENTITY_TOO_LARGE: {},
+        status.HTTP_400_BAD_REQUEST: {}
+    }
+)
+async def bulk_create_tasks(
+    parameters: params.BulkCreateTasks,
+    service: TaskService = Depends(get_task_service)
+):
+    check_batch_size(len(parameters.items))
+    return await service.bulk_create_tasks(parameters)
+
+
+@router.patch(
+    path=Paths.BulkTasks,
+    name="Bulk Update Tasks",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {"model": responses.BulkResult},
+        status.HTTP_413_REQUEST_ENTITY_TOO_LARGE: {},
+        status.HTTP_400_BAD_REQUEST: {}
+    }
+)
+async def bulk_update_tasks(
+    parameters: params.BulkUpdateTasks,
+    service: TaskService = Depends(get_task_service)
+):
+    check_batch_size(len(parameters.items))
+    return await service.bulk_update_tasks(parameters)
+
+
+@router.delete(
+    path=Paths.BulkTasks,
+    name="Bulk Delete Tasks",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {"model": responses.BulkResult},
+        status.HTTP_413_REQUEST_ENTITY_TOO_LARGE: {},
+        status.HTTP_400_BAD_REQUEST: {}
+    }
+)
+async def bulk_delete_tasks(
+    parameters: params.BulkDeleteTasks,
+    service: TaskService = Depends(get_task_service)
+):
+    check_batch_size(len(parameters.task_ids))
+    return await service.bulk_delete_tasks(parameters)
+
+
+@router.post(
+    path=Paths.ImportTasks,
+    name="Import Tasks",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(current_superuser)],
+    responses={
+        status.HTTP_200_OK: {"model": responses.ImportResult},
+        status.HTTP_400_BAD_REQUEST: {}
+    }
+)
+async def import_tasks(
+    file: UploadFile,
+    format: str | None = None,
+    importer: TaskImporter = Depends(get_task_importer)
+):
+    if format is None:
+        format = "csv" if (file.filename or "").endswith(".csv") else "ndjson"
+    if format not in FORMATS:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Unsupported format {format!r}")
+
+    stream = io.TextIOWrapper(file.file, encoding="utf-8", newline="")
+    return await importer.import_stream(stream, format)
+
+
 @router.delete(
     path=Paths.DeleteTask,
     name="Delete Task",
@@ -1,4 +1,10 @@
+import os
+
+
 PREFIX = "/tasks"
+ETAG_TABLES = ("tasks", "labels", "statuses", "priorities")
+BULK_MAX_ITEMS = int(os.getenv("TASKS_BULK_MAX_ITEMS", 1000))
+JSON_PASSTHROUGH = os.getenv("TASKS_JSON_PASSTHROUGH", "0") == "1"
 
 
 class Paths:
@@ -6,4 +12,14 @@ class Paths:
     DeleteTask = "/{task_id}"
     UpdateTask = "/{task_id}"
     GetTasks = "/get"
+    BulkTasks = "/bulk"
+    ImportTasks = "/import"
+    ExportTasks = "/export"
+    StreamTasks = "/stream"
+    TaskChanges = "/changes"
+    SearchTasks = "/search"
+    Typeahead = "/typeahead"
+    TaskStats = "/stats"
+    CountTasks = "/count"
+    DueTasks = "/due"
 
@@ -0,0 +1,30 @@
+import argparse
+import asyncio
+import logging
+import os
+
+from datetime import datetime, timedelta
+
+from .db.dbase import SESSION_MAKER
+from .db.repositories import TaskRepository
+
+
+TOMBSTONE_RETENTION_DAYS = float(os.getenv("TASKS_TOMBSTONE_RETENTION_DAYS", 30))
+
+
+async def run(retention_days: float):
+    async with SESSION_MAKER() as session:
+        removed = await TaskRepository(session).compact_tombstones(datetime.now() - timedelta(days=retention_days))
+
+    logging.info(f"removed {removed} task tombstones older than {retention_days:g} days")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Drop old task tombstones; clients synced before them must reload everything"
+    )
+    parser.add_argument("--retention-days", type=float, default=TOMBSTONE_RETENTION_DAYS)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(run(args.retention_days))
@@ -0,0 +1,159 @@
+import json
+import logging
+import os
+import uuid
+
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+
+CHANGES = "changes"
+
+NOTIFY_CHANNEL = os.getenv("CHANGES_CHANNEL", "table_changes")
+NOTIFY_ENABLED = os.getenv("CHANGES_NOTIFY", "1") == "1"
+# Postgres rejects NOTIFY payloads of 8000 bytes or more.
+NOTIFY_MAX_PAYLOAD = 7900
+ORIGIN = uuid.uuid4().hex
+# Read by the notify triggers, so a write announces itself without an extra statement.
+SERVER_SETTINGS = {"changes.origin": ORIGIN, **({"changes.channel": NOTIFY_CHANNEL} if NOTIFY_ENABLED else {})}
+
+INSERT = "insert"
+UPDATE = "update"
+DELETE = "delete"
+
+
+# Statement-level triggers NOTIFY the changed ids; Postgres delivers them only once the transaction
+# commits, so other workers never see rolled back changes. Trigger arguments name the columns sent as
+# values. A statement touching too many rows to list is sent without ids, which receivers treat as
+# touching the whole table.
+NOTIFY_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION notify_changes() RETURNS trigger LANGUAGE plpgsql AS $$
+DECLARE
+    channel text := current_setting('changes.channel', true);
+    ids jsonb;
+    vals jsonb := '[]';
+    payload text;
+BEGIN
+    IF coalesce(channel, '') = '' THEN
+        RETURN NULL;
+    END IF;
+
+    IF TG_OP = 'DELETE' THEN
+        SELECT jsonb_agg(id ORDER BY id) INTO ids FROM old_rows;
+    ELSE
+        SELECT jsonb_agg(id ORDER BY id) INTO ids FROM new_rows;
+    END IF;
+    IF ids IS NULL THEN
+        RETURN NULL;
+    END IF;
+
+    IF octet_length(ids::text) > {NOTIFY_MAX_PAYLOAD} THEN
+        ids := '[]';
+    ELSIF TG_NARGS > 0 AND TG_OP = 'INSERT' THEN
+        SELECT jsonb_agg(DISTINCT v) INTO vals FROM (
+            SELECT (SELECT jsonb_object_agg(k, to_jsonb(n) -> k) FROM unnest(TG_ARGV) k) AS v FROM new_rows n
+        ) s;
+    ELSIF TG_NARGS > 0 AND TG_OP = 'UPDATE' THEN
+        -- Only rows moved to other values, as repositories record them.
+        SELECT coalesce(jsonb_agg(DISTINCT v), '[]') INTO vals FROM (
+            SELECT (SELECT jsonb_object_agg(k, to_jsonb(n) -> k) FROM unnest(TG_ARGV) k) AS v,
+                   (SELECT jsonb_object_agg(k, to_jsonb(o) -> k) FROM unnest(TG_ARGV) k) AS w
+            FROM new_rows n JOIN old_rows o USING (id)
+        ) s WHERE v IS DISTINCT FROM w;
+    END IF;
+
+    LOOP
+        payload := jsonb_build_object(
+            'origin', current_setting('changes.origin', true),
+            'changes', jsonb_build_array(jsonb_build_object(
+                'table', TG_TABLE_NAME, 'op', lower(TG_OP), 'ids', ids, 'values', vals
+            ))
+        )::text;
+        EXIT WHEN octet_length(payload) <= {NOTIFY_MAX_PAYLOAD} OR ids = '[]';
+        ids := '[]';
+        vals := '[]';
+    END LOOP;
+    PERFORM pg_notify(channel, payload);
+    RETURN NULL;
+END
+$$
+"""
+
+
+def notify_triggers(table: str, *columns: str) -> list[str]:
+    arguments = ", ".join(f"'{column}'" for column in columns)
+    function = f"FOR EACH STATEMENT EXECUTE FUNCTION notify_changes({arguments})"
+    return [
+        f"CREATE TRIGGER {table}_notify_insert AFTER INSERT ON {table} "
+        f"REFERENCING NEW TABLE AS new_rows {function}",
+        f"CREATE TRIGGER {table}_notify_update AFTER UPDATE ON {table} "
+        f"REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows {function}",
+        f"CREATE TRIGGER {table}_notify_delete AFTER DELETE ON {table} "
+        f"REFERENCING OLD TABLE AS old_rows {function}",
+    ]
+
+
+@dataclass(frozen=True)
+class Change:
+    table: str
+    op: str
+    ids: tuple[int, ...] = ()
+    values: tuple[dict[str, Any], ...] = ()
+
+
+Subscriber = Callable[[list[Change]], None]
+
+_subscribers: list[Subscriber] = []
+
+
+def subscribe(subscriber: Subscriber) -> Subscriber:
+    _subscribers.append(subscriber)
+    return subscriber
+
+
+def unsubscribe(subscriber: Subscriber):
+    if subscriber in _subscribers:
+        _subscribers.remove(subscriber)
+
+
+def record_change(
+    session: AsyncSession | Session,
+    table: str,
+    op: str,
+    ids: Iterable[int] = (),
+    values: Iterable[dict[str, Any]] = (),
+):
+    session.info.setdefault(CHANGES, []).append(Change(table, op, tuple(ids), tuple(values)))
+
+
+def publish(changes: list[Change]):
+    for subscriber in list(_subscribers):
+        try:
+            subscriber(changes)
+        except Exception as e:
+            logging.error(f"Change subscriber failed: {e}")
+
+
+def decode_changes(payload: str) -> tuple[str, list[Change]]:
+    data = json.loads(payload)
+    changes = [
+        Change(item["table"], item["op"], tuple(item["ids"]), tuple(item["values"]))
+        for item in data["changes"]
+    ]
+    return data["origin"], changes
+
+
+@event.listens_for(Session, "after_commit")
+def _after_commit(session: Session):
+    changes = session.info.pop(CHANGES, None)
+    if changes:
+        publish(changes)
+
+
+@event.listens_for(Session, "after_rollback")
+def _after_rollback(session: Session):
+    session.info.pop(CHANGES, None)
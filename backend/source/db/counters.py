@@ -0,0 +1,46 @@
+# Statement-level triggers keep task_counters in step with tasks inside the writing transaction.
+# Deltas are applied in key order so concurrent multi-key statements lock counter rows consistently.
+
+KEY = "status_id, priority_id, label_id"
+
+APPLY_DELTAS = f"""        INSERT INTO task_counters AS c ({KEY}, count)
+        SELECT {KEY}, sum(delta) FROM changes
+        GROUP BY {KEY}
+        HAVING sum(delta) <> 0
+        ORDER BY {KEY}
+        ON CONFLICT ({KEY}) DO UPDATE SET count = c.count + excluded.count;"""
+
+COUNTER_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION task_counters_apply() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'TRUNCATE' THEN
+        DELETE FROM task_counters;
+    ELSIF TG_OP = 'INSERT' THEN
+        WITH changes AS (SELECT {KEY}, 1 AS delta FROM new_rows)
+{APPLY_DELTAS}
+    ELSIF TG_OP = 'DELETE' THEN
+        WITH changes AS (SELECT {KEY}, -1 AS delta FROM old_rows)
+{APPLY_DELTAS}
+    ELSE
+        WITH changes AS (
+            SELECT {KEY}, 1 AS delta FROM new_rows
+            UNION ALL
+            SELECT {KEY}, -1 AS delta FROM old_rows
+        )
+{APPLY_DELTAS}
+    END IF;
+    RETURN NULL;
+END
+$$
+"""
+
+COUNTER_TRIGGERS = [
+    "CREATE TRIGGER task_counters_insert AFTER INSERT ON tasks "
+    "REFERENCING NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION task_counters_apply()",
+    "CREATE TRIGGER task_counters_update AFTER UPDATE ON tasks "
+    "REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION task_counters_apply()",
+    "CREATE TRIGGER task_counters_delete AFTER DELETE ON tasks "
+    "REFERENCING OLD TABLE AS old_rows FOR EACH STATEMENT EXECUTE FUNCTION task_counters_apply()",
+    "CREATE TRIGGER task_counters_truncate AFTER TRUNCATE ON tasks "
+    "FOR EACH STATEMENT EXECUTE FUNCTION task_counters_apply()",
+]
@@ -0,0 +1,69 @@
+"""task indexes
+
+Revision ID: 4b8d2f6a91c3
+Revises: ce75e2a132eb
+Create Date: 2026-10-17 10:12:41.508223
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4b8d2f6a91c3'
+down_revision: Union[str, None] = 'ce75e2a132eb'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+REFERENCES = {
+    'labels': 'label_id',
+    'statuses': 'status_id',
+    'priorities': 'priority_id',
+}
+
+TASK_INDEXES = {
+    'ix_tasks_status_id': ['status_id', 'id'],
+    'ix_tasks_priority_id': ['priority_id', 'id'],
+    'ix_tasks_label_id': ['label_id', 'id'],
+    'ix_tasks_status_id_priority_id': ['status_id', 'priority_id', 'id'],
+    'ix_tasks_label_id_status_id': ['label_id', 'status_id', 'id'],
+    'ix_tasks_created_at': ['created_at', 'id'],
+}
+
+
+def upgrade() -> None:
+    # Names become unique: repoint tasks at the oldest row of each duplicate name, then drop the rest.
+    for table, column in REFERENCES.items():
+        op.execute(
+            f"WITH ranked AS (SELECT id, min(id) OVER (PARTITION BY name) AS keep_id FROM {table}) "
+            f"UPDATE tasks SET {column} = ranked.keep_id FROM ranked "
+            f"WHERE tasks.{column} = ranked.id AND ranked.id <> ranked.keep_id"
+        )
+        op.execute(f"DELETE FROM {table} t USING {table} k WHERE t.name = k.name AND t.id > k.id")
+        op.drop_index(f'ix_{table}_id', table_name=table)
+        op.create_index(f'ix_{table}_name', table, ['name'], unique=True)
+
+    op.drop_index('ix_tasks_id', table_name='tasks')
+
+    # Built concurrently so an existing tasks table stays writable while indexing.
+    with op.get_context().autocommit_block():
+        for name, columns in TASK_INDEXES.items():
+            op.create_index(name, 'tasks', columns, unique=False, postgresql_concurrently=True)
+        op.create_index(
+            'ix_tasks_deadline', 'tasks', ['deadline', 'id'], unique=False,
+            postgresql_where=sa.text('deadline IS NOT NULL'), postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tasks_deadline', table_name='tasks')
+    for name in reversed(TASK_INDEXES):
+        op.drop_index(name, table_name='tasks')
+    op.create_index('ix_tasks_id', 'tasks', ['id'], unique=False)
+
+    for table in REFERENCES:
+        op.drop_index(f'ix_{table}_name', table_name=table)
+        op.create_index(f'ix_{table}_id', table, ['id'], unique=False)
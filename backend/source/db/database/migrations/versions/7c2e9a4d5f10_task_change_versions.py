@@ -0,0 +1,56 @@
+"""task change versions
+
+Revision ID: 7c2e9a4d5f10
+Revises: 4b8d2f6a91c3
+Create Date: 2026-10-17 14:03:12.118902
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c2e9a4d5f10'
+down_revision: Union[str, None] = '4b8d2f6a91c3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+CHANGE_VERSION = sa.text('pg_current_xact_id()::text::bigint')
+
+
+def upgrade() -> None:
+    # A constant default keeps the ALTER metadata-only; existing rows predate every client version.
+    op.add_column('tasks', sa.Column('version', sa.BigInteger(), nullable=False, server_default='0'))
+    op.alter_column('tasks', 'version', server_default=CHANGE_VERSION)
+
+    op.create_table(
+        'task_tombstones',
+        sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('version', sa.BigInteger(), server_default=CHANGE_VERSION, nullable=False),
+        sa.Column('deleted_at', sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_task_tombstones_version', 'task_tombstones', ['version', 'id'], unique=False)
+
+    op.create_table(
+        'sync_horizons',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.Text(), nullable=False),
+        sa.Column('version', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('name'),
+    )
+
+    with op.get_context().autocommit_block():
+        op.create_index('ix_tasks_version', 'tasks', ['version', 'id'], unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tasks_version', table_name='tasks')
+    op.drop_table('sync_horizons')
+    op.drop_index('ix_task_tombstones_version', table_name='task_tombstones')
+    op.drop_table('task_tombstones')
+    op.drop_column('tasks', 'version')
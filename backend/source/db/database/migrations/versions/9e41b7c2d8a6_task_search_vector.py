@@ -0,0 +1,40 @@
+"""task search vector
+
+Revision ID: 9e41b7c2d8a6
+Revises: 7c2e9a4d5f10
+Create Date: 2026-10-17 15:21:47.902315
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9e41b7c2d8a6'
+down_revision: Union[str, None] = '7c2e9a4d5f10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # A stored generated column rewrites tasks once; run it in a maintenance window on large tables.
+    op.add_column('tasks', sa.Column(
+        'search_vector',
+        postgresql.TSVECTOR(),
+        sa.Computed("to_tsvector('english', description)", persisted=True),
+        nullable=True,
+    ))
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tasks_search_vector', 'tasks', ['search_vector'], unique=False,
+            postgresql_using='gin', postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tasks_search_vector', table_name='tasks')
+    op.drop_column('tasks', 'search_vector')
@@ -0,0 +1,101 @@
+"""change notify triggers
+
+Revision ID: a6d3e8f15b92
+Revises: f2b7d9e04c13
+Create Date: 2026-10-18 14:20:05.318442
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6d3e8f15b92'
+down_revision: Union[str, None] = 'f2b7d9e04c13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+NOTIFY_FUNCTION = """
+CREATE OR REPLACE FUNCTION notify_changes() RETURNS trigger LANGUAGE plpgsql AS $$
+DECLARE
+    channel text := current_setting('changes.channel', true);
+    ids jsonb;
+    vals jsonb := '[]';
+    payload text;
+BEGIN
+    IF coalesce(channel, '') = '' THEN
+        RETURN NULL;
+    END IF;
+
+    IF TG_OP = 'DELETE' THEN
+        SELECT jsonb_agg(id ORDER BY id) INTO ids FROM old_rows;
+    ELSE
+        SELECT jsonb_agg(id ORDER BY id) INTO ids FROM new_rows;
+    END IF;
+    IF ids IS NULL THEN
+        RETURN NULL;
+    END IF;
+
+    IF octet_length(ids::text) > 7900 THEN
+        ids := '[]';
+    ELSIF TG_NARGS > 0 AND TG_OP = 'INSERT' THEN
+        SELECT jsonb_agg(DISTINCT v) INTO vals FROM (
+            SELECT (SELECT jsonb_object_agg(k, to_jsonb(n) -> k) FROM unnest(TG_ARGV) k) AS v FROM new_rows n
+        ) s;
+    ELSIF TG_NARGS > 0 AND TG_OP = 'UPDATE' THEN
+        -- Only rows moved to other values, as repositories record them.
+        SELECT coalesce(jsonb_agg(DISTINCT v), '[]') INTO vals FROM (
+            SELECT (SELECT jsonb_object_agg(k, to_jsonb(n) -> k) FROM unnest(TG_ARGV) k) AS v,
+                   (SELECT jsonb_object_agg(k, to_jsonb(o) -> k) FROM unnest(TG_ARGV) k) AS w
+            FROM new_rows n JOIN old_rows o USING (id)
+        ) s WHERE v IS DISTINCT FROM w;
+    END IF;
+
+    LOOP
+        payload := jsonb_build_object(
+            'origin', current_setting('changes.origin', true),
+            'changes', jsonb_build_array(jsonb_build_object(
+                'table', TG_TABLE_NAME, 'op', lower(TG_OP), 'ids', ids, 'values', vals
+            ))
+        )::text;
+        EXIT WHEN octet_length(payload) <= 7900 OR ids = '[]';
+        ids := '[]';
+        vals := '[]';
+    END LOOP;
+    PERFORM pg_notify(channel, payload);
+    RETURN NULL;
+END
+$$
+"""
+
+NOTIFY_TABLES = {
+    'tasks': "'label_id', 'status_id', 'priority_id'",
+    'labels': '',
+    'statuses': '',
+    'priorities': '',
+}
+
+NOTIFY_EVENTS = {
+    'insert': 'AFTER INSERT ON {table} REFERENCING NEW TABLE AS new_rows',
+    'update': 'AFTER UPDATE ON {table} REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows',
+    'delete': 'AFTER DELETE ON {table} REFERENCING OLD TABLE AS old_rows',
+}
+
+
+def upgrade() -> None:
+    op.execute(NOTIFY_FUNCTION)
+    for table, arguments in NOTIFY_TABLES.items():
+        for name, event in NOTIFY_EVENTS.items():
+            op.execute(
+                f'CREATE TRIGGER {table}_notify_{name} {event.format(table=table)} '
+                f'FOR EACH STATEMENT EXECUTE FUNCTION notify_changes({arguments})'
+            )
+
+
+def downgrade() -> None:
+    for table in NOTIFY_TABLES:
+        for name in NOTIFY_EVENTS:
+            op.execute(f'DROP TRIGGER IF EXISTS {table}_notify_{name} ON {table}')
+    op.execute('DROP FUNCTION IF EXISTS notify_changes()')
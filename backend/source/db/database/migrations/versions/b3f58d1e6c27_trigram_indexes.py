@@ -0,0 +1,41 @@
+"""trigram indexes
+
+Revision ID: b3f58d1e6c27
+Revises: 9e41b7c2d8a6
+Create Date: 2026-10-17 16:40:05.377120
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3f58d1e6c27'
+down_revision: Union[str, None] = '9e41b7c2d8a6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TRIGRAM_INDEXES = {
+    'ix_tasks_description_trgm': ('tasks', 'description'),
+    'ix_labels_name_trgm': ('labels', 'name'),
+    'ix_statuses_name_trgm': ('statuses', 'name'),
+    'ix_priorities_name_trgm': ('priorities', 'name'),
+}
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    with op.get_context().autocommit_block():
+        for name, (table, column) in TRIGRAM_INDEXES.items():
+            op.create_index(
+                name, table, [column], unique=False, postgresql_using='gin',
+                postgresql_ops={column: 'gin_trgm_ops'}, postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    for name, (table, _) in TRIGRAM_INDEXES.items():
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,42 @@
+"""task tombstone trigger
+
+Revision ID: c4f1a7e93d58
+Revises: a6d3e8f15b92
+Create Date: 2026-10-18 15:02:41.906127
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4f1a7e93d58'
+down_revision: Union[str, None] = 'a6d3e8f15b92'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TOMBSTONE_FUNCTION = """
+CREATE OR REPLACE FUNCTION task_tombstones_bury() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    INSERT INTO task_tombstones (id)
+    SELECT id FROM old_rows ORDER BY id
+    ON CONFLICT (id) DO UPDATE SET version = excluded.version, deleted_at = excluded.deleted_at;
+    RETURN NULL;
+END
+$$
+"""
+
+
+def upgrade() -> None:
+    op.execute(TOMBSTONE_FUNCTION)
+    op.execute(
+        'CREATE TRIGGER task_tombstones_delete AFTER DELETE ON tasks '
+        'REFERENCING OLD TABLE AS old_rows FOR EACH STATEMENT EXECUTE FUNCTION task_tombstones_bury()'
+    )
+
+
+def downgrade() -> None:
+    op.execute('DROP TRIGGER IF EXISTS task_tombstones_delete ON tasks')
+    op.execute('DROP FUNCTION IF EXISTS task_tombstones_bury()')
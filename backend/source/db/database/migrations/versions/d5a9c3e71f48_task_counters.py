@@ -0,0 +1,93 @@
+"""task counters
+
+Revision ID: d5a9c3e71f48
+Revises: b3f58d1e6c27
+Create Date: 2026-10-17 18:12:47.530614
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5a9c3e71f48'
+down_revision: Union[str, None] = 'b3f58d1e6c27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+KEY = 'status_id, priority_id, label_id'
+
+APPLY_DELTAS = f"""        INSERT INTO task_counters AS c ({KEY}, count)
+        SELECT {KEY}, sum(delta) FROM changes
+        GROUP BY {KEY}
+        HAVING sum(delta) <> 0
+        ORDER BY {KEY}
+        ON CONFLICT ({KEY}) DO UPDATE SET count = c.count + excluded.count;"""
+
+COUNTER_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION task_counters_apply() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'TRUNCATE' THEN
+        DELETE FROM task_counters;
+    ELSIF TG_OP = 'INSERT' THEN
+        WITH changes AS (SELECT {KEY}, 1 AS delta FROM new_rows)
+{APPLY_DELTAS}
+    ELSIF TG_OP = 'DELETE' THEN
+        WITH changes AS (SELECT {KEY}, -1 AS delta FROM old_rows)
+{APPLY_DELTAS}
+    ELSE
+        WITH changes AS (
+            SELECT {KEY}, 1 AS delta FROM new_rows
+            UNION ALL
+            SELECT {KEY}, -1 AS delta FROM old_rows
+        )
+{APPLY_DELTAS}
+    END IF;
+    RETURN NULL;
+END
+$$
+"""
+
+COUNTER_TRIGGERS = {
+    'task_counters_insert': 'AFTER INSERT ON tasks REFERENCING NEW TABLE AS new_rows',
+    'task_counters_update': 'AFTER UPDATE ON tasks REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows',
+    'task_counters_delete': 'AFTER DELETE ON tasks REFERENCING OLD TABLE AS old_rows',
+    'task_counters_truncate': 'AFTER TRUNCATE ON tasks',
+}
+
+
+def upgrade() -> None:
+    op.create_table(
+        'task_counters',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('status_id', sa.Integer(), nullable=True),
+        sa.Column('priority_id', sa.Integer(), nullable=True),
+        sa.Column('label_id', sa.Integer(), nullable=True),
+        sa.Column('count', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(
+        'ix_task_counters_key', 'task_counters', ['status_id', 'priority_id', 'label_id'],
+        unique=True, postgresql_nulls_not_distinct=True,
+    )
+
+    # Block writers until the triggers exist, so no task is counted twice or missed by the backfill.
+    op.execute('LOCK TABLE tasks IN SHARE MODE')
+    op.execute(COUNTER_FUNCTION)
+    for name, event in COUNTER_TRIGGERS.items():
+        op.execute(f'CREATE TRIGGER {name} {event} FOR EACH STATEMENT EXECUTE FUNCTION task_counters_apply()')
+    op.execute(
+        f'INSERT INTO task_counters ({KEY}, count) '
+        f'SELECT {KEY}, count(*) FROM tasks GROUP BY {KEY}'
+    )
+
+
+def downgrade() -> None:
+    for name in COUNTER_TRIGGERS:
+        op.execute(f'DROP TRIGGER IF EXISTS {name} ON tasks')
+    op.execute('DROP FUNCTION IF EXISTS task_counters_apply()')
+    op.drop_index('ix_task_counters_key', table_name='task_counters')
+    op.drop_table('task_counters')
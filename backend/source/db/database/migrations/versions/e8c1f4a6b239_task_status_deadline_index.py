@@ -0,0 +1,30 @@
+"""task status deadline index
+
+Revision ID: e8c1f4a6b239
+Revises: d5a9c3e71f48
+Create Date: 2026-10-17 19:05:31.842276
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8c1f4a6b239'
+down_revision: Union[str, None] = 'd5a9c3e71f48'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tasks_status_id_deadline', 'tasks', ['status_id', 'deadline', 'id'], unique=False,
+            postgresql_where=sa.text('deadline IS NOT NULL'), postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tasks_status_id_deadline', table_name='tasks')
@@ -0,0 +1,35 @@
+"""task reminders
+
+Revision ID: f2b7d9e04c13
+Revises: e8c1f4a6b239
+Create Date: 2026-10-17 20:21:09.614583
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2b7d9e04c13'
+down_revision: Union[str, None] = 'e8c1f4a6b239'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('tasks', sa.Column('reminder_sent_at', sa.DateTime(), nullable=True))
+
+    # Only tasks still waiting for a reminder are indexed, so the scan stays small as sent ones pile up.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tasks_reminder_due', 'tasks', ['deadline', 'id'], unique=False,
+            postgresql_where=sa.text('deadline IS NOT NULL AND reminder_sent_at IS NULL'),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tasks_reminder_due', table_name='tasks')
+    op.drop_column('tasks', 'reminder_sent_at')
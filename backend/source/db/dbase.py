@@ -1,11 +1,12 @@
 from pydantic import PostgresDsn
-from typing import AsyncIterator, no_type_check
+from typing import Any, AsyncIterator, no_type_check
 
 from sqlalchemy.orm import declarative_base
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
+from .changes import SERVER_SETTINGS
 from .settings import get_db_settings
+from .pool import InstrumentedQueuePool
 
 
 Base = declarative_base()
@@ -24,10 +25,27 @@ DATABASE_URL = PostgresDsn.build(  # type: ignore
     path=DB_SETTINGS.db_name,
 )
 
-ENGINE = create_async_engine(url=str(DATABASE_URL), 
-                             pool_pre_ping=True,
+ENGINE = create_async_engine(url=str(DATABASE_URL),
+                             poolclass=InstrumentedQueuePool,
+                             pool_size=DB_SETTINGS.pool_size,
+                             max_overflow=DB_SETTINGS.max_overflow,
+                             pool_timeout=DB_SETTINGS.pool_timeout,
+                             pool_recycle=DB_SETTINGS.pool_recycle,
+                             pool_pre_ping=DB_SETTINGS.pool_pre_ping,
+                             connect_args={
+                                 "statement_cache_size": DB_SETTINGS.statement_cache_size,
+                                 "server_settings": SERVER_SETTINGS,
+                             },
                              future=True)
 
+SESSION_MAKER = async_sessionmaker(
+    bind=ENGINE,
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+
+UNIT_OF_WORK = "unit_of_work"
+
 
 async def init_db():
     async with ENGINE.begin() as connection:
@@ -36,15 +54,26 @@ async def init_db():
 
 @no_type_check
 async def get_session() -> AsyncIterator[AsyncSession]:
-    async_session = sessionmaker(
-        bind=ENGINE,
-        class_=AsyncSession,
-        expire_on_commit=False,
-    )
-    async with async_session() as session:
+    async with SESSION_MAKER() as session:
         yield session
 
 
+@no_type_check
+async def get_unit_of_work() -> AsyncIterator[AsyncSession]:
+    async with SESSION_MAKER() as session:
+        session.info[UNIT_OF_WORK] = True
+        try:
+            yield session
+        except Exception:
+            await session.rollback()
+            raise
+        await session.commit()
+
+
+def get_pool_stats() -> dict[str, Any]:
+    return ENGINE.pool.stats()  # type: ignore
+
+
 async def create_db_and_tables():
     async with ENGINE.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
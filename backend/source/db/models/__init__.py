@@ -1,5 +1,5 @@
 from .label import Label
 from .priority import Priority
-from .task import Task
+from .task import Task, TaskCounter, TaskTombstone, SyncHorizon
 from .status import Status
 from .user import User
@@ -1,8 +1,15 @@
+from ..changes import NOTIFY_FUNCTION
 from ..dbase import Base as DBBase
+from sqlalchemy import DDL, event
 from sqlalchemy.orm import Mapped, mapped_column
 
 
+# Trigram indexes need the extension before create_all builds them.
+event.listen(DBBase.metadata, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+event.listen(DBBase.metadata, "before_create", DDL(NOTIFY_FUNCTION))
+
+
 class Base(DBBase):
     __abstract__ = True
-    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(primary_key=True)
 
@@ -1,8 +1,18 @@
 from .base import Base
-from sqlalchemy import String
+from sqlalchemy import DDL, Index, String, event
 from sqlalchemy.orm import Mapped, mapped_column
 
+from ..changes import notify_triggers
+
 
 class Priority(Base):
     __tablename__ = "priorities"
+    __table_args__ = (
+        Index("ix_priorities_name", "name", unique=True),
+        Index("ix_priorities_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+    )
     name: Mapped[str] = mapped_column(String(length=260))
+
+
+for trigger in notify_triggers(Priority.__tablename__):
+    event.listen(Priority.__table__, "after_create", DDL(trigger))
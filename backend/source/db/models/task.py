@@ -1,11 +1,48 @@
 from .base import Base
 from datetime import datetime
-from sqlalchemy import ForeignKey, DateTime, Text
+from typing import Any
+from sqlalchemy import DDL, BigInteger, Computed, ForeignKey, DateTime, Index, Text, event, func, literal_column, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column
 
+from ..changes import notify_triggers
+from ..counters import COUNTER_FUNCTION, COUNTER_TRIGGERS
+from ..tombstones import TOMBSTONE_FUNCTION, TOMBSTONE_TRIGGER
+
+
+# Id of the writing transaction. Unlike a sequence value it lets readers tell which writes
+# may still be in flight: everything below the snapshot xmin is committed or rolled back.
+CHANGE_VERSION = text("pg_current_xact_id()::text::bigint")
+SAFE_VERSION = literal_column("pg_snapshot_xmin(pg_current_snapshot())::text::bigint", BigInteger())
+
+SEARCH_CONFIG = "english"
+
 
 class Task(Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        Index("ix_tasks_status_id", "status_id", "id"),
+        Index("ix_tasks_priority_id", "priority_id", "id"),
+        Index("ix_tasks_label_id", "label_id", "id"),
+        Index("ix_tasks_status_id_priority_id", "status_id", "priority_id", "id"),
+        Index("ix_tasks_label_id_status_id", "label_id", "status_id", "id"),
+        Index("ix_tasks_created_at", "created_at", "id"),
+        Index("ix_tasks_deadline", "deadline", "id", postgresql_where=text("deadline IS NOT NULL")),
+        Index(
+            "ix_tasks_status_id_deadline", "status_id", "deadline", "id",
+            postgresql_where=text("deadline IS NOT NULL"),
+        ),
+        Index(
+            "ix_tasks_reminder_due", "deadline", "id",
+            postgresql_where=text("deadline IS NOT NULL AND reminder_sent_at IS NULL"),
+        ),
+        Index("ix_tasks_version", "version", "id"),
+        Index("ix_tasks_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "ix_tasks_description_trgm", "description",
+            postgresql_using="gin", postgresql_ops={"description": "gin_trgm_ops"},
+        ),
+    )
     
     status_id: Mapped[int | None] = mapped_column(ForeignKey("statuses.id"), nullable=True)
     priority_id: Mapped[int | None] = mapped_column(ForeignKey("priorities.id"), nullable=True)
@@ -13,5 +50,54 @@ class Task(Base):
     
     created_at: Mapped[datetime] = mapped_column(DateTime())
     deadline: Mapped[datetime | None] = mapped_column(DateTime(), nullable=True)
+    reminder_sent_at: Mapped[datetime | None] = mapped_column(DateTime(), nullable=True)
     
-    description: Mapped[str] = mapped_column(Text())
\ No newline at end of file
+    description: Mapped[str] = mapped_column(Text())
+
+    version: Mapped[int] = mapped_column(BigInteger(), server_default=CHANGE_VERSION, onupdate=CHANGE_VERSION)
+
+    search_vector: Mapped[Any] = mapped_column(
+        TSVECTOR(),
+        Computed(f"to_tsvector('{SEARCH_CONFIG}', description)", persisted=True),
+        nullable=True,
+        deferred=True,
+    )
+
+
+event.listen(Task.__table__, "after_create", DDL(COUNTER_FUNCTION))
+event.listen(Task.__table__, "after_create", DDL(TOMBSTONE_FUNCTION))
+for trigger in [*COUNTER_TRIGGERS, TOMBSTONE_TRIGGER, *notify_triggers(Task.__tablename__, "label_id", "status_id", "priority_id")]:
+    event.listen(Task.__table__, "after_create", DDL(trigger))
+
+
+class TaskCounter(Base):
+    __tablename__ = "task_counters"
+    __table_args__ = (
+        Index(
+            "ix_task_counters_key", "status_id", "priority_id", "label_id",
+            unique=True, postgresql_nulls_not_distinct=True,
+        ),
+    )
+
+    status_id: Mapped[int | None] = mapped_column(nullable=True)
+    priority_id: Mapped[int | None] = mapped_column(nullable=True)
+    label_id: Mapped[int | None] = mapped_column(nullable=True)
+    count: Mapped[int] = mapped_column(BigInteger(), default=0)
+
+
+class TaskTombstone(Base):
+    __tablename__ = "task_tombstones"
+    __table_args__ = (
+        Index("ix_task_tombstones_version", "version", "id"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=False)
+    version: Mapped[int] = mapped_column(BigInteger(), server_default=CHANGE_VERSION)
+    deleted_at: Mapped[datetime] = mapped_column(DateTime(), server_default=func.now())
+
+
+class SyncHorizon(Base):
+    __tablename__ = "sync_horizons"
+
+    name: Mapped[str] = mapped_column(Text(), unique=True)
+    version: Mapped[int] = mapped_column(BigInteger())
@@ -0,0 +1,122 @@
+import asyncio
+import logging
+import os
+
+from typing import Any, Awaitable, Callable
+
+import asyncpg
+
+from .changes import Change, NOTIFY_CHANNEL, ORIGIN, UPDATE, decode_changes, publish
+from .dbase import DB_SETTINGS, Base
+
+
+LISTEN_HEARTBEAT = float(os.getenv("CHANGES_LISTEN_HEARTBEAT", 15))
+LISTEN_BACKOFF_MIN = float(os.getenv("CHANGES_LISTEN_BACKOFF_MIN", 0.5))
+LISTEN_BACKOFF_MAX = float(os.getenv("CHANGES_LISTEN_BACKOFF_MAX", 30))
+
+Connect = Callable[[], Awaitable[Any]]
+
+
+async def _connect() -> asyncpg.Connection:
+    return await asyncpg.connect(
+        user=DB_SETTINGS.user,
+        password=DB_SETTINGS.password,
+        host=DB_SETTINGS.host,
+        port=int(DB_SETTINGS.port),
+        database=DB_SETTINGS.db_name,
+    )
+
+
+def flush_all_changes() -> list[Change]:
+    return [Change(table, UPDATE) for table in Base.metadata.tables]
+
+
+class ChangeListener:
+
+    def __init__(
+        self,
+        connect: Connect = _connect,
+        channel: str = NOTIFY_CHANNEL,
+        heartbeat: float = LISTEN_HEARTBEAT,
+        backoff_min: float = LISTEN_BACKOFF_MIN,
+        backoff_max: float = LISTEN_BACKOFF_MAX,
+    ):
+        self.connect = connect
+        self.channel = channel
+        self.heartbeat = heartbeat
+        self.backoff_min = backoff_min
+        self.backoff_max = backoff_max
+        self.connected = asyncio.Event()
+        self.reconnects = 0
+        self._task: asyncio.Task | None = None
+
+    async def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def on_notification(self, connection: Any, pid: int, channel: str, payload: str):
+        try:
+            origin, changes = decode_changes(payload)
+        except (ValueError, KeyError, TypeError) as e:
+            logging.error(f"Invalid change notification: {e}")
+            return
+
+        # Our own commits were already published locally by the session hook.
+        if origin != ORIGIN:
+            publish(changes)
+
+    async def _run(self):
+        backoff = self.backoff_min
+        gap = False
+        while True:
+            try:
+                connection = await self.connect()
+            except (OSError, asyncpg.PostgresError, asyncio.TimeoutError) as e:
+                logging.error(f"Change listener failed to connect: {e}")
+                gap = True
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, self.backoff_max)
+                continue
+
+            try:
+                closed = asyncio.Event()
+                connection.add_termination_listener(lambda _: closed.set())
+                await connection.add_listener(self.channel, self.on_notification)
+
+                if gap:
+                    # Notifications sent while we were away are lost; drop everything cached locally.
+                    self.reconnects += 1
+                    publish(flush_all_changes())
+                gap = True
+                backoff = self.backoff_min
+                self.connected.set()
+
+                await self._watch(connection, closed)
+            except (OSError, asyncpg.PostgresError, asyncpg.InterfaceError, asyncio.TimeoutError) as e:
+                logging.error(f"Change listener lost its connection: {e}")
+            finally:
+                self.connected.clear()
+                if not connection.is_closed():
+                    connection.terminate()
+
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, self.backoff_max)
+
+    async def _watch(self, connection: Any, closed: asyncio.Event):
+        while not closed.is_set():
+            try:
+                await asyncio.wait_for(closed.wait(), timeout=self.heartbeat)
+            except asyncio.TimeoutError:
+                await asyncio.wait_for(connection.execute("SELECT 1"), timeout=self.heartbeat)
+
+
+CHANGE_LISTENER = ChangeListener()
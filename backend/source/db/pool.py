@@ -0,0 +1,70 @@
+import time
+from bisect import bisect_left
+from typing import Any
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class PoolMetrics:
+
+    def __init__(self, buckets: tuple[float, ...] = WAIT_BUCKETS):
+        self.buckets = buckets
+        self.wait_counts = [0] * (len(buckets) + 1)
+        self.wait_sum = 0.0
+        self.checkouts = 0
+        self.timeouts = 0
+
+    def observe_wait(self, seconds: float):
+        self.wait_counts[bisect_left(self.buckets, seconds)] += 1
+        self.wait_sum += seconds
+        self.checkouts += 1
+
+    def observe_timeout(self):
+        self.timeouts += 1
+
+    def histogram(self) -> dict[str, int]:
+        bounds = [str(bound) for bound in self.buckets] + ["+Inf"]
+        cumulative, result = 0, {}
+        for bound, count in zip(bounds, self.wait_counts):
+            cumulative += count
+            result[bound] = cumulative
+        return result
+
+
+class InstrumentedPoolMixin:
+    """Times every checkout and counts checkout timeouts."""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()  # type: ignore
+        except exc.TimeoutError:
+            self.metrics.observe_timeout()
+            raise
+        self.metrics.observe_wait(time.perf_counter() - started)
+        return connection
+
+    def stats(self) -> dict[str, Any]:
+        pool: QueuePool = self  # type: ignore
+        return {
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "idle": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+            "checkouts": self.metrics.checkouts,
+            "checkout_timeouts": self.metrics.timeouts,
+            "wait_seconds_sum": self.metrics.wait_sum,
+            "wait_seconds_histogram": self.metrics.histogram(),
+        }
+
+
+class InstrumentedQueuePool(InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
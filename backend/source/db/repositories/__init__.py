@@ -4,3 +4,4 @@ from .task import TaskRepository
 from .status import StatusRepository
 from .user import UserRepository
 from .base import AbstractRepository
+from .postgres import is_unique_violation
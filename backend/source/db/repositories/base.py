@@ -37,6 +37,18 @@ class AbstractRepository(ABC, Generic[ModelT]):
     async def delete(self, obj: ModelT):
         raise NotImplemented()
     
+    @abstractmethod
+    async def insert_returning(self, **data: Any) -> ModelT | None:
+        raise NotImplemented()
+
+    @abstractmethod
+    async def update_by_id_returning(self, id: int, **data: Any) -> ModelT | None:
+        raise NotImplemented()
+
+    @abstractmethod
+    async def delete_by_id_returning(self, id: int) -> ModelT | None:
+        raise NotImplemented()
+    
     @abstractmethod
     async def filter(self, *where: Any, **filters: Any) -> Iterable[ModelT]:
         raise NotImplemented()
@@ -51,4 +63,8 @@ class AbstractRepository(ABC, Generic[ModelT]):
 
     @abstractmethod
     async def select_all(self) -> list[ModelT]:
+        raise NotImplemented()
+
+    @abstractmethod
+    async def select_all_json(self, *fields: str) -> str:
         raise NotImplemented()
\ No newline at end of file
@@ -5,18 +5,27 @@ from contextlib import asynccontextmanager
 
 from asyncpg import InterfaceError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, exc
+from sqlalchemy import Text, select, insert, update, delete, func, exc, cast, literal_column
+from sqlalchemy.dialects.postgresql import JSON, aggregate_order_by
 
 from .base import AbstractRepository
+from ..changes import INSERT, UPDATE, DELETE, record_change
+from ..dbase import UNIT_OF_WORK
 from ..models.base import Base
 
 
 ModelT = TypeVar("ModelT", bound=Base)
+UNIQUE_VIOLATION = "23505"
+
+
+def is_unique_violation(error: exc.IntegrityError) -> bool:
+    return getattr(error.orig, "sqlstate", None) == UNIQUE_VIOLATION
 
 
 class BaseRepository(AbstractRepository, Generic[ModelT]):
     
     MODEL: type[ModelT] = None  # type: ignore
+    CHANGE_COLUMNS: tuple[str, ...] = ()
 
     def __init__(self, session: AsyncSession):
         self.session = session
@@ -42,7 +51,9 @@ class BaseRepository(AbstractRepository, Generic[ModelT]):
         async with self._start_session():
             self.session.add(obj)
             try:
-                await self.session.commit()
+                await self.session.flush()
+                self._record_change(INSERT, [obj.id], self._change_values(obj))
+                await self._commit()
             except exc.IntegrityError as e:
                 logging.error(e)
                 await self.rollback()
@@ -53,14 +64,21 @@ class BaseRepository(AbstractRepository, Generic[ModelT]):
 
     async def rollback(self):
         await self.session.rollback()
+
+    async def _commit(self):
+        if self.session.info.get(UNIT_OF_WORK):
+            await self.session.flush()
+        else:
+            await self.session.commit()
     
     async def update(self, obj: ModelT, **kwargs: Any) -> ModelT | None:
         async with self._start_session():
             for key, value in kwargs.items():
                 setattr(obj, key, value)
+            self._record_change(UPDATE, [obj.id], self._change_values(obj, kwargs))
                 
             try:
-                await self.session.commit()
+                await self._commit()
             except exc.IntegrityError as e:
                 logging.error(e)
                 await self.rollback()
@@ -75,13 +93,56 @@ class BaseRepository(AbstractRepository, Generic[ModelT]):
         async with self._start_session():
             try:
                 await self.session.delete(obj)
-                await self.session.commit()
+                self._record_change(DELETE, [obj.id])
+                await self._commit()
                 return True
             except Exception as e:
                 logging.error(f"Delete failed for {self.model.__name__}: {e}")
                 await self.session.rollback()
                 return False
     
+    async def insert_returning(self, **data: Any) -> ModelT | None:
+        query = insert(self.model).values(**data).returning(self.model)
+        return await self._execute_returning(query, INSERT)
+
+    async def update_by_id_returning(self, id: int, **data: Any) -> ModelT | None:
+        if not data:
+            return await self.get_by_id(id)
+
+        query = (
+            update(self.model)
+            .where(self.model.id == id)
+            .values(**data)
+            .returning(self.model)
+            .execution_options(synchronize_session=False)
+        )
+        return await self._execute_returning(query, UPDATE, data)
+
+    async def delete_by_id_returning(self, id: int) -> ModelT | None:
+        query = (
+            delete(self.model)
+            .where(self.model.id == id)
+            .returning(self.model)
+            .execution_options(synchronize_session=False)
+        )
+        return await self._execute_returning(query, DELETE)
+
+    async def _execute_returning(
+        self, query: Any, op: str, columns: Iterable[str] | None = None
+    ) -> ModelT | None:
+        async with self._start_session():
+            try:
+                obj = (await self.session.execute(query)).scalar_one_or_none()
+                if obj is not None:
+                    values = self._change_values(obj, columns) if op != DELETE else []
+                    self._record_change(op, [obj.id], values)
+                await self._commit()
+            except exc.IntegrityError as e:
+                logging.error(e)
+                await self.rollback()
+                raise
+        return obj
+
     async def get_by_id(self, id: int) -> ModelT | None:
         async with self._start_session():
             return await self.filter_one(self.model.id == id)
@@ -98,6 +159,14 @@ class BaseRepository(AbstractRepository, Generic[ModelT]):
         query = self._get_query(func.count(self.model.id)).filter_by(**filters)
         return (await self.execute(query)).scalar_one()
 
+    def _record_change(self, op: str, ids: Iterable[int] = (), values: Iterable[dict[str, Any]] = ()):
+        record_change(self.session, self.model.__tablename__, op, ids, values)
+
+    def _change_values(self, obj: Any, columns: Iterable[str] | None = None) -> list[dict[str, Any]]:
+        if not self.CHANGE_COLUMNS or (columns is not None and not set(columns) & set(self.CHANGE_COLUMNS)):
+            return []
+        return [{column: getattr(obj, column) for column in self.CHANGE_COLUMNS}]
+
     def _get_query(self, select_data: Any = None):
         if select_data is None:
             select_data = self.model
@@ -116,3 +185,11 @@ class BaseRepository(AbstractRepository, Generic[ModelT]):
         models = (await self.execute(self._get_query())).scalars().all()
         return list(models)
 
+    async def select_all_json(self, *fields: str) -> str:
+        # The rows of select_all as a JSON array of {field: column} objects, assembled by Postgres.
+        table = self.model.__table__
+        item = func.json_build_object(*(part for field in fields for part in (field, table.c[field])))
+        ordered = aggregate_order_by(item, *table.primary_key.columns)
+        items = func.coalesce(func.json_agg(ordered), literal_column("'[]'::json"), type_=JSON)
+        return (await self.execute(select(cast(items, Text)))).scalar_one()
+
@@ -1,39 +1,655 @@
+import html
+import os
+import re
+
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Iterable, Sequence
+
 from .postgres import BaseRepository
-from ..models import Task, Priority, Label, Status
+from ..changes import INSERT, UPDATE, DELETE
+from ..models import Task, TaskCounter, TaskTombstone, SyncHorizon, Priority, Label, Status
+from ..models.task import SAFE_VERSION, SEARCH_CONFIG
 
 from ...schemas.task import params
 
-from sqlalchemy import select
+from sqlalchemy import (
+    Row, Select, select, insert, update, delete, values, column, cast, literal, literal_column, union_all, func, text,
+    tuple_, and_, or_, case, BigInteger, Integer, Text,
+)
+from sqlalchemy.dialects.postgresql import JSON, REAL, aggregate_order_by, insert as pg_insert
+from sqlalchemy.orm import aliased
+
+
+STREAM_BATCH_SIZE = 1000
+COPY_STAGING_TABLE = "tasks_import_staging"
+COPY_COLUMNS = ("status_id", "priority_id", "label_id", "created_at", "deadline", "description")
+HEADLINE_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxWords=35, MinWords=15, MaxFragments=2"
+SNIPPET_LENGTH = 200
+DUE_SOON = timedelta(days=7)
+TYPEAHEAD_TEXT_LENGTH = 120
+TERMINAL_STATUSES = tuple(
+    name.strip() for name in os.getenv("TASKS_TERMINAL_STATUSES", "Done").split(",") if name.strip()
+)
+SUMMARY_LENGTH = int(os.getenv("TASKS_SUMMARY_LENGTH", 50))
+# Search ranks only the newest matches, so a term found in most rows costs about as much as a rare one.
+SEARCH_CANDIDATES = int(os.getenv("TASKS_SEARCH_CANDIDATES", 2000))
+
+def json_timestamp(value: Any) -> Any:
+    # Formatted the way pydantic serialises datetimes: six fractional digits, only when non-zero.
+    return func.to_char(value, 'YYYY-MM-DD"T"HH24:MI:SS', type_=Text) + case(
+        (func.date_trunc("second", value) != value, func.to_char(value, ".US", type_=Text)),
+        else_="",
+    )
+
+
+FILTERS = {
+    "label": "label_id",
+    "status": "status_id",
+    "priority": "priority_id",
+}
+
+
+def list_fields(parameters: params.GetTasks) -> tuple[str, ...]:
+    # The fields= selection in response order; task_id always, since cursors and clients key on it.
+    if parameters.fields is None:
+        return params.LIST_FIELDS
+    wanted = set(parameters.fields.split(","))
+    return tuple(field for field in params.LIST_FIELDS if field == "task_id" or field in wanted)
 
 
 class TaskRepository(BaseRepository[Task]):
     MODEL = Task
+    REFERENCES = {
+        "label_id": Label,
+        "status_id": Status,
+        "priority_id": Priority,
+    }
+    CHANGE_COLUMNS = tuple(REFERENCES)
+
+    async def get_tasks(
+        self,
+        parameters: params.GetTasks,
+        after: int | None = None,
+        before: int | None = None,
+        filters: dict[str, int] | None = None,
+    ):
+        if filters is None:
+            filters = await self.resolve_filters(parameters)
+        if filters is None:
+            return []
+
+        result = await self.execute(self._page_query(filters, parameters, after, before))
+        return result.fetchall()
+
+    async def get_tasks_json(
+        self,
+        parameters: params.GetTasks,
+        after: int | None = None,
+        before: int | None = None,
+        filters: dict[str, int] | None = None,
+    ) -> tuple[str, bool, int | None, int | None]:
+        # The page as one JSON array built by Postgres, plus what the caller needs for cursors:
+        # whether more rows follow and the first and last id shown.
+        if filters is None:
+            filters = await self.resolve_filters(parameters)
+        if filters is None:
+            return "[]", False, None, None
+
+        order = Task.id.desc() if before is not None else Task.id
+        page = (
+            self._page_query(filters, parameters, after, before)
+            .add_columns(func.row_number().over(order_by=order).label("seq"))
+            .subquery("page")
+        )
+        shown = page.c.seq <= parameters.limit
+        item = func.json_build_object(*(
+            part for field in list_fields(parameters) for part in (field, self._json_value(page, field))
+        ))
+        items = func.coalesce(
+            func.json_agg(aggregate_order_by(item, page.c.id)).filter(shown),
+            literal_column("'[]'::json"),
+            type_=JSON,
+        )
+        query = select(
+            cast(items, Text),
+            func.count() > parameters.limit,
+            func.min(page.c.id).filter(shown),
+            func.max(page.c.id).filter(shown),
+        )
+        return tuple((await self.execute(query)).one())  # type: ignore
+
+    async def get_due_tasks(
+        self,
+        parameters: params.DueTasks,
+        after: tuple[datetime, int] | None = None,
+        filters: dict[str, int] | None = None,
+    ):
+        if filters is None:
+            filters = await self.resolve_filters(parameters)
+        if filters is None:
+            return []
+
+        at = func.localtimestamp() if parameters.mode == "overdue" or parameters.at is None else parameters.at
+        window = Task.deadline >= at if parameters.mode == "after" else Task.deadline < at
+
+        def page(*clauses: Any) -> Select:
+            query = self._tasks_query(filters).where(Task.deadline.is_not(None), window, *clauses)
+            if after is not None:
+                query = query.where(tuple_(Task.deadline, Task.id) > tuple_(*after))
+            return query.order_by(Task.deadline, Task.id).limit(parameters.limit + 1)
+
+        if not parameters.open:
+            return (await self.execute(page())).fetchall()
+
+        # A partial index cannot name terminal statuses, which are rows in another table; walk the
+        # (status_id, deadline) index once per open status instead and merge the short pages.
+        open_ids = select(Status.id).where(Status.name.not_in(TERMINAL_STATUSES))
+        if "status_id" in filters:
+            open_ids = open_ids.where(Status.id == filters["status_id"])
+        async with self._start_session():
+            statuses = list((await self.session.execute(open_ids)).scalars())
+        pages = [page(Task.status_id == id) for id in statuses]
+        if "status_id" not in filters:
+            pages.append(page(Task.status_id.is_(None)))
+        if not pages:
+            return []
+
+        merged = union_all(*pages).subquery("due")
+        query = select(merged).order_by(merged.c.deadline, merged.c.id).limit(parameters.limit + 1)
+        return (await self.execute(query)).fetchall()
+
+    async def claim_reminders(
+        self, since: datetime, until: datetime, limit: int, after: tuple[datetime, int] | None = None
+    ) -> Sequence[Row]:
+        # Row locks are held until mark_reminded commits: other schedulers skip these rows instead
+        # of waiting on them or sending the same reminders again.
+        query = self._tasks_query({}).where(
+            Task.deadline.is_not(None),
+            Task.reminder_sent_at.is_(None),
+            Task.deadline >= since,
+            Task.deadline < until,
+        )
+        if after is not None:
+            query = query.where(tuple_(Task.deadline, Task.id) > tuple_(*after))
+        query = query.order_by(Task.deadline, Task.id).limit(limit).with_for_update(of=Task, skip_locked=True)
+        return (await self.session.execute(query)).fetchall()
+
+    async def mark_reminded(self, ids: list[int]):
+        # Keeping the version leaves the change feed untouched; reminder state is not client data.
+        query = (
+            update(Task)
+            .where(Task.id.in_(ids))
+            .values(reminder_sent_at=func.localtimestamp(), version=Task.version)
+            .execution_options(synchronize_session=False)
+        )
+        await self.session.execute(query)
+        await self._commit()
+
+    async def search_tasks(
+        self,
+        parameters: params.SearchTasks,
+        after: tuple[float, int] | None = None,
+        filters: dict[str, int] | None = None,
+    ):
+        if filters is None:
+            filters = await self.resolve_filters(parameters)
+        if filters is None:
+            return []
+
+        # Ranked within the candidate rows themselves, without joining them back to tasks.
+        _, match = self._search_clauses(parameters)
+        candidates = select(*Task.__table__.c).where(match).order_by(Task.id.desc()).limit(SEARCH_CANDIDATES)
+        for column, id in filters.items():
+            candidates = candidates.where(Task.__table__.c[column] == id)
+        task = aliased(Task, candidates.subquery("candidates"))
+        rank, _ = self._search_clauses(parameters, task)
+
+        query = self._tasks_query({}, task).add_columns(rank.label("rank"))
+        if after is not None:
+            last_rank = cast(after[0], REAL)
+            query = query.where(or_(rank < last_rank, and_(rank == last_rank, task.id > after[1])))
+        page = query.order_by(rank.desc(), task.id).limit(parameters.limit + 1).subquery()
+
+        query = select(page, self._snippet(parameters, page.c.description).label("snippet"))
+        # Whether candidates come from walking ids or from the search index depends on how common the
+        # terms are, which the generic plan of a cached prepared statement cannot know.
+        settings = [func.set_config("plan_cache_mode", "force_custom_plan", True)]
+        if parameters.mode == "fuzzy":
+            settings.append(self._similarity_threshold(parameters.threshold))
+        async with self._start_session():
+            await self.session.execute(select(*settings))
+            result = await self.session.execute(query.order_by(page.c.rank.desc(), page.c.id))
+        return result.fetchall()
+
+    async def typeahead(self, q: str, limit: int, threshold: float):
+        sources = [("task", Task.id, Task.description)] + [
+            (model.__name__.lower(), model.id, model.name) for model in self.REFERENCES.values()
+        ]
+        parts = []
+        for kind, id, name in sources:
+            score = func.word_similarity(q, name)
+            parts.append(
+                select(
+                    literal(kind).label("kind"),
+                    id.label("id"),
+                    func.left(name, TYPEAHEAD_TEXT_LENGTH).label("text"),
+                    score.label("score"),
+                )
+                .where(name.bool_op("%>")(q))
+                .order_by(score.desc())
+                .limit(limit)
+            )
+        suggestions = union_all(*parts).subquery()
+        query = select(suggestions).order_by(suggestions.c.score.desc(), suggestions.c.kind, suggestions.c.id)
+
+        async with self._start_session():
+            await self._set_similarity_threshold(threshold)
+            result = await self.session.execute(query.limit(limit))
+        return result.fetchall()
+
+    async def _set_similarity_threshold(self, threshold: float):
+        await self.session.execute(select(self._similarity_threshold(threshold)))
+
+    @staticmethod
+    def _similarity_threshold(threshold: float) -> Any:
+        # The %> operator reads this setting; only through the operator can the trigram index be used.
+        return func.set_config("pg_trgm.word_similarity_threshold", str(threshold), True)
+
+    @staticmethod
+    def _search_clauses(parameters: params.SearchTasks, task: Any = Task) -> tuple[Any, Any]:
+        if parameters.mode == "fulltext":
+            tsquery = func.websearch_to_tsquery(SEARCH_CONFIG, parameters.q)
+            return func.ts_rank(task.search_vector, tsquery), task.search_vector.bool_op("@@")(tsquery)
+
+        similarity = func.word_similarity(parameters.q, task.description)
+        if parameters.mode == "contains":
+            pattern = re.sub(r"([\\%_])", r"\\\1", parameters.q)
+            return similarity, task.description.ilike(f"%{pattern}%", escape="\\")
+        return similarity, task.description.bool_op("%>")(parameters.q)
+
+    @staticmethod
+    def _snippet(parameters: params.SearchTasks, description: Any) -> Any:
+        # Escaped before highlighting so the markup is safe to render.
+        escaped = func.replace(func.replace(func.replace(description, "&", "&amp;"), "<", "&lt;"), ">", "&gt;")
+        if parameters.mode == "fulltext":
+            tsquery = func.websearch_to_tsquery(SEARCH_CONFIG, parameters.q)
+            return func.ts_headline(SEARCH_CONFIG, escaped, tsquery, HEADLINE_OPTIONS)
+        if parameters.mode == "contains":
+            needle = re.escape(html.escape(parameters.q, quote=False))
+            return func.regexp_replace(escaped, needle, "<mark>\\&</mark>", "gi")
+        return func.left(escaped, SNIPPET_LENGTH)
+
+    async def get_stats(self, recent: int):
+        # Group counts come from the trigger-maintained counters; deadline counts depend on the
+        # current time, so they are range counts over the partial deadline index instead.
+        now = func.localtimestamp()
+        dimensions = [TaskCounter.__table__.c[column] for column in self.REFERENCES]
+        counts = (
+            select(
+                *dimensions,
+                func.grouping(*dimensions).label("grouped"),
+                cast(func.coalesce(func.sum(TaskCounter.count), 0), BigInteger).label("total"),
+            )
+            .where(TaskCounter.count != 0)
+            .group_by(func.grouping_sets(*(tuple_(dimension) for dimension in dimensions), tuple_()))
+            .cte("counts")
+        )
+        overdue = select(func.count()).where(Task.deadline < now).scalar_subquery()
+        due_this_week = (
+            select(func.count())
+            .where(Task.deadline >= now, Task.deadline < now + DUE_SOON)
+            .scalar_subquery()
+        )
+
+        # GROUPING() sets one bit per column left out of the group, first column highest.
+        everything = (1 << len(dimensions)) - 1
+        masks = {
+            everything ^ (1 << (len(dimensions) - 1 - index)): column.removesuffix("_id")
+            for index, column in enumerate(self.REFERENCES)
+        }
+
+        page = self._tasks_query({}).order_by(Task.created_at.desc(), Task.id.desc()).limit(recent).subquery("recent")
+        recent_rows = select(
+            func.coalesce(
+                func.json_agg(aggregate_order_by(page.table_valued(), page.c.created_at.desc(), page.c.id.desc())),
+                literal_column("'[]'::json"),
+                type_=JSON,
+            )
+        ).scalar_subquery()
+
+        totals = {
+            model.__tablename__: select(func.count()).select_from(model).scalar_subquery()
+            for model in self.REFERENCES.values()
+        }
+        on_total = counts.c.grouped == everything
+        query = (
+            select(
+                case(masks, value=counts.c.grouped).label("dimension"),
+                func.coalesce(*(counts.c[column] for column in self.REFERENCES)).label("id"),
+                func.coalesce(*(model.name for model in self.REFERENCES.values())).label("name"),
+                counts.c.total,
+                case((on_total, overdue)).label("overdue"),
+                case((on_total, due_this_week)).label("due_this_week"),
+                case((on_total, recent_rows)).label("recent"),
+                *(case((on_total, total)).label(name) for name, total in totals.items()),
+            )
+            .select_from(counts)
+        )
+        for column, model in self.REFERENCES.items():
+            query = query.outerjoin(model, model.id == counts.c[column])
+
+        result = await self.execute(query.order_by(counts.c.grouped, counts.c.total.desc()))
+        return result.fetchall()
+
+    async def count(self, **filters: Any) -> int:
+        if not set(filters) <= set(self.REFERENCES):
+            return await super().count(**filters)
+
+        query = select(func.coalesce(func.sum(TaskCounter.count), 0)).filter_by(**filters)
+        return int((await self.execute(query)).scalar_one())
+
+    async def reconcile_counters(self) -> int:
+        # Actual and stored counts are read from one snapshot; the drift is then added, not assigned,
+        # so increments committed by concurrent writers meanwhile are kept. Keys are ordered like
+        # the trigger deltas so both take counter row locks in the same order.
+        columns = ("status_id", "priority_id", "label_id")
+        keys = [Task.__table__.c[column] for column in columns]
+        # Actual counts minus stored ones, summed per key; GROUP BY treats the NULL keys as equal,
+        # which a join condition cannot do with a hashable or mergeable FULL JOIN.
+        changes = union_all(
+            select(*keys, func.count().label("delta")).group_by(*keys),
+            select(*(TaskCounter.__table__.c[column] for column in columns), (-TaskCounter.count).label("delta")),
+        ).subquery("changes")
+        key = [changes.c[column] for column in columns]
+        delta = func.sum(changes.c.delta)
+        drift = select(*key, delta).group_by(*key).having(delta != 0).order_by(*key)
+        query = pg_insert(TaskCounter).from_select([*columns, "count"], drift)
+        query = query.on_conflict_do_update(
+            index_elements=[TaskCounter.__table__.c[column] for column in columns],
+            set_={"count": TaskCounter.count + query.excluded.count},
+        ).returning(TaskCounter.id)
+
+        async with self._start_session():
+            # Every worker reconciles on a timer; two concurrent runs would both add the same drift.
+            locked = select(func.pg_try_advisory_xact_lock(func.hashtext(TaskCounter.__tablename__)))
+            if not (await self.session.execute(locked)).scalar_one():
+                return 0
+            repaired = len((await self.session.execute(query)).fetchall())
+            await self._commit()
+        return repaired
+
+    async def get_tasks_by_ids(self, ids: Iterable[int]):
+        query = self._tasks_query({}).where(Task.id.in_(set(ids))).order_by(Task.id)
+        async with self._start_session():
+            result = await self.session.execute(query)
+        return result.fetchall()
+
+    async def get_change_horizons(self) -> tuple[int, int]:
+        compacted = select(SyncHorizon.version).where(SyncHorizon.name == Task.__tablename__).scalar_subquery()
+        query = select(SAFE_VERSION, func.coalesce(compacted, 0))
+        async with self._start_session():
+            safe, compacted = (await self.session.execute(query)).one()
+        return safe, compacted
+
+    async def get_changes(self, start: tuple[int, int], safe: int, limit: int) -> tuple[list[Row], list[Row]]:
+        upserts = (
+            self._tasks_query({})
+            .add_columns(Task.version)
+            .where(tuple_(Task.version, Task.id) > start, Task.version < safe)
+            .order_by(Task.version, Task.id)
+            .limit(limit)
+        )
+        tombstones = (
+            select(TaskTombstone.version, TaskTombstone.id)
+            .where(tuple_(TaskTombstone.version, TaskTombstone.id) > start, TaskTombstone.version < safe)
+            .order_by(TaskTombstone.version, TaskTombstone.id)
+            .limit(limit)
+        )
+        async with self._start_session():
+            rows = (await self.session.execute(upserts)).fetchall()
+            deleted = (await self.session.execute(tombstones)).fetchall()
+        return list(rows), list(deleted)
+
+    async def compact_tombstones(self, older_than: datetime) -> int:
+        horizon = (
+            select(func.max(TaskTombstone.version) + 1)
+            .where(TaskTombstone.deleted_at < older_than)
+            .scalar_subquery()
+        )
+        async with self._start_session():
+            version = (await self.session.execute(select(horizon))).scalar_one()
+            if version is None:
+                return 0
+
+            result = await self.session.execute(delete(TaskTombstone).where(TaskTombstone.version < version))
+            query = pg_insert(SyncHorizon).values(name=Task.__tablename__, version=version)
+            query = query.on_conflict_do_update(
+                index_elements=["name"],
+                set_={"version": func.greatest(SyncHorizon.version, query.excluded.version)},
+            )
+            await self.session.execute(query)
+            await self._commit()
+        return result.rowcount  # type: ignore
+
+    async def stream_tasks(
+        self, parameters: params.TaskFilters, batch_size: int = STREAM_BATCH_SIZE
+    ) -> AsyncIterator[Sequence[Row]]:
+        filters = await self.resolve_filters(parameters)
+        if filters is None:
+            return
+
+        query = self._tasks_query(filters).execution_options(yield_per=batch_size)
+        result = await self.session.stream(query)
+        async for partition in result.partitions():
+            yield partition
+
+    async def resolve_filters(self, parameters: params.TaskFilters) -> dict[str, int] | None:
+        names = {
+            column: getattr(parameters, name)
+            for name, column in FILTERS.items()
+            if getattr(parameters, name) is not None
+        }
+        if not names:
+            return {}
+
+        query = union_all(*(
+            select(literal(column).label("column"), self.REFERENCES[column].id)
+            .where(self.REFERENCES[column].name == name)
+            for column, name in names.items()
+        ))
+        async with self._start_session():
+            result = await self.session.execute(query)
+        ids = {column: id for column, id in result}
+        return ids if ids.keys() == names.keys() else None
+
+    def _page_query(
+        self, filters: dict[str, int], parameters: params.GetTasks, after: int | None, before: int | None
+    ) -> Select:
+        query = self._list_query(filters, list_fields(parameters), parameters.view == "summary")
+        limit = parameters.limit
+        if before is not None:
+            query = query.where(Task.id < before).order_by(Task.id.desc())
+        else:
+            if after is not None:
+                query = query.where(Task.id > after)
+            query = query.order_by(Task.id)
+        return query.limit(limit + 1)
+
+    @staticmethod
+    def _json_value(page: Any, field: str) -> Any:
+        if field == "task_id":
+            return page.c.id
+        if field in ("created_at", "deadline"):
+            return json_timestamp(page.c[field])
+        return page.c[field]
 
-    async def get_tasks(self, parameters: params.GetTasks):
+    def _list_query(self, filters: dict[str, int], fields: Sequence[str], summary: bool) -> Select:
+        # Only the columns and joins the response needs; the reference ids always, for result-cache tags.
+        if len(fields) == len(params.LIST_FIELDS) and not summary:
+            return self._tasks_query(filters)
+
+        columns: list[Any] = [Task.id, Task.priority_id, Task.label_id, Task.status_id]
+        columns.extend(Task.__table__.c[field] for field in ("created_at", "deadline") if field in fields)
+        if "description" in fields:
+            description = func.left(Task.description, SUMMARY_LENGTH) if summary else Task.description
+            columns.append(description.label("description"))
+        query = select(*columns)
+        for name, column in FILTERS.items():
+            if name in fields:
+                model = self.REFERENCES[column]
+                query = query.add_columns(model.name.label(name)).outerjoin(
+                    model, model.id == Task.__table__.c[column]
+                )
+        for column, id in filters.items():
+            query = query.where(Task.__table__.c[column] == id)
+
+        return query
+
+    def _tasks_query(self, filters: dict[str, int], task: Any = Task) -> Select:
         query = (
             select(
-                Task.id, 
-                Task.deadline,
-                Task.description,
-                Task.created_at,
-                
+                task.id,
+                task.deadline,
+                task.description,
+                task.created_at,
+
                 Priority.name.label('priority'),
                 Label.name.label('label'),
                 Status.name.label('status'),
+
+                task.priority_id,
+                task.label_id,
+                task.status_id,
             )
-            .join(Priority, Priority.id == Task.priority_id)
-            .join(Label, Label.id == Task.label_id)
-            .join(Status, Status.id == Task.status_id)
-        )
-        if parameters.label is not None:
-            query = query.where(Label.name == parameters.label)
-            
-        if parameters.priority is not None:
-            query = query.where(Priority.name == parameters.priority)
-            
-        if parameters.status is not None:
-            query = query.where(Status.name == parameters.status)
-        
-        result = await self.execute(query)
-        return result.fetchall()
-    
\ No newline at end of file
+            .outerjoin(Priority, Priority.id == task.priority_id)
+            .outerjoin(Label, Label.id == task.label_id)
+            .outerjoin(Status, Status.id == task.status_id)
+        )
+        for column, id in filters.items():
+            query = query.where(getattr(task, column) == id)
+
+        return query
+
+    async def find_reference_ids(self, rows: list[dict[str, Any]]) -> dict[str, set[int]]:
+        found: dict[str, set[int]] = {name: set() for name in self.REFERENCES}
+        queries = []
+        for name, model in self.REFERENCES.items():
+            ids = {row[name] for row in rows if row.get(name) is not None}
+            if ids:
+                queries.append(select(literal(name).label("name"), model.id).where(model.id.in_(ids)))
+
+        if not queries:
+            return found
+
+        async with self._start_session():
+            result = await self.session.execute(union_all(*queries))
+        for name, id in result:
+            found[name].add(id)
+        return found
+
+    async def reference_ids(self) -> dict[str, set[int]]:
+        found: dict[str, set[int]] = {name: set() for name in self.REFERENCES}
+        query = union_all(*(
+            select(literal(name).label("name"), model.id) for name, model in self.REFERENCES.items()
+        ))
+        async with self._start_session():
+            result = await self.session.execute(query)
+        for name, id in result:
+            found[name].add(id)
+        return found
+
+    async def bulk_insert(self, rows: list[dict[str, Any]]) -> list[int]:
+        query = insert(Task).returning(Task.id, sort_by_parameter_order=True)
+        async with self._start_session():
+            ids = (await self.session.execute(query, rows)).scalars().all()
+            self._record_change(INSERT, ids, self._distinct_values(rows))
+            await self._commit()
+        return list(ids)
+
+    async def bulk_update(self, rows: list[dict[str, Any]]) -> set[int]:
+        table = Task.__table__
+        updated: set[int] = set()
+
+        groups: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+        for row in rows:
+            keys = tuple(sorted(key for key in row if key != "id"))
+            groups.setdefault(keys, []).append(row)
+
+        async with self._start_session():
+            for keys, group in groups.items():
+                if not keys:
+                    query = select(table.c.id).where(table.c.id.in_([row["id"] for row in group]))
+                else:
+                    data = values(
+                        column("id", Integer),
+                        *(column(key, table.c[key].type) for key in keys),
+                        name="data",
+                    ).data([(row["id"], *(row[key] for key in keys)) for row in group])
+                    query = (
+                        update(table)
+                        .where(table.c.id == data.c.id)
+                        .values({key: cast(data.c[key], table.c[key].type) for key in keys})
+                        .returning(table.c.id, *(table.c[key] for key in self.CHANGE_COLUMNS))
+                    )
+                result = (await self.session.execute(query)).fetchall()
+                updated.update(row.id for row in result)
+                if result and keys:
+                    moved = set(keys) & set(self.CHANGE_COLUMNS)
+                    changed = self._distinct_values(row._asdict() for row in result) if moved else []
+                    self._record_change(UPDATE, [row.id for row in result], changed)
+            await self._commit()
+        return updated
+
+    async def bulk_delete(self, ids: list[int]) -> set[int]:
+        query = (
+            delete(Task)
+            .where(Task.id.in_(ids))
+            .returning(Task.id)
+            .execution_options(synchronize_session=False)
+        )
+        async with self._start_session():
+            deleted = set((await self.session.execute(query)).scalars())
+            if deleted:
+                self._record_change(DELETE, sorted(deleted))
+            await self._commit()
+        return deleted
+
+    def _distinct_values(self, rows: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+        combinations = {tuple(row.get(column) for column in self.CHANGE_COLUMNS) for row in rows}
+        return [dict(zip(self.CHANGE_COLUMNS, combination)) for combination in combinations]
+
+    async def resolve_names(self, model: Any, names: Iterable[str]) -> dict[str, int]:
+        query = (
+            select(model.name, func.min(model.id))
+            .where(model.name.in_(set(names)))
+            .group_by(model.name)
+        )
+        async with self._start_session():
+            result = await self.session.execute(query)
+        return {name: id for name, id in result}
+
+    async def copy_insert(self, records: list[tuple[Any, ...]]) -> int:
+        columns = ", ".join(COPY_COLUMNS)
+        async with self._start_session():
+            await self.session.execute(text(
+                f"CREATE TEMP TABLE IF NOT EXISTS {COPY_STAGING_TABLE} "
+                "(status_id integer, priority_id integer, label_id integer, "
+                "created_at timestamp, deadline timestamp, description text) "
+                "ON COMMIT DELETE ROWS"
+            ))
+            connection = await self.session.connection()
+            raw_connection = await connection.get_raw_connection()
+            await raw_connection.driver_connection.copy_records_to_table(  # type: ignore
+                COPY_STAGING_TABLE, records=records, columns=COPY_COLUMNS
+            )
+            combinations = (await self.session.execute(text(
+                f"SELECT DISTINCT {', '.join(self.CHANGE_COLUMNS)} FROM {COPY_STAGING_TABLE}"
+            ))).fetchall()
+            result = await self.session.execute(text(
+                f"INSERT INTO tasks ({columns}) SELECT {columns} FROM {COPY_STAGING_TABLE}"
+            ))
+            await self.session.execute(text(f"TRUNCATE {COPY_STAGING_TABLE}"))
+            if result.rowcount:  # type: ignore
+                self._record_change(INSERT, values=[row._asdict() for row in combinations])
+            await self._commit()
+        return result.rowcount  # type: ignore
@@ -9,6 +9,13 @@ class DatabaseSettings(BaseModel):
     port: str
     db_name: str
 
+    pool_size: int = 20
+    max_overflow: int = 10
+    pool_timeout: float = 30.0
+    pool_recycle: int = 1800
+    pool_pre_ping: bool = True
+    statement_cache_size: int = 100
+
 
 def get_db_settings() -> DatabaseSettings:
     return DatabaseSettings(
@@ -17,5 +24,10 @@ def get_db_settings() -> DatabaseSettings:
         host=os.getenv("DB_HOST", 'localhost'),
         port=os.getenv("DB_PORT", '5432'),
         db_name=os.getenv("DB_NAME", 'tms'),
+        pool_size=os.getenv("DB_POOL_SIZE", 20),  # type: ignore
+        max_overflow=os.getenv("DB_MAX_OVERFLOW", 10),  # type: ignore
+        pool_timeout=os.getenv("DB_POOL_TIMEOUT", 30.0),  # type: ignore
+        pool_recycle=os.getenv("DB_POOL_RECYCLE", 1800),  # type: ignore
+        pool_pre_ping=os.getenv("DB_POOL_PRE_PING", True),  # type: ignore
+        statement_cache_size=os.getenv("DB_STATEMENT_CACHE_SIZE", 100),  # type: ignore
     )
-
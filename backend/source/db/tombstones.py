@@ -0,0 +1,18 @@
+# A statement-level trigger records deleted task ids in task_tombstones inside the deleting statement,
+# so delta sync sees every delete, however it was issued, without a second round trip.
+
+TOMBSTONE_FUNCTION = """
+CREATE OR REPLACE FUNCTION task_tombstones_bury() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    INSERT INTO task_tombstones (id)
+    SELECT id FROM old_rows ORDER BY id
+    ON CONFLICT (id) DO UPDATE SET version = excluded.version, deleted_at = excluded.deleted_at;
+    RETURN NULL;
+END
+$$
+"""
+
+TOMBSTONE_TRIGGER = (
+    "CREATE TRIGGER task_tombstones_delete AFTER DELETE ON tasks "
+    "REFERENCING OLD TABLE AS old_rows FOR EACH STATEMENT EXECUTE FUNCTION task_tombstones_bury()"
+)
@@ -0,0 +1,72 @@
+from sqlalchemy import BigInteger, Text, cast, func, literal_column, select
+from sqlalchemy.dialects.postgresql import ARRAY, aggregate_order_by
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .changes import Change, subscribe
+from .models import Task, TaskTombstone, SyncHorizon
+from .models.base import Base
+
+
+# Transactions still running when the stamp is read; one that commits later may have written
+# below the newest version, so its commit has to change the stamp too.
+IN_FLIGHT = literal_column(
+    "ARRAY(SELECT xip::text::bigint FROM pg_snapshot_xip(pg_current_snapshot()) xip ORDER BY 1)",
+    ARRAY(BigInteger()),
+)
+
+
+class TableVersions:
+
+    def __init__(self):
+        self._versions: dict[str, int] = {}
+
+    def get(self, table: str) -> int:
+        return self._versions.get(table, 0)
+
+    def bump(self, table: str):
+        self._versions[table] = self.get(table) + 1
+
+    def on_changes(self, changes: list[Change]):
+        for table in {change.table for change in changes}:
+            self.bump(table)
+
+    def stamp(self, *tables: str) -> str:
+        return ":".join(f"{table}={self.get(table)}" for table in tables)
+
+
+class DatabaseVersions:
+    # Read from committed data rather than counted per process, so every worker derives the same
+    # stamp and a validator issued by one is honoured by all of them.
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def stamp(self, *tables: str) -> str:
+        query = select(*(self._version(table).label(table) for table in tables), IN_FLIGHT.label("in_flight"))
+        row = (await self.session.execute(query)).one()
+
+        parts = [f"{table}={row[index]}" for index, table in enumerate(tables)]
+        if Task.__tablename__ in tables:
+            newest = row[tables.index(Task.__tablename__)]
+            parts.append(",".join(str(xid) for xid in row.in_flight if xid < newest))
+        return ":".join(parts)
+
+    @staticmethod
+    def _version(table: str):
+        if table == Task.__tablename__:
+            # Writes stamp rows and tombstones with the writer's transaction id; compaction moves
+            # the horizon past the tombstones it removes.
+            return func.coalesce(func.greatest(
+                select(func.max(Task.version)).scalar_subquery(),
+                select(func.max(TaskTombstone.version)).scalar_subquery(),
+                select(SyncHorizon.version).where(SyncHorizon.name == table).scalar_subquery(),
+            ), 0)
+
+        # Reference tables are small and carry no version column; digest their rows instead.
+        model = Base.metadata.tables[table]
+        rows = func.string_agg(cast(model.table_valued(), Text), aggregate_order_by(literal_column("','"), model.c.id))
+        return select(func.md5(func.coalesce(rows, ""))).scalar_subquery()
+
+
+TABLE_VERSIONS = TableVersions()
+subscribe(TABLE_VERSIONS.on_changes)
@@ -0,0 +1,33 @@
+import argparse
+import asyncio
+import logging
+
+from .db.dbase import SESSION_MAKER
+from .db.repositories import TaskRepository
+from .services.task_import import FORMATS, CHUNK_SIZE, TaskImporter
+
+
+async def run(path: str, format: str, chunk_size: int):
+    async with SESSION_MAKER() as session:
+        importer = TaskImporter(TaskRepository(session), chunk_size=chunk_size)
+        with open(path, encoding="utf-8", newline="") as stream:
+            result = await importer.import_stream(stream, format)
+
+    for error in result.errors:
+        logging.warning(f"record {error.record}: {error.error}")
+    logging.info(
+        f"imported {result.rows_imported} of {result.rows_read} rows "
+        f"in {result.seconds:.1f}s ({result.rows_per_second:.0f} rows/s)"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bulk import tasks from a CSV or NDJSON file")
+    parser.add_argument("path")
+    parser.add_argument("--format", choices=FORMATS)
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    format = args.format or ("csv" if args.path.endswith(".csv") else "ndjson")
+    asyncio.run(run(args.path, format, args.chunk_size))
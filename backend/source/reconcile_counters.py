@@ -0,0 +1,15 @@
+import asyncio
+import logging
+
+from .services.counters import CounterReconciler
+
+
+async def run():
+    # Manual run; the app also reconciles every TASKS_COUNTER_RECONCILE_INTERVAL seconds.
+    if not await CounterReconciler().reconcile():
+        logging.info("task counters are exact")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(run())
@@ -0,0 +1,39 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class PoolStats(BaseModel):
+    size: int
+    checked_out: int
+    idle: int
+    overflow: int
+    checkouts: int
+    checkout_timeouts: int
+    wait_seconds_sum: float
+    wait_seconds_histogram: dict[str, int]
+
+
+class CacheStats(BaseModel):
+    backend: str | None = None
+    entries: int = 0
+    hits: int = 0
+    misses: int = 0
+    sets: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+
+class ReminderStats(BaseModel):
+    enabled: bool = False
+    scans: int = 0
+    batches: int = 0
+    sent: int = 0
+    skipped: int = 0
+    failures: int = 0
+    last_scan_at: datetime | None = None
+    last_scan_seconds: float = 0.0
+    last_batch_size: int = 0
+    max_batch_size: int = 0
+    lag_seconds: float = 0.0
+    throughput: float = 0.0
@@ -1,13 +1,64 @@
-from pydantic import BaseModel
+from typing import Literal
+
+from pydantic import BaseModel, Field
 from datetime import datetime
 
 
-class GetTasks(BaseModel):
+# responses.Task fields, in response order, that fields= may name.
+LIST_FIELDS = ("task_id", "status", "priority", "label", "created_at", "deadline", "description")
+_FIELD_NAME = "|".join(LIST_FIELDS)
+
+
+class TaskFilters(BaseModel):
     label: str | None = None
     status: str | None = None
     priority: str | None = None
 
 
+class GetTasks(TaskFilters):
+    limit: int = Field(default=100, ge=1, le=1000)
+    after: str | None = None
+    before: str | None = None
+    fields: str | None = Field(default=None, pattern=rf"^({_FIELD_NAME})(,({_FIELD_NAME}))*$")
+    view: Literal["full", "summary"] = "full"
+
+
+class SearchTasks(TaskFilters):
+    q: str = Field(min_length=1, max_length=500)
+    mode: Literal["fulltext", "contains", "fuzzy"] = "fulltext"
+    threshold: float = Field(default=0.3, ge=0, le=1)
+    limit: int = Field(default=20, ge=1, le=100)
+    after: str | None = None
+
+
+class Typeahead(BaseModel):
+    q: str = Field(min_length=1, max_length=100)
+    limit: int = Field(default=10, ge=1, le=50)
+    threshold: float = Field(default=0.3, ge=0, le=1)
+
+
+class DueTasks(TaskFilters):
+    mode: Literal["overdue", "before", "after"] = "overdue"
+    at: datetime | None = None
+    open: bool = False
+    limit: int = Field(default=100, ge=1, le=1000)
+    after: str | None = None
+
+
+class TaskStats(BaseModel):
+    recent: int = Field(default=5, ge=0, le=50)
+
+
+class GetTaskChanges(BaseModel):
+    since: int | None = Field(default=None, ge=0)
+    limit: int = Field(default=1000, ge=1, le=1000)
+    after: str | None = None
+
+
+class ExportTasks(TaskFilters):
+    format: Literal["ndjson", "csv"] = "ndjson"
+
+
 class CreateTask(BaseModel):
     label_id: int | None = None
     status_id: int | None = None
@@ -32,3 +83,15 @@ class UpdateTask(BaseModel):
 
 class DeleteTask(BaseModel):
     task_id: int
+
+
+class BulkCreateTasks(BaseModel):
+    items: list[CreateTask]
+
+
+class BulkUpdateTasks(BaseModel):
+    items: list[UpdateTask]
+
+
+class BulkDeleteTasks(BaseModel):
+    task_ids: list[int]
@@ -16,7 +16,90 @@ class Task(BaseModel):
     
 class GetTasks(BaseModel):
     items: list[Task]
+    next_cursor: str | None = None
+    prev_cursor: str | None = None
+
+
+class SearchHit(Task):
+    rank: float
+    snippet: str
+
+
+class SearchTasks(BaseModel):
+    items: list[SearchHit]
+    next_cursor: str | None = None
+
+
+class Suggestion(BaseModel):
+    kind: str
+    id: int
+    text: str
+    score: float
+
+
+class Typeahead(BaseModel):
+    items: list[Suggestion]
+
+
+class DueTasks(BaseModel):
+    items: list[Task]
+    next_cursor: str | None = None
+
+
+class GroupCount(BaseModel):
+    id: int | None = None
+    name: str | None = None
+    count: int
+
+
+class TaskCount(BaseModel):
+    count: int
+
+
+class TaskStats(BaseModel):
+    total: int = 0
+    overdue: int = 0
+    due_this_week: int = 0
+    by_status: list[GroupCount] = []
+    by_priority: list[GroupCount] = []
+    by_label: list[GroupCount] = []
+    recent: list[Task] = []
+    labels: int = 0
+    statuses: int = 0
+    priorities: int = 0
+
+
+class TaskChanges(BaseModel):
+    items: list[Task]
+    deleted: list[int]
+    version: int
+    next_cursor: str | None = None
+    resync_required: bool = False
 
 
 class CreateTask(BaseModel):
     status: str
+
+
+class BulkItemResult(BaseModel):
+    index: int
+    task_id: int | None = None
+    error: str | None = None
+
+
+class BulkResult(BaseModel):
+    items: list[BulkItemResult]
+
+
+class ImportRecordError(BaseModel):
+    record: int
+    error: str
+
+
+class ImportResult(BaseModel):
+    rows_read: int
+    rows_imported: int
+    rows_rejected: int
+    errors: list[ImportRecordError]
+    seconds: float
+    rows_per_second: float
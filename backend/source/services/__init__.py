@@ -1,5 +1,7 @@
-from .task import TaskService, get_task_service
+from .task import TaskService, get_task_service, get_task_export_service
 from .user import UserService, get_user_service
 from .status import StatusService, get_status_service
 from .label import LabelService, get_label_service
 from .priority import PriorityService, get_priority_service
+from .metrics import MetricsService, get_metrics_service
+from .task_import import TaskImporter, get_task_importer
@@ -0,0 +1,316 @@
+import asyncio
+import logging
+import os
+import time
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from typing import Any, Iterable
+from urllib.parse import urlparse
+
+
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "memory")
+CACHE_TTL = float(os.getenv("CACHE_TTL", 30))
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", 1024))
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    sets: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+
+class CacheBackend(ABC):
+
+    def __init__(self, ttl: float = CACHE_TTL, max_entries: int = CACHE_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.counters = CacheStats()
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, tags: Iterable[str] = ()):
+        raise NotImplementedError
+
+    @abstractmethod
+    def invalidate(self, tags: Iterable[str] | None):
+        raise NotImplementedError
+
+    @abstractmethod
+    async def size(self) -> int:
+        raise NotImplementedError
+
+    async def stats(self) -> dict[str, Any]:
+        return {"backend": type(self).__name__, "entries": await self.size(), **asdict(self.counters)}
+
+
+class MemoryBackend(CacheBackend):
+
+    def __init__(self, ttl: float = CACHE_TTL, max_entries: int = CACHE_MAX_ENTRIES):
+        super().__init__(ttl, max_entries)
+        self._entries: OrderedDict[str, tuple[float, bytes, tuple[str, ...]]] = OrderedDict()
+        self._tags: dict[str, set[str]] = {}
+
+    async def get(self, key: str) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                self._remove(key)
+            self.counters.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.counters.hits += 1
+        return entry[1]
+
+    async def set(self, key: str, value: bytes, tags: Iterable[str] = ()):
+        if key in self._entries:
+            self._remove(key)
+
+        tags = tuple(tags)
+        self._entries[key] = (time.monotonic() + self.ttl, value, tags)
+        for tag in tags:
+            self._tags.setdefault(tag, set()).add(key)
+        self.counters.sets += 1
+
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+            self.counters.evictions += 1
+
+    def invalidate(self, tags: Iterable[str] | None):
+        if tags is None:
+            self.counters.invalidations += len(self._entries)
+            self._entries.clear()
+            self._tags.clear()
+            return
+
+        keys = set().union(*(self._tags.get(tag, ()) for tag in tags))
+        for key in keys:
+            self._remove(key)
+        self.counters.invalidations += len(keys)
+
+    async def size(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: str):
+        _, _, tags = self._entries.pop(key)
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+
+class RedisError(Exception):
+    pass
+
+
+# Speaks plain RESP2, so any Redis-compatible server works. Entries expire via PX,
+# a sorted set ordered by last access bounds their number and one set per tag
+# lists the keys to drop on invalidation.
+class RedisBackend(CacheBackend):
+
+    def __init__(
+        self,
+        url: str = REDIS_URL,
+        ttl: float = CACHE_TTL,
+        max_entries: int = CACHE_MAX_ENTRIES,
+        prefix: str = "cache:",
+    ):
+        super().__init__(ttl, max_entries)
+        self.url = urlparse(url)
+        self.prefix = prefix
+        self._lru = f"{prefix}lru"
+        self._tag_index = f"{prefix}tags"
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._lock = asyncio.Lock()
+        self._pending: set[str] = set()
+        self._flush_all = False
+
+    async def get(self, key: str) -> bytes | None:
+        try:
+            await self._apply_invalidations()
+            value, _ = await self._execute(
+                ("GET", self._key(key)),
+                ("ZADD", self._lru, "XX", self._now(), key),
+            )
+        except (OSError, RedisError) as e:
+            logging.error(f"Cache read failed: {e}")
+            value = None
+
+        if value is None:
+            self.counters.misses += 1
+        else:
+            self.counters.hits += 1
+        return value
+
+    async def set(self, key: str, value: bytes, tags: Iterable[str] = ()):
+        ttl = int(self.ttl * 1000)
+        commands: list[tuple[Any, ...]] = [
+            ("SET", self._key(key), value, "PX", ttl),
+            ("ZADD", self._lru, self._now(), key),
+        ]
+        for tag in tags:
+            commands.append(("SADD", self._tag(tag), key))
+            commands.append(("PEXPIRE", self._tag(tag), ttl))
+            commands.append(("SADD", self._tag_index, tag))
+        commands.append(("ZCARD", self._lru))
+
+        try:
+            *_, size = await self._execute(*commands)
+            self.counters.sets += 1
+            if size > self.max_entries:
+                evicted = await self._execute(("ZPOPMIN", self._lru, size - self.max_entries))
+                keys = evicted[0][::2]
+                if keys:
+                    deleted, = await self._execute(("DEL", *(self._key(key.decode()) for key in keys)))
+                    self.counters.evictions += deleted
+        except (OSError, RedisError) as e:
+            logging.error(f"Cache write failed: {e}")
+
+    def invalidate(self, tags: Iterable[str] | None):
+        # Called from commit hooks, which cannot await; applied before the next read.
+        if tags is None:
+            self._flush_all = True
+        else:
+            self._pending.update(tags)
+
+    async def size(self) -> int:
+        try:
+            size, = await self._execute(("ZCARD", self._lru))
+        except (OSError, RedisError):
+            return 0
+        return size
+
+    async def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    async def _apply_invalidations(self):
+        if not self._flush_all and not self._pending:
+            return
+
+        flush_all, tags = self._flush_all, self._pending
+        self._flush_all, self._pending = False, set()
+        try:
+            await self._drop(flush_all, tags)
+        except (OSError, RedisError):
+            self._flush_all = self._flush_all or flush_all
+            self._pending.update(tags)
+            raise
+
+    async def _drop(self, flush_all: bool, tags: Iterable[str]):
+        if flush_all:
+            keys, tags = await self._execute(("ZRANGE", self._lru, 0, -1), ("SMEMBERS", self._tag_index))
+            keys = [key.decode() for key in keys]
+            tags = [tag.decode() for tag in tags]
+        else:
+            members = await self._execute(*(("SMEMBERS", self._tag(tag)) for tag in tags))
+            keys = list({key.decode() for keys in members for key in keys})
+
+        commands: list[tuple[Any, ...]] = []
+        if keys:
+            commands.append(("DEL", *(self._key(key) for key in keys)))
+            commands.append(("ZREM", self._lru, *keys))
+        if tags:
+            commands.append(("DEL", *(self._tag(tag) for tag in tags)))
+            commands.append(("SREM", self._tag_index, *tags))
+        if commands:
+            replies = await self._execute(*commands)
+            self.counters.invalidations += replies[0] if keys else 0
+
+    async def _execute(self, *commands: tuple[Any, ...]) -> list[Any]:
+        async with self._lock:
+            if self._writer is None or self._writer.is_closing():
+                await self._connect()
+            assert self._reader is not None and self._writer is not None
+
+            try:
+                self._writer.write(b"".join(_encode(command) for command in commands))
+                await self._writer.drain()
+                replies = [await _read_reply(self._reader) for _ in commands]
+            except (OSError, asyncio.IncompleteReadError):
+                self._writer.close()
+                self._writer = None
+                raise
+
+        for reply in replies:
+            if isinstance(reply, RedisError):
+                raise reply
+        return replies
+
+    async def _connect(self):
+        self._reader, self._writer = await asyncio.open_connection(
+            self.url.hostname or "localhost", self.url.port or 6379
+        )
+        handshake: list[tuple[Any, ...]] = []
+        if self.url.password:
+            handshake.append(("AUTH", *([self.url.username] if self.url.username else []), self.url.password))
+        database = self.url.path.lstrip("/")
+        if database:
+            handshake.append(("SELECT", database))
+        for command in handshake:
+            self._writer.write(_encode(command))
+            await self._writer.drain()
+            reply = await _read_reply(self._reader)
+            if isinstance(reply, RedisError):
+                raise reply
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}entry:{key}"
+
+    def _tag(self, tag: str) -> str:
+        return f"{self.prefix}tag:{tag}"
+
+    @staticmethod
+    def _now() -> str:
+        return repr(time.time())
+
+
+def _encode(command: tuple[Any, ...]) -> bytes:
+    parts = [f"*{len(command)}\r\n".encode()]
+    for argument in command:
+        data = argument if isinstance(argument, bytes) else str(argument).encode()
+        parts.append(f"${len(data)}\r\n".encode() + data + b"\r\n")
+    return b"".join(parts)
+
+
+async def _read_reply(reader: asyncio.StreamReader) -> Any:
+    line = await reader.readuntil(b"\r\n")
+    kind, payload = line[:1], line[1:-2]
+    if kind == b"+":
+        return payload.decode()
+    if kind == b"-":
+        return RedisError(payload.decode())
+    if kind == b":":
+        return int(payload)
+    if kind == b"$":
+        length = int(payload)
+        if length < 0:
+            return None
+        return (await reader.readexactly(length + 2))[:-2]
+    if kind == b"*":
+        length = int(payload)
+        if length < 0:
+            return None
+        return [await _read_reply(reader) for _ in range(length)]
+    raise RedisError(f"Unexpected reply {line!r}")
+
+
+def create_backend(name: str = CACHE_BACKEND) -> CacheBackend | None:
+    if name == "memory":
+        return MemoryBackend()
+    if name == "redis":
+        return RedisBackend()
+    return None
@@ -0,0 +1,68 @@
+import asyncio
+import logging
+import os
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from ..db.dbase import SESSION_MAKER
+from ..db.repositories import TaskRepository
+
+
+# Seconds between reconciliations; 0 turns the background run off.
+RECONCILE_INTERVAL = float(os.getenv("TASKS_COUNTER_RECONCILE_INTERVAL", 3600))
+
+
+class CounterReconciler:
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession] = SESSION_MAKER,
+        interval: float = RECONCILE_INTERVAL,
+    ):
+        self.session_maker = session_maker
+        self.interval = interval
+        self.runs = 0
+        self.repaired = 0
+        self.failures = 0
+        self._task: asyncio.Task | None = None
+
+    async def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def reconcile(self) -> int:
+        async with self.session_maker() as session:
+            repaired = await TaskRepository(session).reconcile_counters()
+
+        self.runs += 1
+        self.repaired += repaired
+        if repaired:
+            logging.warning(f"repaired {repaired} drifted task counters")
+        return repaired
+
+    async def _run(self):
+        # Sleep first: the triggers keep counters exact, so there is nothing to repair at startup
+        # and every worker starting at once would otherwise scan tasks together.
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.reconcile()
+            except Exception as e:
+                self.failures += 1
+                logging.error(f"Counter reconciliation failed: {e}")
+
+
+def create_reconciler(interval: float = RECONCILE_INTERVAL) -> CounterReconciler | None:
+    return CounterReconciler(interval=interval) if interval > 0 else None
+
+
+COUNTER_RECONCILER = create_reconciler()
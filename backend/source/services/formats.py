@@ -0,0 +1,110 @@
+import types
+
+from datetime import datetime
+from typing import Any, Sequence, Union, get_args, get_origin
+
+import orjson
+
+from pydantic import BaseModel
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+
+JSON = "application/json"
+MSGPACK = "application/msgpack"
+ARROW = "application/vnd.apache.arrow.stream"
+PARQUET = "application/vnd.apache.parquet"
+
+COLUMNAR = (ARROW, PARQUET)
+
+# Names clients used before the registered ones.
+ALIASES = {
+    "application/x-msgpack": MSGPACK,
+    "application/vnd.msgpack": MSGPACK,
+    "application/x-parquet": PARQUET,
+}
+
+ARROW_TYPES = {int: "int64", str: "string", datetime: "timestamp[us]", bool: "bool", float: "double"}
+
+
+def media_types() -> tuple[str, ...]:
+    # JSON first so it wins ties; the binary formats only when their libraries are installed.
+    offered = [JSON]
+    if msgpack is not None:
+        offered.append(MSGPACK)
+    if pyarrow is not None:
+        offered.extend(COLUMNAR)
+    return tuple(offered)
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Cannot encode {type(value).__name__}")
+
+
+def encode_document(media_type: str, document: dict[str, Any]) -> bytes:
+    if media_type == MSGPACK:
+        # Timestamps stay ISO strings, as in JSON, so both decode to the same document.
+        return msgpack.packb(document, default=_encode_value)
+    return orjson.dumps(document)
+
+
+def _arrow_type(annotation: Any) -> str:
+    if get_origin(annotation) in (Union, types.UnionType):
+        (annotation,) = [arg for arg in get_args(annotation) if arg is not type(None)]
+    return ARROW_TYPES[annotation]
+
+
+def _arrow_column(values: Sequence[Any], arrow_type: str) -> Any:
+    # Inference handles a whole column in C; cached rows carry ISO strings and empty pages nulls,
+    # both of which cast to the declared type.
+    column = pyarrow.array(values)
+    target = pyarrow.type_for_alias(arrow_type)
+    return column if column.type == target else column.cast(target)
+
+
+def encode_columns(
+    media_type: str,
+    model: type[BaseModel],
+    columns: Sequence[Sequence[Any]],
+    metadata: dict[str, str | None] | None = None,
+    fields: Sequence[str] | None = None,
+) -> bytes:
+    # One array per model field (or per selected field), in order; metadata rides in the schema,
+    # null values dropped.
+    names = list(model.model_fields if fields is None else fields)
+    columns = columns or [()] * len(names)
+    arrays = [
+        _arrow_column(values, _arrow_type(model.model_fields[name].annotation)) for values, name in zip(columns, names)
+    ]
+    schema_metadata = {key: value for key, value in (metadata or {}).items() if value is not None}
+    table = pyarrow.Table.from_arrays(arrays, names=names, metadata=schema_metadata or None)
+
+    sink = pyarrow.BufferOutputStream()
+    if media_type == PARQUET:
+        pyarrow.parquet.write_table(table, sink)
+    else:
+        with pyarrow.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def encode_models(media_type: str, model: type[BaseModel], items: Sequence[Any]) -> bytes:
+    # Reference lists: ORM rows read attribute by attribute, never validated into models.
+    fields = tuple(model.model_fields)
+    if media_type in COLUMNAR:
+        return encode_columns(media_type, model, [[getattr(item, field) for item in items] for field in fields])
+    return encode_document(media_type, {
+        "items": [{field: getattr(item, field) for field in fields} for item in items],
+    })
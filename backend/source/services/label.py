@@ -1,22 +1,32 @@
 from fastapi import Depends, HTTPException
 from fastapi import status as api_statuses
 
+from sqlalchemy import exc
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Any
 
-from ..db.repositories import AbstractRepository, LabelRepository
-from ..db.dbase import get_session
+from ..db.repositories import AbstractRepository, LabelRepository, is_unique_violation
+from ..db.dbase import get_unit_of_work
 
 from ..schemas.label import params, responses
 
+from .reference import REFERENCE_CACHE, ReferenceCache
+from . import formats
+
 
 class LabelService:
     
-    def __init__(self, label_repo: AbstractRepository):
+    def __init__(self, label_repo: AbstractRepository, cache: ReferenceCache = REFERENCE_CACHE):
         self.label_repo: AbstractRepository = label_repo
+        self.cache = cache
     
     async def create_label(self, parameters: params.CreateLabel) -> responses.Label:
-        model = await self.label_repo.new(name=parameters.name)
+        try:
+            model = await self.label_repo.insert_returning(name=parameters.name)
+        except exc.IntegrityError as e:
+            if is_unique_violation(e):
+                raise HTTPException(status_code=api_statuses.HTTP_409_CONFLICT, detail="Label name already exists")
+            raise HTTPException(status_code=api_statuses.HTTP_500_INTERNAL_SERVER_ERROR)
+        
         if model is None:
             raise HTTPException(status_code=api_statuses.HTTP_500_INTERNAL_SERVER_ERROR)
         
@@ -25,33 +35,45 @@ class LabelService:
     async def get_labels(self, parameters: params.GetLabels) ->  responses.GetLabels:
         items = list()
         
-        db_response = await self.label_repo.select_all()
+        db_response = await self.cache.get("labels", self.label_repo.select_all)
         for model in db_response:
             items.append(responses.Label.model_validate(model, from_attributes=True))
             
         return responses.GetLabels(items=items)
     
+    async def encode_labels(self, media_type: str = formats.JSON) -> bytes:
+        # JSON is assembled by Postgres; the binary formats are built from the cached rows.
+        if media_type != formats.JSON:
+            models = await self.cache.get("labels", self.label_repo.select_all)
+            return formats.encode_models(media_type, responses.Label, models)
+        items = await self.label_repo.select_all_json(*responses.Label.model_fields)
+        return b'{"items":' + items.encode() + b'}'
+    
     async def delete_label(self, label_id: int) -> responses.Label:
-        model = await self._get_lable_by_id(label_id) 
-        status = await self.label_repo.delete(model)
-        return model if status else None
+        try:
+            model = await self.label_repo.delete_by_id_returning(label_id)
+        except exc.IntegrityError:
+            raise HTTPException(status_code=api_statuses.HTTP_500_INTERNAL_SERVER_ERROR)
+        
+        if model is None:
+            raise HTTPException(status_code=api_statuses.HTTP_404_NOT_FOUND, detail="Label not found")
+        
+        return responses.Label.model_validate(model, from_attributes=True)
     
     async def update_label(self, parameters: params.UpdateLabel, label_id: int) -> responses.Label:
-        model = await self._get_lable_by_id(label_id)
-        
-        updated_model = await self.label_repo.update(model, **parameters.model_dump())
-        if not updated_model:
+        try:
+            model = await self.label_repo.update_by_id_returning(label_id, **parameters.model_dump())
+        except exc.IntegrityError as e:
+            if is_unique_violation(e):
+                raise HTTPException(status_code=api_statuses.HTTP_409_CONFLICT, detail="Label name already exists")
             raise HTTPException(status_code=api_statuses.HTTP_500_INTERNAL_SERVER_ERROR)
         
-        return responses.Label.model_validate(updated_model, from_attributes=True)
-    
-    async def _get_lable_by_id(self, label_id: int) -> Any:
-        model = await self.label_repo.get_by_id(label_id)
         if model is None:
             raise HTTPException(status_code=api_statuses.HTTP_404_NOT_FOUND, detail="Label not found")
-        return model
+        
+        return responses.Label.model_validate(model, from_attributes=True)
 
     
-def get_label_service(session: AsyncSession = Depends(get_session)) -> LabelService:
+def get_label_service(session: AsyncSession = Depends(get_unit_of_work, scope="function")) -> LabelService:
     repo = LabelRepository(session)
     return LabelService(repo)
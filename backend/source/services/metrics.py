@@ -0,0 +1,29 @@
+from dataclasses import asdict
+
+from ..db.dbase import get_pool_stats
+
+from ..schemas.metrics import responses
+
+from .reminders import REMINDER_SCHEDULER
+from .task_cache import TASK_RESULT_CACHE
+
+
+class MetricsService:
+
+    async def get_pool_stats(self) -> responses.PoolStats:
+        return responses.PoolStats.model_validate(get_pool_stats())
+
+    async def get_cache_stats(self) -> responses.CacheStats:
+        if TASK_RESULT_CACHE is None:
+            return responses.CacheStats()
+        return responses.CacheStats.model_validate(await TASK_RESULT_CACHE.backend.stats())
+
+
+    async def get_reminder_stats(self) -> responses.ReminderStats:
+        if REMINDER_SCHEDULER is None:
+            return responses.ReminderStats()
+        return responses.ReminderStats(enabled=True, **asdict(REMINDER_SCHEDULER.stats))
+
+
+def get_metrics_service() -> MetricsService:
+    return MetricsService()
@@ -1,46 +1,64 @@
 from fastapi import Depends, HTTPException
 from fastapi import status as api_statuses
+from sqlalchemy import exc
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..db.repositories import AbstractRepository, PriorityRepository
-from ..db.dbase import get_session
+from ..db.repositories import AbstractRepository, PriorityRepository, is_unique_violation
+from ..db.dbase import get_unit_of_work
 
 from ..schemas.priority import params, responses
 
+from .reference import REFERENCE_CACHE, ReferenceCache
+from . import formats
+
 
 class PriorityService:
     
-    def __init__(self, priority_repo: AbstractRepository):
+    def __init__(self, priority_repo: AbstractRepository, cache: ReferenceCache = REFERENCE_CACHE):
         self.priority_repo: AbstractRepository = priority_repo
+        self.cache = cache
 
     async def create_priority(self, parameters: params.CreatePriority) -> responses.Priority:
-        model = await self.priority_repo.new(name=parameters.name)
+        try:
+            model = await self.priority_repo.insert_returning(name=parameters.name)
+        except exc.IntegrityError as e:
+            if is_unique_violation(e):
+                raise HTTPException(status_code=api_statuses.HTTP_409_CONFLICT, detail="Priority name already exists")
+            raise HTTPException(status_code=api_statuses.HTTP_500_INTERNAL_SERVER_ERROR)
+        
         if model is None:
             raise HTTPException(status_code=api_statuses.HTTP_500_INTERNAL_SERVER_ERROR)
         
         return responses.Priority.model_validate(model, from_attributes=True)
     
     async def delete_priority(self, priority_id: int) -> responses.Priority:
-        model = await self.priority_repo.get_by_id(priority_id)
+        try:
+            model = await self.priority_repo.delete_by_id_returning(priority_id)
+        except exc.IntegrityError:
+            raise HTTPException(status_code=api_statuses.HTTP_500_INTERNAL_SERVER_ERROR)
+        
         if model is None:
             raise HTTPException(status_code=api_statuses.HTTP_404_NOT_FOUND, detail="Priority not found")
         
-        status = await self.priority_repo.delete(model)
-        return (
-            responses.Priority.model_validate(model, from_attributes=True)
-            if status else 
-            None
-        )
-    
+        return responses.Priority.model_validate(model, from_attributes=True)
+
     async def get_priorities(self, parameters: params.GetPriorities) -> responses.GetPriorities:
         items = list()
         
-        db_response = await self.priority_repo.select_all()
+        db_response = await self.cache.get("priorities", self.priority_repo.select_all)
         for model in db_response:
             items.append(responses.Priority.model_validate(model, from_attributes=True))
             
         return responses.GetPriorities(items=items)
+    
+    async def encode_priorities(self, media_type: str = formats.JSON) -> bytes:
+        # JSON is assembled by Postgres; the binary formats are built from the cached rows.
+        if media_type != formats.JSON:
+            models = await self.cache.get("priorities", self.priority_repo.select_all)
+            return formats.encode_models(media_type, responses.Priority, models)
+        items = await self.priority_repo.select_all_json(*responses.Priority.model_fields)
+        return b'{"items":' + items.encode() + b'}'
 
-def get_priority_service(session: AsyncSession = Depends(get_session)) -> PriorityService:
+def get_priority_service(session: AsyncSession = Depends(get_unit_of_work, scope="function")) -> PriorityService:
     repo = PriorityRepository(session)
     return PriorityService(repo)
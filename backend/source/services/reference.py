@@ -0,0 +1,75 @@
+import os
+import time
+
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+
+from ..db.changes import Change, subscribe
+from ..db.models import Label, Status, Priority
+
+
+REFERENCE_CACHE_TTL = float(os.getenv("REFERENCE_CACHE_TTL", 60))
+REFERENCE_TABLES = {model.__tablename__ for model in (Label, Status, Priority)}
+
+Loader = Callable[[], Awaitable[list[Any]]]
+
+
+@dataclass(frozen=True)
+class Reference:
+    id: int
+    name: str
+
+
+@dataclass
+class _Entry:
+    version: int
+    expires_at: float
+    rows: dict[int, Reference] = field(default_factory=dict)
+
+
+class ReferenceCache:
+
+    def __init__(self, ttl: float = REFERENCE_CACHE_TTL):
+        self.ttl = ttl
+        self._versions: dict[str, int] = {}
+        self._entries: dict[str, _Entry] = {}
+
+    def version(self, table: str) -> int:
+        return self._versions.get(table, 0)
+
+    def invalidate(self, table: str):
+        self._versions[table] = self.version(table) + 1
+        self._entries.pop(table, None)
+
+    def on_changes(self, changes: list[Change]):
+        for table in {change.table for change in changes}:
+            if table in REFERENCE_TABLES:
+                self.invalidate(table)
+
+    async def get(self, table: str, load: Loader) -> list[Reference]:
+        return list((await self._rows(table, load)).values())
+
+    async def contains(self, table: str, id: int, load: Loader) -> bool:
+        if id in await self._rows(table, load):
+            return True
+
+        # A miss may only mean another process added the row; reload once before rejecting it.
+        self.invalidate(table)
+        return id in await self._rows(table, load)
+
+    async def _rows(self, table: str, load: Loader) -> dict[int, Reference]:
+        entry = self._entries.get(table)
+        if entry is not None and entry.version == self.version(table) and entry.expires_at > time.monotonic():
+            return entry.rows
+
+        version = self.version(table)
+        # Plain values, not ORM instances: those stay bound to the loading request's session and
+        # expire when it rolls back.
+        rows = {row.id: Reference(row.id, row.name) for row in await load()}
+        if version == self.version(table):
+            self._entries[table] = _Entry(version, time.monotonic() + self.ttl, rows)
+        return rows
+
+
+REFERENCE_CACHE = ReferenceCache()
+subscribe(REFERENCE_CACHE.on_changes)
@@ -0,0 +1,226 @@
+import asyncio
+import logging
+import os
+import smtplib
+import time
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from email.message import EmailMessage
+from typing import Any, Callable, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from ..db.dbase import SESSION_MAKER
+from ..db.repositories import TaskRepository
+from ..db.repositories.task import TERMINAL_STATUSES
+
+from ..schemas.task import responses
+
+
+REMINDER_SINK = os.getenv("TASKS_REMINDER_SINK", "log")
+REMINDER_INTERVAL = float(os.getenv("TASKS_REMINDER_INTERVAL", 60))
+REMINDER_BATCH_SIZE = int(os.getenv("TASKS_REMINDER_BATCH_SIZE", 100))
+REMINDER_LEAD = timedelta(minutes=float(os.getenv("TASKS_REMINDER_LEAD_MINUTES", 60)))
+REMINDER_GRACE = timedelta(hours=float(os.getenv("TASKS_REMINDER_GRACE_HOURS", 24)))
+REMINDER_FILE = os.getenv("TASKS_REMINDER_FILE", "reminders.ndjson")
+SMTP_HOST = os.getenv("SMTP_HOST", "localhost")
+SMTP_PORT = int(os.getenv("SMTP_PORT", 1025))
+SMTP_TIMEOUT = float(os.getenv("SMTP_TIMEOUT", 10))
+REMINDER_FROM = os.getenv("TASKS_REMINDER_FROM", "tasks@localhost")
+REMINDER_TO = os.getenv("TASKS_REMINDER_TO", "team@localhost")
+
+
+@dataclass
+class ReminderStats:
+    scans: int = 0
+    batches: int = 0
+    sent: int = 0
+    skipped: int = 0
+    failures: int = 0
+    last_scan_at: datetime | None = None
+    last_scan_seconds: float = 0.0
+    last_batch_size: int = 0
+    max_batch_size: int = 0
+    lag_seconds: float = 0.0
+    throughput: float = 0.0
+
+
+class ReminderSink(ABC):
+
+    @abstractmethod
+    async def send(self, reminders: list[responses.Task]):
+        raise NotImplementedError
+
+
+class LogSink(ReminderSink):
+
+    async def send(self, reminders: list[responses.Task]):
+        for reminder in reminders:
+            logging.info(f"Task {reminder.task_id} is due {reminder.deadline}: {reminder.description}")
+
+
+class FileSink(ReminderSink):
+
+    def __init__(self, path: str = REMINDER_FILE):
+        self.path = path
+
+    async def send(self, reminders: list[responses.Task]):
+        lines = "".join(reminder.model_dump_json() + "\n" for reminder in reminders)
+        await asyncio.to_thread(self._append, lines)
+
+    def _append(self, lines: str):
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.write(lines)
+
+
+class SmtpSink(ReminderSink):
+
+    def __init__(
+        self,
+        host: str = SMTP_HOST,
+        port: int = SMTP_PORT,
+        sender: str = REMINDER_FROM,
+        recipient: str = REMINDER_TO,
+        timeout: float = SMTP_TIMEOUT,
+    ):
+        self.host = host
+        self.port = port
+        self.sender = sender
+        self.recipient = recipient
+        self.timeout = timeout
+
+    async def send(self, reminders: list[responses.Task]):
+        # smtplib blocks; one connection per batch keeps the handshake off the per-task cost.
+        await asyncio.to_thread(self._send, [self.message(reminder) for reminder in reminders])
+
+    def message(self, reminder: responses.Task) -> EmailMessage:
+        message = EmailMessage()
+        message["From"] = self.sender
+        message["To"] = self.recipient
+        message["Subject"] = f"Task {reminder.task_id} is due {reminder.deadline:%Y-%m-%d %H:%M}"
+        details = [f"{name}: {value}" for name, value in (
+            ("Status", reminder.status), ("Priority", reminder.priority), ("Label", reminder.label),
+        ) if value is not None]
+        message.set_content("\n".join([reminder.description, "", *details]))
+        return message
+
+    def _send(self, messages: list[EmailMessage]):
+        with smtplib.SMTP(self.host, self.port, timeout=self.timeout) as smtp:
+            for message in messages:
+                smtp.send_message(message)
+
+
+def create_sink(name: str = REMINDER_SINK) -> ReminderSink | None:
+    if name == "log":
+        return LogSink()
+    if name == "file":
+        return FileSink()
+    if name == "smtp":
+        return SmtpSink()
+    return None
+
+
+class ReminderScheduler:
+
+    def __init__(
+        self,
+        sink: ReminderSink,
+        session_maker: async_sessionmaker[AsyncSession] = SESSION_MAKER,
+        interval: float = REMINDER_INTERVAL,
+        batch_size: int = REMINDER_BATCH_SIZE,
+        lead: timedelta = REMINDER_LEAD,
+        grace: timedelta = REMINDER_GRACE,
+        clock: Callable[[], datetime] = datetime.now,
+    ):
+        self.sink = sink
+        self.session_maker = session_maker
+        self.interval = interval
+        self.batch_size = batch_size
+        self.lead = lead
+        self.grace = grace
+        self.clock = clock
+        self.stats = ReminderStats()
+        self._task: asyncio.Task | None = None
+
+    async def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def scan(self) -> int:
+        # Tasks enter the window `lead` before their deadline; ones overdue by more than `grace`
+        # are left alone so enabling reminders does not flood the sink with a backlog.
+        now = self.clock()
+        started = time.perf_counter()
+        claimed = 0
+        after: tuple[datetime, int] | None = None
+        while True:
+            rows = await self._claim_batch(now - self.grace, now + self.lead, after)
+            claimed += len(rows)
+            if len(rows) < self.batch_size:
+                break
+            after = (rows[-1].deadline, rows[-1].id)
+
+        elapsed = time.perf_counter() - started
+        self.stats.scans += 1
+        self.stats.last_scan_at = now
+        self.stats.last_scan_seconds = elapsed
+        self.stats.throughput = claimed / elapsed if elapsed > 0 else 0.0
+        return claimed
+
+    async def _claim_batch(
+        self, since: datetime, until: datetime, after: tuple[datetime, int] | None
+    ) -> Sequence[Any]:
+        # Claim, send and mark in one transaction: a failed send rolls back and is retried on the
+        # next scan, while the row locks keep other workers off the batch meanwhile.
+        async with self.session_maker() as session:
+            repository = TaskRepository(session)
+            rows = await repository.claim_reminders(since, until, self.batch_size, after)
+            if not rows:
+                return rows
+
+            reminders = [
+                responses.Task.model_validate(row, from_attributes=True)
+                for row in rows if row.status not in TERMINAL_STATUSES
+            ]
+            if reminders:
+                await self.sink.send(reminders)
+            await repository.mark_reminded([row.id for row in rows])
+
+        sent_at = self.clock()
+        self.stats.batches += 1
+        self.stats.sent += len(reminders)
+        self.stats.skipped += len(rows) - len(reminders)
+        self.stats.last_batch_size = len(rows)
+        self.stats.max_batch_size = max(self.stats.max_batch_size, len(rows))
+        self.stats.lag_seconds = max(
+            0.0, max((sent_at - (row.deadline - self.lead)).total_seconds() for row in rows)
+        )
+        return rows
+
+    async def _run(self):
+        while True:
+            try:
+                await self.scan()
+            except Exception as e:
+                self.stats.failures += 1
+                logging.error(f"Reminder scan failed: {e}")
+            await asyncio.sleep(self.interval)
+
+
+def create_scheduler(name: str = REMINDER_SINK) -> ReminderScheduler | None:
+    sink = create_sink(name)
+    return ReminderScheduler(sink) if sink is not None else None
+
+
+REMINDER_SCHEDULER = create_scheduler()
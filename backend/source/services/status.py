@@ -1,47 +1,66 @@
 from fastapi import Depends, HTTPException
 from fastapi import status as api_statuses
 
+from sqlalchemy import exc
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..db.repositories import AbstractRepository, StatusRepository
-from ..db.dbase import get_session
+from ..db.repositories import AbstractRepository, StatusRepository, is_unique_violation
+from ..db.dbase import get_unit_of_work
 
 from ..schemas.status import params, responses
 
+from .reference import REFERENCE_CACHE, ReferenceCache
+from . import formats
+
 
 class StatusService:
     
-    def __init__(self, status_repo: AbstractRepository):
+    def __init__(self, status_repo: AbstractRepository, cache: ReferenceCache = REFERENCE_CACHE):
         self.status_repo: AbstractRepository = status_repo
+        self.cache = cache
         
     async def create_status(self, parametes: params.CreateStatus) -> responses.Status:
-        model = await self.status_repo.new(name=parametes.name)
+        try:
+            model = await self.status_repo.insert_returning(name=parametes.name)
+        except exc.IntegrityError as e:
+            if is_unique_violation(e):
+                raise HTTPException(status_code=api_statuses.HTTP_409_CONFLICT, detail="Status name already exists")
+            raise HTTPException(status_code=api_statuses.HTTP_500_INTERNAL_SERVER_ERROR)
+        
         if model is None:
             raise HTTPException(status_code=api_statuses.HTTP_500_INTERNAL_SERVER_ERROR)
         
         return responses.Status.model_validate(model, from_attributes=True)
         
     async def delete_status(self, status_id: int) -> responses.Status:
-        model = await self.status_repo.get_by_id(status_id)
+        try:
+            model = await self.status_repo.delete_by_id_returning(status_id)
+        except exc.IntegrityError:
+            raise HTTPException(status_code=api_statuses.HTTP_500_INTERNAL_SERVER_ERROR)
+        
         if model is None:
             raise HTTPException(status_code=api_statuses.HTTP_404_NOT_FOUND, detail="Status not found")
         
-        status = await self.status_repo.delete(model)
-        if not status:
-            raise HTTPException(status_code=api_statuses.HTTP_500_INTERNAL_SERVER_ERROR)
-        
         return responses.Status.model_validate(model, from_attributes=True)
 
     async def get_statuses(self, parameters: params.GetStatuses) ->  responses.GetStatuses:
         items = list()
         
-        db_response = await self.status_repo.select_all()
+        db_response = await self.cache.get("statuses", self.status_repo.select_all)
         for model in db_response:
             items.append(responses.Status.model_validate(model, from_attributes=True))
             
         return responses.GetStatuses(items=items)
     
+    async def encode_statuses(self, media_type: str = formats.JSON) -> bytes:
+        # JSON is assembled by Postgres; the binary formats are built from the cached rows.
+        if media_type != formats.JSON:
+            models = await self.cache.get("statuses", self.status_repo.select_all)
+            return formats.encode_models(media_type, responses.Status, models)
+        items = await self.status_repo.select_all_json(*responses.Status.model_fields)
+        return b'{"items":' + items.encode() + b'}'
+    
 
-def get_status_service(session: AsyncSession = Depends(get_session)) -> StatusService:
+def get_status_service(session: AsyncSession = Depends(get_unit_of_work, scope="function")) -> StatusService:
     repo = StatusRepository(session)
     return StatusService(repo)
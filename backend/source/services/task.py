@@ -1,63 +1,431 @@
+import csv
+import io
+import json
+
+from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+from typing import Any, AsyncIterator, Callable, Iterable
+
+import orjson
+
 from fastapi import Depends, HTTPException
 from fastapi import status as api_statuses
+from pydantic import TypeAdapter
 
+from sqlalchemy import exc
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..db.repositories import AbstractRepository, TaskRepository
-from ..db.dbase import get_session
+from ..db.repositories import AbstractRepository, TaskRepository, LabelRepository, StatusRepository, PriorityRepository
+from ..db.repositories.task import list_fields
+from ..db.dbase import get_session, get_unit_of_work
 
 from ..schemas.task import params, responses
 
+from .pagination import encode_cursor, decode_cursor
+from . import formats
+from .reference import REFERENCE_CACHE, ReferenceCache
+from .task_cache import TASK_RESULT_CACHE, TaskResultCache
+
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+EXPORT_FIELDS = ("task_id", "status", "priority", "label", "created_at", "deadline", "description")
+
+# responses.Task field order; rows are database Rows or dicts from the result cache.
+TASK_FIELDS = EXPORT_FIELDS
+TASKS_ADAPTER = TypeAdapter(list[responses.Task])
+
+
+@lru_cache(maxsize=None)
+def task_values(fields: tuple[str, ...] = TASK_FIELDS) -> Callable[[Any], tuple[Any, ...]]:
+    # One getter per fields= selection; task_id is stored as id.
+    names = ["id" if field == "task_id" else field for field in fields]
+    from_row, from_dict = attrgetter(*names), itemgetter(*names)
+    if len(names) == 1:
+        # Single-name getters return the bare value.
+        return lambda row: (from_dict(row) if isinstance(row, dict) else from_row(row),)
+    return lambda row: from_dict(row) if isinstance(row, dict) else from_row(row)
+
+
+def task_item(row: Any, fields: tuple[str, ...] = TASK_FIELDS) -> dict[str, Any]:
+    return dict(zip(fields, task_values(fields)(row)))
+
+
+def _export_values(row: Any) -> tuple[Any, ...]:
+    return (
+        row.id,
+        row.status,
+        row.priority,
+        row.label,
+        row.created_at.isoformat(),
+        row.deadline.isoformat() if row.deadline is not None else None,
+        row.description,
+    )
+
+
+def encode_ndjson(rows: Iterable[Any]) -> bytes:
+    lines = (json.dumps(dict(zip(EXPORT_FIELDS, _export_values(row)))) + "\n" for row in rows)
+    return "".join(lines).encode()
+
+
+def encode_csv(rows: Iterable[tuple[Any, ...]]) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue().encode()
+
 
 class TaskService:
     
-    def __init__(self, task_repo: AbstractRepository):
+    def __init__(
+        self,
+        task_repo: AbstractRepository,
+        reference_repos: dict[str, AbstractRepository] | None = None,
+        cache: ReferenceCache = REFERENCE_CACHE,
+        result_cache: TaskResultCache | None = None,
+    ):
         self.task_repo = task_repo
+        self.reference_repos = reference_repos or {}
+        self.cache = cache
+        self.result_cache = result_cache
     
     async def get_tasks(self, parameters: params.GetTasks) -> responses.GetTasks:
-        items = list()
-        
-        db_response = await self.task_repo.get_tasks(parameters)
-        for model in db_response:
-            items.append(
-                responses.Task.model_validate(model, from_attributes=True)
+        rows, next_cursor, prev_cursor = await self._tasks_page(parameters)
+        return responses.GetTasks(
+            items=TASKS_ADAPTER.validate_python(rows, from_attributes=True),
+            next_cursor=next_cursor,
+            prev_cursor=prev_cursor,
+        )
+    
+    async def encode_tasks(
+        self, parameters: params.GetTasks, passthrough: bool = False, media_type: str = formats.JSON
+    ) -> bytes:
+        # Same document as get_tasks, without building a model per row and validating it again on the way out.
+        if passthrough and media_type == formats.JSON:
+            return await self._encode_tasks_json(parameters)
+        rows, next_cursor, prev_cursor = await self._tasks_page(parameters)
+        fields = list_fields(parameters)
+        values = task_values(fields)
+        if media_type in formats.COLUMNAR:
+            # Columnar formats have no envelope; the cursors go in the schema metadata.
+            return formats.encode_columns(
+                media_type, responses.Task, list(zip(*map(values, rows))),
+                {"next_cursor": next_cursor, "prev_cursor": prev_cursor}, fields,
             )
+        return formats.encode_document(media_type, {
+            "items": [dict(zip(fields, values(row))) for row in rows],
+            "next_cursor": next_cursor,
+            "prev_cursor": prev_cursor,
+        })
+    
+    async def _encode_tasks_json(self, parameters: params.GetTasks) -> bytes:
+        # Postgres assembles the items array and only the cursors are added here; the text is spliced
+        # in unparsed, so this path skips the result cache, which holds rows rather than documents.
+        after, before = self._page_bounds(parameters)
+        items, has_more, first_id, last_id = await self.task_repo.get_tasks_json(parameters, after=after, before=before)
+        next_cursor, prev_cursor = self._page_cursors(first_id, last_id, has_more, after, before)
+        return (
+            b'{"items":' + items.encode()
+            + b',"next_cursor":' + orjson.dumps(next_cursor)
+            + b',"prev_cursor":' + orjson.dumps(prev_cursor) + b'}'
+        )
+    
+    async def _tasks_page(self, parameters: params.GetTasks) -> tuple[list[Any], str | None, str | None]:
+        after, before = self._page_bounds(parameters)
+        if self.result_cache is not None:
+            rows = await self.result_cache.get_tasks(self.task_repo, parameters, after=after, before=before)
+        else:
+            rows = list(await self.task_repo.get_tasks(parameters, after=after, before=before))
+        has_more = len(rows) > parameters.limit
+        rows = rows[:parameters.limit]
+        if before is not None:
+            rows.reverse()
+        
+        if not rows:
+            return rows, None, None
+        return rows, *self._page_cursors(self._row_id(rows[0]), self._row_id(rows[-1]), has_more, after, before)
+    
+    async def search_tasks(self, parameters: params.SearchTasks) -> responses.SearchTasks:
+        after = self._decode_keyset(parameters.after, (int, float), int)
+        rows = list(await self.task_repo.search_tasks(parameters, after=after))
+        has_more = len(rows) > parameters.limit
+        rows = rows[:parameters.limit]
+        
+        return responses.SearchTasks(
+            items=[responses.SearchHit.model_validate(row, from_attributes=True) for row in rows],
+            next_cursor=encode_cursor(rows[-1].rank, rows[-1].id) if has_more else None,
+        )
+    
+    async def get_due_tasks(self, parameters: params.DueTasks) -> responses.DueTasks:
+        after = self._decode_keyset(parameters.after, str, int)
+        if after is not None:
+            try:
+                after = (datetime.fromisoformat(after[0]), after[1])
+            except ValueError:
+                raise HTTPException(status_code=api_statuses.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+        
+        rows = list(await self.task_repo.get_due_tasks(parameters, after=after))
+        has_more = len(rows) > parameters.limit
+        rows = rows[:parameters.limit]
+        
+        return responses.DueTasks(
+            items=[responses.Task.model_validate(row, from_attributes=True) for row in rows],
+            next_cursor=encode_cursor(rows[-1].deadline.isoformat(), rows[-1].id) if has_more else None,
+        )
+    
+    async def typeahead(self, parameters: params.Typeahead) -> responses.Typeahead:
+        rows = await self.task_repo.typeahead(parameters.q, parameters.limit, parameters.threshold)
+        return responses.Typeahead(items=[responses.Suggestion.model_validate(row, from_attributes=True) for row in rows])
+    
+    async def get_stats(self, parameters: params.TaskStats) -> responses.TaskStats:
+        stats = responses.TaskStats()
+        for row in await self.task_repo.get_stats(parameters.recent):
+            if row.dimension is not None:
+                getattr(stats, f"by_{row.dimension}").append(
+                    responses.GroupCount(id=row.id, name=row.name, count=row.total)
+                )
+                continue
             
-        return responses.GetTasks(items=items)
+            stats.total, stats.overdue, stats.due_this_week = row.total, row.overdue, row.due_this_week
+            stats.recent = [responses.Task.model_validate(task) for task in row.recent]
+            stats.labels, stats.statuses, stats.priorities = row.labels, row.statuses, row.priorities
+        return stats
+    
+    async def count_tasks(self, parameters: params.TaskFilters) -> responses.TaskCount:
+        filters = await self.task_repo.resolve_filters(parameters)
+        if filters is None:
+            return responses.TaskCount(count=0)
+        return responses.TaskCount(count=await self.task_repo.count(**filters))
+    
+    async def get_changes(self, parameters: params.GetTaskChanges) -> responses.TaskChanges:
+        after = self._decode_keyset(parameters.after, int, int)
+        safe, compacted = await self.task_repo.get_change_horizons()
+        since = parameters.since
+        if since is None or since < compacted:
+            # Reload everything, then ask for changes since this version.
+            return responses.TaskChanges(items=[], deleted=[], version=safe, resync_required=True)
+        
+        start = after or (since, 0)
+        upserts, tombstones = await self.task_repo.get_changes(start, safe, parameters.limit + 1)
+        changes = sorted(
+            [(row.version, row.id, row) for row in upserts] + [(row.version, row.id, None) for row in tombstones],
+            key=lambda change: change[:2],
+        )
+        page = changes[:parameters.limit]
+        has_more = len(changes) > parameters.limit
+        
+        return responses.TaskChanges(
+            items=[responses.Task.model_validate(row, from_attributes=True) for *_, row in page if row is not None],
+            deleted=[id for _, id, row in page if row is None],
+            version=since if has_more else safe,
+            next_cursor=encode_cursor(*page[-1][:2]) if has_more else None,
+        )
+    
+    async def export_tasks(self, parameters: params.ExportTasks) -> AsyncIterator[bytes]:
+        if parameters.format == "csv":
+            yield encode_csv([EXPORT_FIELDS])
+        
+        async for rows in self.task_repo.stream_tasks(parameters):
+            if parameters.format == "csv":
+                yield encode_csv(_export_values(row) for row in rows)
+            else:
+                yield encode_ndjson(rows)
     
     async def create_task(self, parameters: params.CreateTask) -> responses.Task:
-        model = await self.task_repo.new(**parameters.model_dump())
+        values = parameters.model_dump()
+        await self._check_references(values)
+        try:
+            model = await self.task_repo.insert_returning(**values)
+        except exc.IntegrityError:
+            raise HTTPException(status_code=api_statuses.HTTP_500_INTERNAL_SERVER_ERROR)
+        
         if model is None:
             raise HTTPException(status_code=api_statuses.HTTP_500_INTERNAL_SERVER_ERROR)
         
         return responses.Task.model_validate(model, from_attributes=True)
     
     async def delete_task(self, task_id: int) -> responses.Task:
-        model = await self._get_model_task_by_id(task_id)
-        
-        status = await self.task_repo.delete(model)
-        if not status:
+        try:
+            model = await self.task_repo.delete_by_id_returning(task_id)
+        except exc.IntegrityError:
             raise HTTPException(status_code=api_statuses.HTTP_500_INTERNAL_SERVER_ERROR)
         
+        if model is None:
+            raise HTTPException(status_code=api_statuses.HTTP_404_NOT_FOUND, detail="Task not found")
+        
         return responses.Task.model_validate(model, from_attributes=True)
     
     async def update_task(self, parameters: params.UpdateTask, task_id: int) -> responses.Task:
-        model = await self._get_model_task_by_id(task_id)
-        
-        updated_model = await self.task_repo.update(model, **parameters.model_dump())
-        if not updated_model:
+        values = self._reschedule_reminder(parameters.model_dump(exclude_unset=True, exclude={"task_id"}))
+        await self._check_references(values)
+        try:
+            model = await self.task_repo.update_by_id_returning(task_id, **values)
+        except exc.IntegrityError:
             raise HTTPException(status_code=api_statuses.HTTP_500_INTERNAL_SERVER_ERROR)
         
-        return responses.Task.model_validate(updated_model, from_attributes=True)
-    
-    async def _get_model_task_by_id(self, task_id: int):
-        model = await self.task_repo.get_by_id(task_id)
         if model is None:
             raise HTTPException(status_code=api_statuses.HTTP_404_NOT_FOUND, detail="Task not found")
         
-        return model
+        return responses.Task.model_validate(model, from_attributes=True)
+    
+    async def bulk_create_tasks(self, parameters: params.BulkCreateTasks) -> responses.BulkResult:
+        rows = [item.model_dump() for item in parameters.items]
+        errors = await self._reference_errors(rows)
+        
+        valid = [index for index in range(len(rows)) if index not in errors]
+        ids = await self.task_repo.bulk_insert([rows[index] for index in valid]) if valid else []
+        
+        created = dict(zip(valid, ids))
+        return responses.BulkResult(items=[
+            responses.BulkItemResult(index=index, task_id=created.get(index), error=errors.get(index))
+            for index in range(len(rows))
+        ])
+    
+    async def bulk_update_tasks(self, parameters: params.BulkUpdateTasks) -> responses.BulkResult:
+        rows = [
+            {"id": item.task_id, **self._reschedule_reminder(item.model_dump(exclude_unset=True, exclude={"task_id"}))}
+            for item in parameters.items
+        ]
+        errors = await self._reference_errors(rows)
+        for index, error in self._null_errors(rows).items():
+            errors.setdefault(index, error)
+        
+        seen: set[int] = set()
+        for index, row in enumerate(rows):
+            if row["id"] in seen:
+                errors.setdefault(index, "Duplicate task_id in batch")
+            seen.add(row["id"])
+        
+        valid = [rows[index] for index in range(len(rows)) if index not in errors]
+        updated = await self.task_repo.bulk_update(valid) if valid else set()
+        
+        return responses.BulkResult(items=[
+            self._bulk_item(index, row["id"], errors.get(index), updated)
+            for index, row in enumerate(rows)
+        ])
     
+    async def bulk_delete_tasks(self, parameters: params.BulkDeleteTasks) -> responses.BulkResult:
+        deleted = await self.task_repo.bulk_delete(parameters.task_ids) if parameters.task_ids else set()
+        
+        return responses.BulkResult(items=[
+            self._bulk_item(index, task_id, None, deleted)
+            for index, task_id in enumerate(parameters.task_ids)
+        ])
+    
+    async def _check_references(self, values: dict[str, Any]):
+        for column, repo in self.reference_repos.items():
+            id = values.get(column)
+            if id is None:
+                continue
+
+            table = TaskRepository.REFERENCES[column].__tablename__
+            if not await self.cache.contains(table, id, repo.select_all):
+                raise HTTPException(
+                    status_code=api_statuses.HTTP_422_UNPROCESSABLE_CONTENT,
+                    detail=f"Unknown {column.removesuffix('_id')} {id}",
+                )
+
+    async def _reference_errors(self, rows: list[dict[str, Any]]) -> dict[int, str]:
+        errors: dict[int, str] = {}
+        found = await self.task_repo.find_reference_ids(rows)
+        for index, row in enumerate(rows):
+            for name, ids in found.items():
+                if row.get(name) is not None and row[name] not in ids:
+                    errors[index] = f"Unknown {name} {row[name]}"
+                    break
+        return errors
+    
+    @staticmethod
+    def _null_errors(rows: list[dict[str, Any]]) -> dict[int, str]:
+        # One null in a NOT NULL column would fail the whole UPDATE ... FROM VALUES statement.
+        columns = TaskRepository.MODEL.__table__.c
+        errors: dict[int, str] = {}
+        for index, row in enumerate(rows):
+            for name, value in row.items():
+                if value is None and not columns[name].nullable:
+                    errors[index] = f"{name} cannot be null"
+                    break
+        return errors
+    
+    @staticmethod
+    def _decode_cursor(cursor: str | None) -> int | None:
+        if cursor is None:
+            return None
+        try:
+            (task_id,) = decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=api_statuses.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+        if not isinstance(task_id, int):
+            raise HTTPException(status_code=api_statuses.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+        return task_id
+    
+    @staticmethod
+    def _decode_keyset(cursor: str | None, *types: type | tuple[type, ...]) -> tuple[Any, ...] | None:
+        if cursor is None:
+            return None
+        try:
+            values = decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=api_statuses.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+        if len(values) != len(types) or not all(
+            isinstance(value, kind) and not isinstance(value, bool) for value, kind in zip(values, types)
+        ):
+            raise HTTPException(status_code=api_statuses.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+        return tuple(values)
+    
+    def _page_bounds(self, parameters: params.GetTasks) -> tuple[int | None, int | None]:
+        after = self._decode_cursor(parameters.after)
+        before = self._decode_cursor(parameters.before)
+        if after is not None and before is not None:
+            raise HTTPException(
+                status_code=api_statuses.HTTP_400_BAD_REQUEST,
+                detail="Use either after or before, not both",
+            )
+        return after, before
     
-def get_task_service(session: AsyncSession = Depends(get_session)) -> TaskService:
+    @staticmethod
+    def _page_cursors(
+        first_id: int | None, last_id: int | None, has_more: bool, after: int | None, before: int | None
+    ) -> tuple[str | None, str | None]:
+        if first_id is None or last_id is None:
+            return None, None
+        next_cursor = prev_cursor = None
+        if has_more or before is not None:
+            next_cursor = encode_cursor(last_id)
+        if has_more if before is not None else after is not None:
+            prev_cursor = encode_cursor(first_id)
+        return next_cursor, prev_cursor
+    
+    @staticmethod
+    def _row_id(row: Any) -> int:
+        return row["id"] if isinstance(row, dict) else row.id
+    
+    @staticmethod
+    def _reschedule_reminder(values: dict[str, Any]) -> dict[str, Any]:
+        # A moved deadline deserves a fresh reminder.
+        if "deadline" in values:
+            values["reminder_sent_at"] = None
+        return values
+    
+    @staticmethod
+    def _bulk_item(index: int, task_id: int, error: str | None, done: set[int]) -> responses.BulkItemResult:
+        if error is None and task_id not in done:
+            error = "Task not found"
+        return responses.BulkItemResult(index=index, task_id=task_id, error=error)
+    
+    
+def get_task_service(session: AsyncSession = Depends(get_unit_of_work, scope="function")) -> TaskService:
+    repo = TaskRepository(session)
+    reference_repos = {
+        "label_id": LabelRepository(session),
+        "status_id": StatusRepository(session),
+        "priority_id": PriorityRepository(session),
+    }
+    return TaskService(repo, reference_repos, result_cache=TASK_RESULT_CACHE)
+
+
+def get_task_export_service(session: AsyncSession = Depends(get_session)) -> TaskService:
     repo = TaskRepository(session)
     return TaskService(repo)
@@ -0,0 +1,135 @@
+import hashlib
+import json
+
+from datetime import datetime
+from itertools import product
+from typing import Any
+
+from ..db.changes import Change, INSERT, UPDATE, subscribe
+from ..db.repositories import TaskRepository
+from ..db.repositories.task import FILTERS
+from ..db.versions import TABLE_VERSIONS
+
+from ..schemas.task import params
+
+from .cache import CacheBackend, create_backend
+
+
+TASK_TABLES = ("tasks", "labels", "statuses", "priorities")
+
+# Filter dimensions in tag order; "*" marks an unfiltered dimension.
+DIMENSIONS = tuple(TaskRepository.REFERENCES.items())
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Cannot encode {type(value).__name__}")
+
+
+def _filter_tag(values: tuple[Any, ...]) -> str:
+    return "tasks:filter:" + ":".join("*" if value is None else str(value) for value in values)
+
+
+def entry_tags(parameters: params.TaskFilters, filters: dict[str, int] | None, rows: list[dict[str, Any]]) -> set[str]:
+    if filters is None:
+        # Some filter name did not resolve; only a new or renamed reference row can change that.
+        return {
+            f"{TaskRepository.REFERENCES[column].__tablename__}:names"
+            for name, column in FILTERS.items()
+            if getattr(parameters, name) is not None
+        }
+
+    tags = {_filter_tag(tuple(filters.get(column) for column, _ in DIMENSIONS))}
+    tags.update(f"{model.__tablename__}:{filters[column]}" for column, model in DIMENSIONS if column in filters)
+    for row in rows:
+        tags.add(f"tasks:{row['id']}")
+        tags.update(
+            f"{model.__tablename__}:{row[column]}"
+            for column, model in DIMENSIONS
+            if row.get(column) is not None
+        )
+    return tags
+
+
+def change_tags(change: Change) -> set[str] | None:
+    if change.table == "tasks":
+        if not change.ids and not change.values:
+            return None
+
+        tags = {f"tasks:{id}" for id in change.ids}
+        for values in change.values:
+            options = [(None,) if values.get(column) is None else (None, values[column]) for column, _ in DIMENSIONS]
+            tags.update(_filter_tag(combination) for combination in product(*options))
+        return tags
+
+    if change.table in TASK_TABLES:
+        if not change.ids:
+            return None
+
+        tags = {f"{change.table}:{id}" for id in change.ids}
+        if change.op in (INSERT, UPDATE):
+            tags.add(f"{change.table}:names")
+        return tags
+
+    return set()
+
+
+class TaskResultCache:
+
+    def __init__(self, backend: CacheBackend):
+        self.backend = backend
+
+    @staticmethod
+    def key(parameters: params.GetTasks, after: int | None, before: int | None) -> str:
+        data = parameters.model_dump(mode="json", exclude={"after", "before"})
+        raw = json.dumps([data, after, before], sort_keys=True)
+        return "tasks:get:" + hashlib.sha256(raw.encode()).hexdigest()
+
+    async def get_tasks(
+        self,
+        task_repo: TaskRepository,
+        parameters: params.GetTasks,
+        after: int | None = None,
+        before: int | None = None,
+    ) -> list[dict[str, Any]]:
+        key = self.key(parameters, after, before)
+        cached = await self.backend.get(key)
+        if cached is not None:
+            return json.loads(cached)
+
+        stamp = TABLE_VERSIONS.stamp(*TASK_TABLES)
+        filters = await task_repo.resolve_filters(parameters)
+        rows = [] if filters is None else await task_repo.get_tasks(parameters, after=after, before=before, filters=filters)
+        items = [row._asdict() for row in rows]
+
+        # Skip storing a result that a commit may have made stale while it was loading.
+        if stamp == TABLE_VERSIONS.stamp(*TASK_TABLES):
+            value = json.dumps(items, default=_encode_value).encode()
+            await self.backend.set(key, value, entry_tags(parameters, filters, items))
+        return items
+
+    def on_changes(self, changes: list[Change]):
+        tags: set[str] = set()
+        for change in changes:
+            dropped = change_tags(change)
+            if dropped is None:
+                self.backend.invalidate(None)
+                return
+            tags.update(dropped)
+
+        if tags:
+            self.backend.invalidate(tags)
+
+
+def create_task_result_cache() -> TaskResultCache | None:
+    backend = create_backend()
+    if backend is None:
+        return None
+
+    cache = TaskResultCache(backend)
+    subscribe(cache.on_changes)
+    return cache
+
+
+TASK_RESULT_CACHE = create_task_result_cache()
@@ -0,0 +1,145 @@
+import asyncio
+import csv
+import json
+import time
+
+from itertools import islice
+from typing import IO, Any, Iterator
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..db.repositories import TaskRepository
+from ..db.repositories.task import COPY_COLUMNS
+from ..db.dbase import get_session
+
+from ..schemas.task import params, responses
+
+
+FORMATS = ("csv", "ndjson")
+CHUNK_SIZE = 5000
+MAX_REPORTED_ERRORS = 100
+INVALID_RECORD = "__invalid__"
+
+REFERENCE_NAMES = {
+    "label": "label_id",
+    "status": "status_id",
+    "priority": "priority_id",
+}
+
+
+def read_records(stream: IO[str], format: str) -> Iterator[dict[str, Any]]:
+    if format == "csv":
+        yield from csv.DictReader(stream)
+        return
+
+    for line in stream:
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            record = {INVALID_RECORD: f"Invalid JSON: {e}"}
+        yield record if isinstance(record, dict) else {INVALID_RECORD: "Record is not an object"}
+
+
+class TaskImporter:
+
+    def __init__(self, task_repo: TaskRepository, chunk_size: int = CHUNK_SIZE):
+        self.task_repo = task_repo
+        self.chunk_size = chunk_size
+        self._ids: dict[str, dict[str, int | None]] = {column: {} for column in REFERENCE_NAMES.values()}
+        self._known: dict[str, set[int]] = {column: set() for column in REFERENCE_NAMES.values()}
+
+    async def import_stream(self, stream: IO[str], format: str) -> responses.ImportResult:
+        started = time.perf_counter()
+        records = read_records(stream, format)
+        rows_read = rows_imported = 0
+        errors: list[responses.ImportRecordError] = []
+        # Ids given directly are checked against the reference tables as they were at the start,
+        # so a bad one rejects its row instead of failing the COPY after earlier chunks committed.
+        self._known = await self.task_repo.reference_ids()
+
+        while True:
+            chunk = await asyncio.to_thread(lambda: list(islice(records, self.chunk_size)))
+            if not chunk:
+                break
+
+            rows, chunk_errors = await self.prepare_chunk(chunk, first_record=rows_read + 1)
+            if rows:
+                rows_imported += await self.task_repo.copy_insert(rows)
+
+            rows_read += len(chunk)
+            # Every rejected row is counted, but only the first errors are kept for the report.
+            errors.extend(chunk_errors[:MAX_REPORTED_ERRORS - len(errors)])
+
+        seconds = time.perf_counter() - started
+        return responses.ImportResult(
+            rows_read=rows_read,
+            rows_imported=rows_imported,
+            rows_rejected=rows_read - rows_imported,
+            errors=errors,
+            seconds=seconds,
+            rows_per_second=rows_imported / seconds if seconds else 0.0,
+        )
+
+    async def prepare_chunk(
+        self, chunk: list[dict[str, Any]], first_record: int = 1
+    ) -> tuple[list[tuple[Any, ...]], list[responses.ImportRecordError]]:
+        await self._resolve_chunk_names(chunk)
+
+        rows, errors = [], []
+        for number, record in enumerate(chunk, start=first_record):
+            try:
+                task = params.CreateTask.model_validate(self._to_task_data(record))
+            except ValueError as e:
+                errors.append(responses.ImportRecordError(record=number, error=str(e)))
+                continue
+
+            data = task.model_dump()
+            unknown = [
+                column for column in REFERENCE_NAMES.values()
+                if data[column] is not None and data[column] not in self._known[column]
+            ]
+            if unknown:
+                errors.append(responses.ImportRecordError(record=number, error=f"Unknown {unknown[0]} {data[unknown[0]]}"))
+                continue
+
+            rows.append(tuple(data[column] for column in COPY_COLUMNS))
+
+        return rows, errors
+
+    async def _resolve_chunk_names(self, chunk: list[dict[str, Any]]):
+        for name, column in REFERENCE_NAMES.items():
+            known = self._ids[column]
+            missing = {
+                record[name] for record in chunk
+                if isinstance(record.get(name), str) and record[name] and record[name] not in known
+            }
+            if not missing:
+                continue
+
+            found = await self.task_repo.resolve_names(self.task_repo.REFERENCES[column], missing)
+            known.update({value: found.get(value) for value in missing})
+            self._known[column].update(found.values())
+
+    def _to_task_data(self, record: dict[str, Any]) -> dict[str, Any]:
+        if INVALID_RECORD in record:
+            raise ValueError(record[INVALID_RECORD])
+
+        data = {key: value for key, value in record.items() if isinstance(key, str) and value not in (None, "")}
+        for name, column in REFERENCE_NAMES.items():
+            if name not in data:
+                continue
+
+            value = data.pop(name)
+            id = self._ids[column].get(value) if isinstance(value, str) else None
+            if id is None:
+                raise ValueError(f"Unknown {name} {value!r}")
+            data[column] = id
+        return data
+
+
+def get_task_importer(session: AsyncSession = Depends(get_session)) -> TaskImporter:
+    repo = TaskRepository(session)
+    return TaskImporter(repo)
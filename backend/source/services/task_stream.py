@@ -0,0 +1,167 @@
+import asyncio
+import json
+import logging
+import os
+
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+from ..db.changes import Change, DELETE, INSERT, subscribe
+from ..db.dbase import SESSION_MAKER
+from ..db.repositories import TaskRepository
+
+from ..schemas.task import responses
+
+
+REFERENCE_TABLES = tuple(model.__tablename__ for model in TaskRepository.REFERENCES.values())
+
+STREAM_QUEUE_SIZE = int(os.getenv("TASKS_STREAM_QUEUE_SIZE", 100))
+STREAM_HEARTBEAT = float(os.getenv("TASKS_STREAM_HEARTBEAT", 15))
+STREAM_MAX_SUBSCRIBERS = int(os.getenv("TASKS_STREAM_MAX_SUBSCRIBERS", 10000))
+
+HEARTBEAT = b": ping\n\n"
+EVICTED = b"event: evicted\ndata: {}\n\n"
+
+Loader = Callable[[list[int]], Awaitable[list[Any]]]
+
+
+def format_event(event: str, data: dict[str, Any], id: int | None = None) -> bytes:
+    head = f"id: {id}\n" if id is not None else ""
+    return f"{head}event: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n".encode()
+
+
+async def load_tasks(ids: list[int]) -> list[Any]:
+    async with SESSION_MAKER() as session:
+        return list(await TaskRepository(session).get_tasks_by_ids(ids))
+
+
+class Subscription:
+
+    def __init__(self, queue_size: int):
+        self.queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize=queue_size)
+        self.evicted = False
+
+
+class TaskStreamHub:
+
+    def __init__(
+        self,
+        load: Loader = load_tasks,
+        queue_size: int = STREAM_QUEUE_SIZE,
+        heartbeat: float = STREAM_HEARTBEAT,
+        max_subscribers: int = STREAM_MAX_SUBSCRIBERS,
+    ):
+        self.load = load
+        self.queue_size = queue_size
+        self.heartbeat = heartbeat
+        self.max_subscribers = max_subscribers
+        self.subscribers: set[Subscription] = set()
+        self.evictions = 0
+        self._sequence = 0
+        self._pending: asyncio.Queue[list[Change]] | None = None
+        self._dispatcher: asyncio.Task | None = None
+
+    @property
+    def full(self) -> bool:
+        return len(self.subscribers) >= self.max_subscribers
+
+    def subscribe(self) -> Subscription:
+        subscription = Subscription(self.queue_size)
+        self.subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        self.subscribers.discard(subscription)
+
+    async def events(self) -> AsyncIterator[bytes]:
+        # Subscribe on first iteration so a response that never starts cannot leak a subscriber.
+        subscription = self.subscribe()
+        try:
+            yield HEARTBEAT
+            while True:
+                try:
+                    event = await asyncio.wait_for(subscription.queue.get(), timeout=self.heartbeat)
+                except asyncio.TimeoutError:
+                    yield HEARTBEAT
+                    continue
+                yield event
+                # The eviction notice is queued last, after the buffer is cleared; it ends the stream.
+                if event == EVICTED:
+                    break
+        finally:
+            self.unsubscribe(subscription)
+
+    def on_changes(self, changes: list[Change]):
+        # Streamed rows carry reference names, so renaming or dropping one resets the clients.
+        changes = [
+            change for change in changes
+            if change.table == "tasks" or (change.table in REFERENCE_TABLES and change.op != INSERT)
+        ]
+        if not changes or not self.subscribers:
+            return
+
+        # Row loading needs the event loop; keep commit hooks synchronous and preserve commit order.
+        if self._pending is None:
+            self._pending = asyncio.Queue()
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.get_running_loop().create_task(self._dispatch())
+        self._pending.put_nowait(changes)
+
+    def broadcast(self, event: bytes):
+        for subscription in list(self.subscribers):
+            try:
+                subscription.queue.put_nowait(event)
+            except asyncio.QueueFull:
+                self._evict(subscription)
+
+    async def _dispatch(self):
+        assert self._pending is not None
+        while not self._pending.empty():
+            changes = self._pending.get_nowait()
+            try:
+                for event in await self._events_for(changes):
+                    self.broadcast(event)
+            except Exception as e:
+                logging.error(f"Task stream dispatch failed: {e}")
+                self.broadcast(self._event("reset", {}))
+
+    async def _events_for(self, changes: list[Change]) -> list[bytes]:
+        if any(change.table != "tasks" or not change.ids for change in changes):
+            return [self._event("reset", {})]
+
+        deleted: set[int] = set()
+        upserted: set[int] = set()
+        for change in changes:
+            if change.op == DELETE:
+                deleted.update(change.ids)
+                upserted.difference_update(change.ids)
+            else:
+                upserted.update(change.ids)
+                deleted.difference_update(change.ids)
+
+        events = []
+        if upserted:
+            rows = await self.load(sorted(upserted))
+            items = [responses.Task.model_validate(row, from_attributes=True).model_dump(mode="json") for row in rows]
+            deleted.update(upserted - {item["task_id"] for item in items})
+            if items:
+                events.append(self._event("upsert", {"items": items}))
+        if deleted:
+            events.append(self._event("delete", {"ids": sorted(deleted)}))
+        return events
+
+    def _event(self, event: str, data: dict[str, Any]) -> bytes:
+        self._sequence += 1
+        return format_event(event, data, self._sequence)
+
+    def _evict(self, subscription: Subscription):
+        # Make room for the eviction notice; the client reloads the full list on reconnect.
+        while not subscription.queue.empty():
+            subscription.queue.get_nowait()
+        subscription.evicted = True
+        subscription.queue.put_nowait(EVICTED)
+        self.subscribers.discard(subscription)
+        self.evictions += 1
+
+
+TASK_STREAM_HUB = TaskStreamHub()
+subscribe(TASK_STREAM_HUB.on_changes)
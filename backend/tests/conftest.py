@@ -12,10 +12,13 @@ from faker import Faker
 
 # Set test environment
 os.environ["APP_ENV"] = "test"
+# Tables are recreated per test, so cached results must not outlive one
+os.environ.setdefault("CACHE_BACKEND", "none")
 
 from source.db.models.base import Base
 from source.db.models import Task, Priority, Status, Label, User
-from source.db.dbase import get_session
+from source.db.changes import SERVER_SETTINGS
+from source.db.dbase import get_session, get_unit_of_work
 from source.api.app import app
 
 
@@ -28,6 +31,7 @@ test_engine = create_async_engine(
     TEST_DATABASE_URL,
     poolclass=NullPool,
     echo=False,
+    connect_args={"server_settings": SERVER_SETTINGS},
 )
 
 test_async_session_maker = async_sessionmaker(
@@ -74,6 +78,7 @@ async def async_client(test_session: AsyncSession) -> AsyncGenerator[AsyncClient
         yield test_session
     
     app.dependency_overrides[get_session] = override_get_session
+    app.dependency_overrides[get_unit_of_work] = override_get_session
     
     async with AsyncClient(
         transport=ASGITransport(app=app),
@@ -0,0 +1,79 @@
+"""
+Integration tests for change notifications sent on commit
+"""
+import asyncio
+
+import asyncpg
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from source.db.changes import INSERT, NOTIFY_CHANNEL, NOTIFY_MAX_PAYLOAD, ORIGIN, UPDATE, Change, decode_changes
+from source.db.repositories import LabelRepository, TaskRepository
+
+
+@pytest.mark.integration
+class TestChangeNotifications:
+    """Test repositories NOTIFY other workers only for committed changes."""
+
+    @pytest.fixture
+    async def notifications(self, test_db):
+        """Listen on the change channel with a separate connection."""
+        received: asyncio.Queue = asyncio.Queue()
+        connection = await asyncpg.connect(
+            user="test_user", password="test_password", host="localhost", port=5433, database="test_taskmanager"
+        )
+        await connection.add_listener(NOTIFY_CHANNEL, lambda *args: received.put_nowait(args[-1]))
+        yield received
+        await connection.close()
+
+    async def test_commit_notifies(self, test_session: AsyncSession, notifications):
+        """Test a committed insert is announced with its table and id."""
+        # Act
+        label = await LabelRepository(test_session).insert_returning(name="Notified")
+
+        # Assert
+        payload = await asyncio.wait_for(notifications.get(), timeout=5)
+        origin, changes = decode_changes(payload)
+        assert origin == ORIGIN
+        assert [(change.table, change.op, change.ids) for change in changes] == [("labels", INSERT, (label.id,))]
+
+    async def test_update_sends_moved_values(self, test_session: AsyncSession, test_task, test_label, notifications):
+        """Test task updates carry the new reference ids only when they moved."""
+        # Arrange
+        repository = TaskRepository(test_session)
+
+        # Act
+        await repository.bulk_update([{"id": test_task.id, "description": "renamed"}])
+        await repository.bulk_update([{"id": test_task.id, "label_id": test_label.id, "status_id": None}])
+
+        # Assert
+        first = decode_changes(await asyncio.wait_for(notifications.get(), timeout=5))[1]
+        second = decode_changes(await asyncio.wait_for(notifications.get(), timeout=5))[1]
+        assert first == [Change("tasks", UPDATE, (test_task.id,))]
+        values = {"label_id": test_label.id, "status_id": None, "priority_id": test_task.priority_id}
+        assert second == [Change("tasks", UPDATE, (test_task.id,), (values,))]
+
+    async def test_large_statement_fits_payload_limit(self, test_session: AsyncSession, notifications):
+        """Test a statement touching too many rows is announced for the whole table."""
+        # Act
+        await test_session.execute(text("INSERT INTO labels (name) SELECT 'bulk-' || i FROM generate_series(1, 3000) i"))
+        await test_session.commit()
+
+        # Assert
+        payload = await asyncio.wait_for(notifications.get(), timeout=5)
+        assert len(payload) <= NOTIFY_MAX_PAYLOAD
+        assert decode_changes(payload)[1] == [Change("labels", INSERT)]
+
+    async def test_rollback_does_not_notify(self, test_session: AsyncSession, notifications):
+        """Test changes rolled back before commit are never announced."""
+        # Arrange
+        test_session.info["unit_of_work"] = True
+
+        # Act
+        await LabelRepository(test_session).insert_returning(name="Discarded")
+        await test_session.rollback()
+
+        # Assert
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(notifications.get(), timeout=0.5)
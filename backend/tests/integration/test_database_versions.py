@@ -0,0 +1,75 @@
+"""
+Integration tests for the database-derived ETag stamps
+"""
+from datetime import datetime
+
+import pytest
+from sqlalchemy import delete, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from source.api.tasks.api_settings import ETAG_TABLES
+from source.db.models import Label, Task
+from source.db.versions import DatabaseVersions
+from tests.conftest import test_async_session_maker
+
+
+async def _stamp(*tables: str) -> str:
+    # A fresh session per read, like a request served by any worker.
+    async with test_async_session_maker() as session:
+        return await DatabaseVersions(session).stamp(*tables)
+
+
+async def _insert_task(session: AsyncSession, description: str, label_id: int | None = None):
+    await session.execute(
+        Task.__table__.insert().values(description=description, label_id=label_id, created_at=datetime.now())
+    )
+
+
+@pytest.mark.integration
+class TestDatabaseVersions:
+    """Test stamps agree across sessions and change with every committed write."""
+
+    async def test_stamp_is_shared_across_sessions(self, test_session: AsyncSession, test_task, test_label):
+        """Test two sessions read the same stamp while nothing changes."""
+        # Act
+        first = await _stamp(*ETAG_TABLES)
+        second = await _stamp(*ETAG_TABLES)
+
+        # Assert
+        assert first == second
+
+    async def test_writes_change_stamp(self, test_session: AsyncSession, test_task, test_label):
+        """Test updates, deletes and reference renames each produce a new stamp."""
+        # Arrange
+        stamps = [await _stamp(*ETAG_TABLES)]
+
+        # Act
+        await test_session.execute(update(Task).where(Task.id == test_task.id).values(description="changed"))
+        await test_session.commit()
+        stamps.append(await _stamp(*ETAG_TABLES))
+        await test_session.execute(update(Label).where(Label.id == test_label.id).values(name="renamed"))
+        await test_session.commit()
+        stamps.append(await _stamp(*ETAG_TABLES))
+        await test_session.execute(delete(Label).where(Label.id == -1))
+        await test_session.commit()
+        stamps.append(await _stamp(*ETAG_TABLES))
+
+        # Assert
+        assert len(set(stamps[:3])) == 3
+        assert stamps[3] == stamps[2]
+
+    async def test_older_writer_committing_late_changes_stamp(self, test_session: AsyncSession, test_label):
+        """Test a transaction that commits after a newer one still changes the stamp."""
+        # Arrange: different labels, so the two writers do not wait on the same counter row.
+        async with test_async_session_maker() as older, test_async_session_maker() as newer:
+            await _insert_task(older, "older", test_label.id)
+            await _insert_task(newer, "newer")
+            await newer.commit()
+            before = await _stamp("tasks")
+
+            # Act
+            await older.commit()
+            after = await _stamp("tasks")
+
+        # Assert
+        assert after != before
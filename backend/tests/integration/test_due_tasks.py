@@ -0,0 +1,85 @@
+"""
+Integration tests for the /tasks/due deadline endpoint
+"""
+from datetime import datetime, timedelta
+
+import pytest
+from httpx import AsyncClient
+from fastapi import status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from source.db.models import Status
+
+
+async def _due(client: AsyncClient, **query) -> dict:
+    response = await client.get("/tasks/due", params=query)
+    assert response.status_code == status.HTTP_200_OK
+    return response.json()
+
+
+@pytest.mark.integration
+class TestDueTasks:
+    """Test deadline windows, open-status filtering and keyset pagination."""
+
+    @pytest.fixture
+    async def deadlines(self, async_client: AsyncClient, test_session: AsyncSession, test_status) -> dict[str, int]:
+        """Tasks two days overdue, one day overdue, due tomorrow and without a deadline; one is done."""
+        done = Status(name="Done")
+        test_session.add(done)
+        await test_session.commit()
+
+        now = datetime.now()
+        items = [
+            {"description": "late", "deadline": (now - timedelta(days=2)).isoformat(), "status_id": test_status.id},
+            {"description": "late done", "deadline": (now - timedelta(days=1)).isoformat(), "status_id": done.id},
+            {"description": "tomorrow", "deadline": (now + timedelta(days=1)).isoformat()},
+            {"description": "someday"},
+        ]
+        response = await async_client.post("/tasks/bulk", json={"items": items})
+        return {item["description"]: result["task_id"] for item, result in zip(items, response.json()["items"])}
+
+    async def test_modes(self, async_client: AsyncClient, deadlines):
+        """Test overdue, before and after windows order by deadline and skip undated tasks."""
+        # Act
+        overdue = await _due(async_client)
+        before = await _due(async_client, mode="before", at=(datetime.now() + timedelta(days=3)).isoformat())
+        after = await _due(async_client, mode="after")
+
+        # Assert
+        assert [item["description"] for item in overdue["items"]] == ["late", "late done"]
+        assert [item["description"] for item in before["items"]] == ["late", "late done", "tomorrow"]
+        assert [item["description"] for item in after["items"]] == ["tomorrow"]
+
+    async def test_open_skips_terminal_statuses(self, async_client: AsyncClient, deadlines):
+        """Test open=true drops tasks in terminal statuses, including when filtering by one."""
+        # Act
+        at = (datetime.now() + timedelta(days=3)).isoformat()
+        open_tasks = await _due(async_client, open=True, mode="before", at=at)
+        done = await _due(async_client, open=True, status="Done")
+
+        # Assert
+        assert [item["description"] for item in open_tasks["items"]] == ["late", "tomorrow"]
+        assert done["items"] == []
+
+    async def test_pagination(self, async_client: AsyncClient, deadlines):
+        """Test following next_cursor visits every due task once in deadline order."""
+        # Act
+        seen, cursor = [], None
+        while True:
+            query = {"mode": "before", "at": "2100-01-01T00:00:00", "limit": 1, **({"after": cursor} if cursor else {})}
+            page = await _due(async_client, **query)
+            seen += [item["description"] for item in page["items"]]
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+
+        # Assert
+        assert seen == ["late", "late done", "tomorrow"]
+
+    async def test_invalid_cursor(self, async_client: AsyncClient):
+        """Test a malformed cursor is rejected."""
+        # Act
+        response = await async_client.get("/tasks/due", params={"after": "bm90LWEtY3Vyc29y"})
+
+        # Assert
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
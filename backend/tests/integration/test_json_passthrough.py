@@ -0,0 +1,111 @@
+"""
+Golden tests: Postgres-assembled JSON against the pydantic path for the read endpoints
+"""
+import json
+from datetime import datetime
+
+import pytest
+from httpx import AsyncClient
+from fastapi import status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from source.db.models import Label, Priority, Status, Task
+
+
+READS = (
+    ("source.api.labels.api", "/labels/get"),
+    ("source.api.statuses.api", "/statuses/get"),
+    ("source.api.priorities.api", "/priorities/get"),
+)
+
+
+async def _both(async_client: AsyncClient, monkeypatch, module: str, url: str, **query) -> tuple[dict, dict]:
+    # The same request with the endpoint's switch off and on.
+    documents = []
+    for passthrough in (False, True):
+        monkeypatch.setattr(f"{module}.JSON_PASSTHROUGH", passthrough)
+        response = await async_client.get(url, params=query)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("application/json")
+        documents.append(json.loads(response.content))
+    return documents[0], documents[1]
+
+
+@pytest.mark.integration
+class TestJsonPassthrough:
+    """Test both serialisation paths return the same documents."""
+
+    @pytest.fixture
+    async def tasks(self, test_session: AsyncSession, test_label, test_status, test_priority):
+        """Tasks covering null references, null deadlines, microseconds and characters JSON must escape."""
+        test_session.add_all([
+            Task(description="Plain", created_at=datetime(2025, 1, 1)),
+            Task(
+                description='Quotes " back\\slash \n newline and ünïcode ✓',
+                created_at=datetime(2025, 1, 2, 3, 4, 5, 6),
+                deadline=datetime(2025, 3, 4, 5, 6, 7, 891000),
+                label_id=test_label.id, status_id=test_status.id, priority_id=test_priority.id,
+            ),
+            Task(description="Whole second", created_at=datetime(2025, 1, 3), deadline=datetime(2025, 4, 1)),
+            Task(description="Labelled", created_at=datetime(2025, 1, 4), label_id=test_label.id),
+        ])
+        await test_session.commit()
+
+    async def test_tasks_pages_match(self, async_client: AsyncClient, monkeypatch, tasks, test_label):
+        """Test full, filtered, forward and backward pages are identical in both modes."""
+        # Act
+        full, full_passthrough = await _both(async_client, monkeypatch, "source.api.tasks.api", "/tasks/get")
+        first, first_passthrough = await _both(async_client, monkeypatch, "source.api.tasks.api", "/tasks/get", limit=2)
+        after = await _both(
+            async_client, monkeypatch, "source.api.tasks.api", "/tasks/get", limit=2, after=first["next_cursor"]
+        )
+        before = await _both(
+            async_client, monkeypatch, "source.api.tasks.api", "/tasks/get", limit=1, before=after[0]["prev_cursor"]
+        )
+        labelled = await _both(async_client, monkeypatch, "source.api.tasks.api", "/tasks/get", label=test_label.name)
+        sparse = await _both(
+            async_client, monkeypatch, "source.api.tasks.api", "/tasks/get",
+            fields="deadline,description", view="summary",
+        )
+        missing = await _both(async_client, monkeypatch, "source.api.tasks.api", "/tasks/get", label="no such label")
+
+        # Assert
+        assert len(full["items"]) == 4
+        assert full == full_passthrough
+        assert first == first_passthrough
+        assert after[0] == after[1]
+        assert before[0] == before[1]
+        assert len(labelled[0]["items"]) == 2 and labelled[0] == labelled[1]
+        assert missing[0] == missing[1] == {"items": [], "next_cursor": None, "prev_cursor": None}
+        assert set(sparse[0]["items"][0]) == {"task_id", "deadline", "description"} and sparse[0] == sparse[1]
+
+    async def test_timestamps_are_formatted_like_pydantic(self, async_client: AsyncClient, monkeypatch, tasks):
+        """Test timestamps keep six fractional digits only when they have them."""
+        # Act
+        _, document = await _both(async_client, monkeypatch, "source.api.tasks.api", "/tasks/get")
+
+        # Assert
+        stamps = [(item["created_at"], item["deadline"]) for item in document["items"]]
+        assert stamps == [
+            ("2025-01-01T00:00:00", None),
+            ("2025-01-02T03:04:05.000006", "2025-03-04T05:06:07.891000"),
+            ("2025-01-03T00:00:00", "2025-04-01T00:00:00"),
+            ("2025-01-04T00:00:00", None),
+        ]
+
+    @pytest.mark.parametrize("module,url", READS)
+    async def test_reference_lists_match(
+        self, async_client: AsyncClient, test_session: AsyncSession, monkeypatch, module: str, url: str
+    ):
+        """Test labels, statuses and priorities are identical in both modes."""
+        # Arrange
+        for model in (Label, Status, Priority):
+            test_session.add_all([model(name="First"), model(name='Second "quoted" ✓')])
+        await test_session.commit()
+
+        # Act
+        models, passthrough = await _both(async_client, monkeypatch, module, url)
+
+        # Assert
+        assert len(models["items"]) == 2
+        assert sorted(models["items"], key=lambda item: item["id"]) == passthrough["items"]
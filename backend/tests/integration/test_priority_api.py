@@ -21,6 +21,14 @@ class TestPriorityAPI:
         assert data["description"] == sample_priority_data["description"]
         assert "id" in data
 
+    async def test_create_duplicate_priority(self, async_client: AsyncClient, test_priority):
+        """Test creating a priority whose name is already taken."""
+        # Act
+        response = await async_client.post("/priorities/create", json={"name": test_priority.name})
+
+        # Assert
+        assert response.status_code == status.HTTP_409_CONFLICT
+
     async def test_get_priorities(self, async_client: AsyncClient, test_priority: dict):
         """Test getting all priorities via API."""
         # Act
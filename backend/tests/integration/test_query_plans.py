@@ -0,0 +1,184 @@
+"""
+Query plan regression tests for repository queries on the tasks table
+
+Every query issued by a repository call is captured and re-run as
+EXPLAIN (FORMAT JSON) against a seeded dataset. A test fails when a plan
+sequentially scans tasks or when its estimated cost grows noticeably
+above the recorded baseline.
+
+Baseline costs live in query_plans.json next to this file. A case without
+a baseline entry fails; set UPDATE_QUERY_PLAN_BASELINE=1 to record new
+cases or re-record after an intentional change, and commit the file.
+"""
+import json
+import os
+from datetime import datetime, timedelta
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from source.db.models import Label
+from source.db.repositories import TaskRepository
+from source.schemas.task import params
+
+
+TASKS = 200_000
+LABELS = 50
+STATUSES = 10
+PRIORITIES = 5
+
+BASELINE_PATH = Path(__file__).with_name("query_plans.json")
+UPDATE_BASELINE = os.getenv("UPDATE_QUERY_PLAN_BASELINE") == "1"
+COST_TOLERANCE = 1.25
+
+MISSING_ID = 10 ** 9
+
+
+CASES = {
+    "get_tasks": lambda repo: repo.get_tasks(params.GetTasks()),
+    "get_tasks_after": lambda repo: repo.get_tasks(params.GetTasks(), after=TASKS // 2),
+    "get_tasks_before": lambda repo: repo.get_tasks(params.GetTasks(), before=TASKS // 2),
+    "get_tasks_label": lambda repo: repo.get_tasks(params.GetTasks(label="label-7")),
+    "get_tasks_status": lambda repo: repo.get_tasks(params.GetTasks(status="status-3")),
+    "get_tasks_priority": lambda repo: repo.get_tasks(params.GetTasks(priority="priority-2")),
+    "get_tasks_status_priority": lambda repo: repo.get_tasks(
+        params.GetTasks(status="status-3", priority="priority-2")
+    ),
+    "get_tasks_label_status": lambda repo: repo.get_tasks(
+        params.GetTasks(label="label-7", status="status-3"), after=TASKS // 2
+    ),
+    "get_tasks_all_filters": lambda repo: repo.get_tasks(
+        params.GetTasks(label="label-7", status="status-3", priority="priority-2")
+    ),
+    "get_due_overdue": lambda repo: repo.get_due_tasks(params.DueTasks()),
+    "get_due_after": lambda repo: repo.get_due_tasks(params.DueTasks(mode="after")),
+    "get_due_after_open": lambda repo: repo.get_due_tasks(params.DueTasks(mode="after", open=True)),
+    "claim_reminders": lambda repo: repo.claim_reminders(
+        datetime.now() - timedelta(days=1), datetime.now() + timedelta(hours=1), 100
+    ),
+    "get_by_id": lambda repo: repo.get_by_id(TASKS // 2),
+    "find_reference_ids": lambda repo: repo.find_reference_ids(
+        [{"label_id": 1, "status_id": 2, "priority_id": 3}]
+    ),
+    "resolve_names": lambda repo: repo.resolve_names(Label, ["label-1", "label-2"]),
+    "update_by_id_returning": lambda repo: repo.update_by_id_returning(MISSING_ID, description="updated"),
+    "delete_by_id_returning": lambda repo: repo.delete_by_id_returning(MISSING_ID),
+    "bulk_update": lambda repo: repo.bulk_update([{"id": MISSING_ID, "description": "updated"}]),
+    "bulk_delete": lambda repo: repo.bulk_delete([MISSING_ID, MISSING_ID + 1]),
+    "search_tasks_fulltext": lambda repo: repo.search_tasks(params.SearchTasks(q="task 12345")),
+    "search_tasks_contains": lambda repo: repo.search_tasks(params.SearchTasks(q="12345", mode="contains")),
+    "search_tasks_fuzzy": lambda repo: repo.search_tasks(params.SearchTasks(q="deploy", mode="fuzzy")),
+    "typeahead": lambda repo: repo.typeahead("deploy", 10, 0.3),
+    "get_stats": lambda repo: repo.get_stats(10),
+    "count": lambda repo: repo.count(status_id=3, priority_id=2),
+    "get_changes": lambda repo: repo.get_changes((0, 0), 2 ** 62, 100),
+    "get_tasks_json": lambda repo: repo.get_tasks_json(params.GetTasks()),
+    "get_tasks_json_label": lambda repo: repo.get_tasks_json(params.GetTasks(label="label-7")),
+    "stream_tasks": lambda repo: drain(repo.stream_tasks(params.TaskFilters(label="label-7"))),
+}
+
+
+async def drain(batches):
+    async for _ in batches:
+        pass
+
+
+@contextmanager
+def capture_statements(session: AsyncSession):
+    statements: list[tuple[str, tuple]] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if not executemany and not statement.lstrip().upper().startswith("EXPLAIN"):
+            statements.append((statement, tuple(parameters or ())))
+
+    engine = session.bind.sync_engine  # type: ignore
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def walk(plan: dict):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from walk(child)
+
+
+@pytest.fixture
+async def seeded_session(test_session: AsyncSession) -> AsyncSession:
+    """Fill lookup tables and tasks with a dataset large enough for realistic plans."""
+    for table, prefix, count in (
+        ("labels", "label", LABELS),
+        ("statuses", "status", STATUSES),
+        ("priorities", "priority", PRIORITIES),
+    ):
+        await test_session.execute(text(
+            f"INSERT INTO {table} (name) SELECT '{prefix}-' || i FROM generate_series(1, {count}) i"
+        ))
+
+    await test_session.execute(text(
+        "INSERT INTO tasks (status_id, priority_id, label_id, created_at, deadline, description) "
+        f"SELECT i % {STATUSES} + 1, i % {PRIORITIES} + 1, i % {LABELS} + 1, "
+        "now() - i * interval '1 minute', "
+        "CASE WHEN i % 3 = 0 THEN NULL ELSE now() + i * interval '1 minute' END, "
+        "'task ' || i "
+        f"FROM generate_series(1, {TASKS}) i"
+    ))
+    await test_session.commit()
+
+    connection = await test_session.connection()
+    await connection.exec_driver_sql("ANALYZE")
+    await test_session.commit()
+    return test_session
+
+
+@pytest.mark.integration
+@pytest.mark.slow
+class TestQueryPlans:
+    """Check repository queries keep using indexes as the tasks table grows."""
+
+    async def test_repository_query_plans(self, seeded_session: AsyncSession):
+        """Test no repository query scans tasks sequentially or regresses in cost."""
+        # Arrange
+        repo = TaskRepository(seeded_session)
+        baseline = json.loads(BASELINE_PATH.read_text()) if BASELINE_PATH.exists() else {}
+        costs: dict[str, float] = {}
+        failures: list[str] = []
+
+        # Act
+        for name, call in CASES.items():
+            with capture_statements(seeded_session) as statements:
+                await call(repo)
+            assert statements, f"{name} issued no queries"
+
+            connection = await seeded_session.connection()
+            cost = 0.0
+            for statement, parameters in statements:
+                result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+                plan = result.scalar_one()
+                plan = (json.loads(plan) if isinstance(plan, str) else plan)[0]["Plan"]
+                cost += plan["Total Cost"]
+
+                for node in walk(plan):
+                    if node["Node Type"] == "Seq Scan" and node.get("Relation Name") == "tasks":
+                        failures.append(f"{name}: sequential scan on tasks\n{statement}")
+            await seeded_session.rollback()
+
+            costs[name] = round(cost, 2)
+            expected = baseline.get(name)
+            if UPDATE_BASELINE:
+                continue
+            if expected is None:
+                failures.append(f"{name}: no baseline cost; record it with UPDATE_QUERY_PLAN_BASELINE=1")
+            elif cost > expected * COST_TOLERANCE:
+                failures.append(f"{name}: estimated cost {cost:.2f} exceeds baseline {expected:.2f}")
+
+        if UPDATE_BASELINE:
+            BASELINE_PATH.write_text(json.dumps(costs, indent=2, sort_keys=True) + "\n")
+
+        # Assert
+        assert not failures, "\n\n".join(failures)
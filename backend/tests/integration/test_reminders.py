@@ -0,0 +1,85 @@
+"""
+Integration tests for claiming deadline reminders across concurrent schedulers
+"""
+import asyncio
+from collections import Counter
+from datetime import datetime, timedelta
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from source.db.models import Task
+from source.services.reminders import ReminderScheduler, ReminderSink
+from tests.conftest import test_async_session_maker
+
+
+class _SlowSink(ReminderSink):
+
+    def __init__(self, delivered: Counter):
+        self.delivered = delivered
+
+    async def send(self, reminders):
+        # Hold the claimed rows long enough for the other worker to run into them.
+        await asyncio.sleep(0.05)
+        self.delivered.update(reminder.task_id for reminder in reminders)
+
+
+def _scheduler(sink: ReminderSink) -> ReminderScheduler:
+    return ReminderScheduler(
+        sink, session_maker=test_async_session_maker, batch_size=10,
+        lead=timedelta(hours=1), grace=timedelta(days=1),
+    )
+
+
+@pytest.mark.integration
+class TestReminders:
+    """Test reminders are claimed once, skipped outside the window and rescheduled."""
+
+    async def test_concurrent_workers_never_double_send(self, test_session: AsyncSession):
+        """Test two schedulers scanning at once deliver every due reminder exactly once."""
+        # Arrange
+        await test_session.execute(text(
+            "INSERT INTO tasks (created_at, deadline, description) "
+            "SELECT now(), localtimestamp + i * interval '1 second', 'task ' || i FROM generate_series(1, 95) i"
+        ))
+        await test_session.commit()
+        delivered: Counter = Counter()
+
+        # Act
+        workers = [_scheduler(_SlowSink(delivered)) for _ in range(2)]
+        claimed = await asyncio.gather(*(worker.scan() for worker in workers))
+
+        # Assert
+        assert sum(claimed) == 95
+        assert len(delivered) == 95
+        assert set(delivered.values()) == {1}
+        pending = await test_session.execute(select(Task.id).where(Task.reminder_sent_at.is_(None)))
+        assert pending.all() == []
+
+    async def test_window_and_reschedule(self, async_client: AsyncClient, test_session: AsyncSession):
+        """Test far and long-overdue deadlines are skipped and a moved deadline is reminded again."""
+        # Arrange
+        now = datetime.now()
+        items = [
+            {"description": "soon", "deadline": (now + timedelta(minutes=10)).isoformat()},
+            {"description": "next week", "deadline": (now + timedelta(days=7)).isoformat()},
+            {"description": "last month", "deadline": (now - timedelta(days=30)).isoformat()},
+        ]
+        response = await async_client.post("/tasks/bulk", json={"items": items})
+        ids = [item["task_id"] for item in response.json()["items"]]
+        delivered: Counter = Counter()
+        scheduler = _scheduler(_SlowSink(delivered))
+
+        # Act
+        await scheduler.scan()
+        await async_client.patch(f"/tasks/{ids[0]}", json={
+            "task_id": ids[0], "deadline": (now + timedelta(minutes=20)).isoformat(),
+        })
+        await scheduler.scan()
+        await scheduler.scan()
+
+        # Assert
+        assert delivered == Counter({ids[0]: 2})
+        assert scheduler.stats.sent == 2
@@ -128,3 +128,39 @@ class TestTaskAPI:
         assert isinstance(data["items"], list)
         assert len(data["items"]) >= 1
         assert all(task["priority_id"] == test_priority.id for task in data["items"])
+
+    async def test_get_tasks_sparse_summary(self, async_client: AsyncClient, test_task: dict, test_label: dict):
+        """Test fields= narrows each item and view=summary truncates descriptions in SQL."""
+        # Arrange
+        long = "x" * 80
+        await async_client.post("/tasks/create", json={"description": long, "label_id": test_label.id})
+
+        # Act
+        response = await async_client.get("/tasks/get", params={"fields": "description,label", "view": "summary"})
+        invalid = await async_client.get("/tasks/get", params={"fields": "description,secret"})
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        items = response.json()["items"]
+        assert all(list(item) == ["task_id", "label", "description"] for item in items)
+        assert items[-1]["description"] == long[:50]
+        assert items[-1]["label"] == test_label.name
+        assert invalid.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    async def test_bulk_update_null_description(self, async_client: AsyncClient, test_task: dict):
+        """Test a null description fails only its own item in a bulk update."""
+        # Arrange
+        created = await async_client.post("/tasks/create", json={"description": "Other"})
+        other_id = created.json()["task_id"]
+
+        # Act
+        response = await async_client.patch("/tasks/bulk", json={"items": [
+            {"task_id": test_task.id, "description": None},
+            {"task_id": other_id, "description": "Renamed"},
+        ]})
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        items = response.json()["items"]
+        assert items[0]["error"] == "description cannot be null"
+        assert items[1] == {"index": 1, "task_id": other_id, "error": None}
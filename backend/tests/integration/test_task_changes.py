@@ -0,0 +1,79 @@
+"""
+Integration tests for the /tasks/changes delta sync endpoint
+"""
+from datetime import datetime, timedelta
+
+import pytest
+from httpx import AsyncClient
+from fastapi import status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from source.db.repositories import TaskRepository
+
+
+async def _changes(client: AsyncClient, **query) -> dict:
+    response = await client.get("/tasks/changes", params=query)
+    assert response.status_code == status.HTTP_200_OK
+    return response.json()
+
+
+@pytest.mark.integration
+class TestTaskChanges:
+    """Test versions, tombstones and compaction with a real database."""
+
+    async def test_delta_after_writes(self, async_client: AsyncClient, test_task, test_label):
+        """Test only tasks written after the version are returned, deletes included."""
+        # Arrange
+        start = await _changes(async_client)
+        assert start["resync_required"]
+        created = await async_client.post("/tasks/create", json={"description": "new", "label_id": test_label.id})
+        new_id = created.json()["task_id"]
+
+        # Act
+        await async_client.patch(f"/tasks/{new_id}", json={"task_id": new_id, "description": "renamed"})
+        await async_client.delete(f"/tasks/{test_task.id}")
+        delta = await _changes(async_client, since=start["version"])
+
+        # Assert
+        assert [item["task_id"] for item in delta["items"]] == [new_id]
+        assert delta["items"][0]["description"] == "renamed"
+        assert delta["deleted"] == [test_task.id]
+        assert delta["version"] >= start["version"]
+        assert await _changes(async_client, since=delta["version"]) == {
+            "items": [], "deleted": [], "version": delta["version"], "next_cursor": None, "resync_required": False,
+        }
+
+    async def test_pagination(self, async_client: AsyncClient, test_label):
+        """Test following next_cursor visits every change once."""
+        # Arrange
+        start = await _changes(async_client)
+        response = await async_client.post("/tasks/bulk", json={"items": [
+            {"description": f"bulk {n}", "label_id": test_label.id} for n in range(5)
+        ]})
+        ids = [item["task_id"] for item in response.json()["items"]]
+
+        # Act
+        seen, cursor = [], None
+        while True:
+            query = {"since": start["version"], "limit": 2, **({"after": cursor} if cursor else {})}
+            page = await _changes(async_client, **query)
+            seen += [item["task_id"] for item in page["items"]]
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+
+        # Assert
+        assert seen == ids
+
+    async def test_compaction_requires_resync(self, async_client: AsyncClient, test_session: AsyncSession, test_task):
+        """Test clients older than compacted tombstones are told to reload."""
+        # Arrange
+        start = await _changes(async_client)
+        await async_client.delete(f"/tasks/{test_task.id}")
+
+        # Act
+        removed = await TaskRepository(test_session).compact_tombstones(datetime.now() + timedelta(days=1))
+
+        # Assert
+        assert removed == 1
+        assert (await _changes(async_client, since=start["version"]))["resync_required"]
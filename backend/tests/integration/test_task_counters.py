@@ -0,0 +1,136 @@
+"""
+Integration tests for the trigger-maintained task counters
+"""
+import asyncio
+import random
+from datetime import datetime
+
+import pytest
+from httpx import AsyncClient
+from fastapi import status
+from sqlalchemy import delete, func, select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from source.db.models import Task, TaskCounter
+from source.db.repositories import TaskRepository
+from tests.conftest import test_async_session_maker
+
+
+WRITERS = 8
+ROUNDS = 25
+KEY = (Task.status_id, Task.priority_id, Task.label_id)
+
+
+async def _actual(session: AsyncSession) -> dict[tuple, int]:
+    rows = await session.execute(select(*KEY, func.count()).group_by(*KEY))
+    return {tuple(row[:3]): row[3] for row in rows}
+
+
+async def _counters(session: AsyncSession) -> dict[tuple, int]:
+    rows = await session.execute(
+        select(TaskCounter.status_id, TaskCounter.priority_id, TaskCounter.label_id, TaskCounter.count)
+        .where(TaskCounter.count != 0)
+    )
+    return {tuple(row[:3]): row[3] for row in rows}
+
+
+async def _writer(seed: int, label_ids: list[int | None]):
+    # Each writer mixes single-row and multi-row statements in its own connection, one per transaction
+    # like the API does, so only the counter rows are contended. Inserts are one multi-row VALUES
+    # statement: an executemany would run a statement, and fire the trigger, per row.
+    rng = random.Random(seed)
+    async with test_async_session_maker() as session:
+        for _ in range(ROUNDS):
+            await session.execute(Task.__table__.insert().values([
+                {"description": f"w{seed}", "label_id": rng.choice(label_ids), "created_at": datetime.now()}
+                for _ in range(rng.randint(1, 5))
+            ]))
+            await session.commit()
+            await session.execute(
+                update(Task).where(Task.id % WRITERS == seed).values(label_id=rng.choice(label_ids))
+            )
+            await session.commit()
+            victim = select(Task.id).where(Task.description == f"w{seed}").limit(1).scalar_subquery()
+            await session.execute(delete(Task).where(Task.id == victim))
+            await session.commit()
+
+
+@pytest.mark.integration
+class TestTaskCounters:
+    """Test counters stay exact under concurrent writes and drift is repaired."""
+
+    async def test_parallel_writes_keep_counters_exact(self, test_session: AsyncSession, test_label):
+        """Test concurrent inserts, updates and deletes leave counters equal to grouped counts."""
+        # Arrange
+        label_ids = [test_label.id, None]
+
+        # Act
+        await asyncio.gather(*(_writer(seed, label_ids) for seed in range(WRITERS)))
+
+        # Assert
+        actual = await _actual(test_session)
+        assert sum(actual.values()) > 0
+        assert await _counters(test_session) == actual
+
+    async def test_count_and_stats_read_counters(self, async_client: AsyncClient, test_label, test_status):
+        """Test the count endpoint and stats totals follow writes through the counters."""
+        # Arrange
+        await async_client.post("/tasks/bulk", json={"items": [
+            {"description": "a", "label_id": test_label.id, "status_id": test_status.id},
+            {"description": "b", "label_id": test_label.id},
+            {"description": "c"},
+        ]})
+
+        # Act
+        labelled = await async_client.get("/tasks/count", params={"label": test_label.name})
+        everything = await async_client.get("/tasks/count")
+        missing = await async_client.get("/tasks/count", params={"label": "no such label"})
+        stats = (await async_client.get("/tasks/stats")).json()
+
+        # Assert
+        assert labelled.status_code == status.HTTP_200_OK
+        assert (labelled.json()["count"], everything.json()["count"], missing.json()["count"]) == (2, 3, 0)
+        assert stats["total"] == 3
+        assert {(item["name"], item["count"]) for item in stats["by_status"]} == {(test_status.name, 1), (None, 2)}
+
+    async def test_reconcile_repairs_drift(self, test_session: AsyncSession, test_task):
+        """Test reconciliation fixes corrupted and missing counter rows."""
+        # Arrange
+        await test_session.execute(update(TaskCounter).values(count=TaskCounter.count + 5))
+        await test_session.execute(TaskCounter.__table__.insert().values(status_id=999, count=3))
+        await test_session.commit()
+
+        # Act
+        repaired = await TaskRepository(test_session).reconcile_counters()
+
+        # Assert
+        assert repaired == 2
+        assert await _counters(test_session) == await _actual(test_session)
+        assert await TaskRepository(test_session).reconcile_counters() == 0
+
+    async def test_reconcile_skips_while_another_runs(self, test_session: AsyncSession, test_task):
+        """Test a reconciliation started while another holds the lock repairs nothing, so drift is added once."""
+        # Arrange
+        await test_session.execute(update(TaskCounter).values(count=TaskCounter.count + 5))
+        await test_session.commit()
+        lock = select(func.pg_advisory_xact_lock(func.hashtext(TaskCounter.__tablename__)))
+
+        # Act
+        async with test_async_session_maker() as running:
+            await running.execute(lock)
+            skipped = await TaskRepository(test_session).reconcile_counters()
+            await running.rollback()
+        repaired = await TaskRepository(test_session).reconcile_counters()
+
+        # Assert
+        assert (skipped, repaired) == (0, 1)
+        assert await _counters(test_session) == await _actual(test_session)
+
+    async def test_truncate_clears_counters(self, test_session: AsyncSession, test_task):
+        """Test truncating tasks empties the counters."""
+        # Act
+        await test_session.execute(text("TRUNCATE tasks CASCADE"))
+        await test_session.commit()
+
+        # Assert
+        assert await _counters(test_session) == {}
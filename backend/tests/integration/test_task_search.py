@@ -0,0 +1,81 @@
+"""
+Integration tests for task search modes and typeahead
+"""
+import pytest
+from httpx import AsyncClient
+from fastapi import status
+
+
+DESCRIPTIONS = [
+    "Deploy the billing service",
+    "Refund 50% of the <b>invoice</b>",
+    "Investigate flaky login tests",
+]
+
+
+@pytest.fixture
+async def tasks(async_client: AsyncClient, test_label):
+    """Tasks with known descriptions."""
+    response = await async_client.post("/tasks/bulk", json={"items": [
+        {"description": description, "label_id": test_label.id} for description in DESCRIPTIONS
+    ]})
+    return [item["task_id"] for item in response.json()["items"]]
+
+
+async def _search(client: AsyncClient, **query) -> list[dict]:
+    response = await client.get("/tasks/search", params=query)
+    assert response.status_code == status.HTTP_200_OK
+    return response.json()["items"]
+
+
+@pytest.mark.integration
+class TestTaskSearch:
+    """Test full-text, substring and fuzzy search against a real database."""
+
+    async def test_fulltext(self, async_client: AsyncClient, tasks):
+        """Test stemmed matching with a highlighted snippet."""
+        # Act
+        items = await _search(async_client, q="deploying billing")
+
+        # Assert
+        assert [item["task_id"] for item in items] == [tasks[0]]
+        assert "<mark>Deploy</mark>" in items[0]["snippet"]
+
+    async def test_ranks_only_newest_candidates(self, async_client: AsyncClient, tasks, monkeypatch):
+        """Test a common term is ranked among the newest matches only."""
+        # Arrange
+        monkeypatch.setattr("source.db.repositories.task.SEARCH_CANDIDATES", 2)
+
+        # Act
+        items = await _search(async_client, q="e", mode="contains")
+
+        # Assert
+        assert sorted(item["task_id"] for item in items) == [tasks[1], tasks[2]]
+
+    async def test_contains_escapes_wildcards_and_markup(self, async_client: AsyncClient, tasks):
+        """Test substring search treats % literally and escapes HTML in snippets."""
+        # Act
+        items = await _search(async_client, q="50%", mode="contains")
+
+        # Assert
+        assert [item["task_id"] for item in items] == [tasks[1]]
+        assert items[0]["snippet"] == "Refund <mark>50%</mark> of the &lt;b&gt;invoice&lt;/b&gt;"
+
+    async def test_fuzzy_tolerates_typos(self, async_client: AsyncClient, tasks):
+        """Test a misspelled word still finds the task."""
+        # Act
+        items = await _search(async_client, q="investgate", mode="fuzzy", threshold=0.4)
+
+        # Assert
+        assert [item["task_id"] for item in items] == [tasks[2]]
+
+    async def test_typeahead_mixes_tasks_and_references(self, async_client: AsyncClient, tasks, test_label):
+        """Test typeahead suggests tasks and reference names ranked by similarity."""
+        # Act
+        response = await async_client.get("/tasks/typeahead", params={"q": test_label.name[:4]})
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        items = response.json()["items"]
+        assert {"kind": "label", "id": test_label.id} in [{"kind": item["kind"], "id": item["id"]} for item in items]
+        assert [item["score"] for item in items] == sorted((item["score"] for item in items), reverse=True)
@@ -0,0 +1,46 @@
+"""
+Integration tests for the /tasks/stats dashboard endpoint
+"""
+from datetime import datetime, timedelta
+
+import pytest
+from httpx import AsyncClient
+from fastapi import status
+
+
+@pytest.mark.integration
+class TestTaskStats:
+    """Test grouped counts, deadline counts and recent tasks from one query."""
+
+    async def test_stats(self, async_client: AsyncClient, test_label, test_status, test_priority):
+        """Test counts per dimension, overdue and due-this-week totals and recent order."""
+        # Arrange
+        now = datetime.now()
+        items = [
+            {"description": "overdue", "label_id": test_label.id, "status_id": test_status.id,
+             "deadline": (now - timedelta(days=1)).isoformat(), "created_at": (now - timedelta(hours=3)).isoformat()},
+            {"description": "due soon", "label_id": test_label.id, "priority_id": test_priority.id,
+             "deadline": (now + timedelta(days=2)).isoformat(), "created_at": (now - timedelta(hours=2)).isoformat()},
+            {"description": "no deadline", "created_at": (now - timedelta(hours=1)).isoformat()},
+        ]
+        await async_client.post("/tasks/bulk", json={"items": items})
+
+        # Act
+        response = await async_client.get("/tasks/stats", params={"recent": 2})
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        stats = response.json()
+        assert (stats["total"], stats["overdue"], stats["due_this_week"]) == (3, 1, 1)
+        assert {(item["name"], item["count"]) for item in stats["by_label"]} == {(test_label.name, 2), (None, 1)}
+        assert {(item["name"], item["count"]) for item in stats["by_status"]} == {(test_status.name, 1), (None, 2)}
+        assert [task["description"] for task in stats["recent"]] == ["no deadline", "due soon"]
+        assert (stats["labels"], stats["statuses"], stats["priorities"]) == (1, 1, 1)
+
+    async def test_empty(self, async_client: AsyncClient):
+        """Test an empty table still returns zero totals."""
+        # Act
+        stats = (await async_client.get("/tasks/stats")).json()
+
+        # Assert
+        assert (stats["total"], stats["recent"]) == (0, [])
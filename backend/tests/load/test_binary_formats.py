@@ -0,0 +1,85 @@
+"""
+Benchmark of task list body size and client decode time: JSON against msgpack, Arrow IPC and Parquet
+"""
+import io
+import json
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable
+
+import orjson
+import pytest
+from sqlalchemy.engine import IteratorResult
+from sqlalchemy.engine.result import SimpleResultMetaData
+
+from source.schemas.task import responses
+from source.services import formats
+from source.services.task import task_item
+
+msgpack = pytest.importorskip("msgpack")
+pyarrow = pytest.importorskip("pyarrow")
+import pyarrow.ipc
+import pyarrow.parquet
+
+
+SIZES = (1_000, 10_000, 100_000)
+# responses.Task field order, so the rows transpose straight into the Arrow columns.
+COLUMNS = ["id", "status", "priority", "label", "created_at", "deadline", "description"]
+ROUNDS = 5
+
+
+def _rows(count: int) -> list[Any]:
+    start = datetime(2025, 1, 1)
+    return IteratorResult(SimpleResultMetaData(COLUMNS), iter(
+        (id, "Open", "High", "Bug", start + timedelta(minutes=id, microseconds=id),
+         start + timedelta(days=id % 30) if id % 3 else None, f"Task number {id} with some text")
+        for id in range(count)
+    )).fetchall()
+
+
+def _bodies(rows: list[Any]) -> dict[str, bytes]:
+    document = {"items": [task_item(row) for row in rows], "next_cursor": None, "prev_cursor": None}
+    columns = list(zip(*rows))
+    return {
+        formats.JSON: formats.encode_document(formats.JSON, document),
+        formats.MSGPACK: formats.encode_document(formats.MSGPACK, document),
+        formats.ARROW: formats.encode_columns(formats.ARROW, responses.Task, columns),
+        formats.PARQUET: formats.encode_columns(formats.PARQUET, responses.Task, columns),
+    }
+
+
+# What a consumer does with each body: JSON twice, with the stdlib parser and with orjson.
+DECODERS: dict[str, tuple[str, Callable[[bytes], Any]]] = {
+    "json": (formats.JSON, json.loads),
+    "orjson": (formats.JSON, orjson.loads),
+    "msgpack": (formats.MSGPACK, msgpack.unpackb),
+    "arrow": (formats.ARROW, lambda body: pyarrow.ipc.open_stream(body).read_all()),
+    "parquet": (formats.PARQUET, lambda body: pyarrow.parquet.read_table(io.BytesIO(body))),
+}
+
+
+def _decode_time(decode: Callable[[bytes], Any], body: bytes) -> float:
+    best = float("inf")
+    for _ in range(ROUNDS):
+        started = time.process_time()
+        decode(body)
+        best = min(best, time.process_time() - started)
+    return best
+
+
+@pytest.mark.load
+@pytest.mark.slow
+class TestBinaryFormats:
+    """Compare what each negotiated format costs on the wire and in the client."""
+
+    @pytest.mark.parametrize("size", SIZES)
+    def test_binary_formats_are_smaller_and_faster_to_decode(self, size: int):
+        """Test msgpack and the columnar formats beat JSON on size, and Arrow on decode time."""
+        bodies = _bodies(_rows(size))
+        timings = {name: _decode_time(decode, bodies[media_type]) for name, (media_type, decode) in DECODERS.items()}
+
+        for name, (media_type, _) in DECODERS.items():
+            print(f"\n{size} rows {name}: {len(bodies[media_type]) / 1024:.0f} KiB, {timings[name] * 1000:.2f} ms decode")
+        assert len(bodies[formats.MSGPACK]) < len(bodies[formats.JSON])
+        assert len(bodies[formats.PARQUET]) < len(bodies[formats.ARROW]) < len(bodies[formats.JSON])
+        assert timings["arrow"] < timings["orjson"] < timings["json"]
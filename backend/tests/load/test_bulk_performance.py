@@ -0,0 +1,69 @@
+"""
+Throughput comparison of single-row and bulk task endpoints
+"""
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from httpx import AsyncClient
+from fastapi import status
+
+
+BATCH_SIZE = 500
+
+
+@pytest.mark.load
+@pytest.mark.slow
+class TestBulkPerformance:
+    """Compare one request per task against one request per batch."""
+
+    def _task_data(self, i, test_priority, test_status, test_label) -> dict:
+        return {
+            "description": f"Bulk performance task {i}",
+            "deadline": (datetime.now() + timedelta(days=30)).isoformat(),
+            "priority_id": test_priority.id,
+            "status_id": test_status.id,
+            "label_id": test_label.id,
+        }
+
+    async def test_bulk_create_throughput(self, async_client: AsyncClient, test_priority, test_status, test_label):
+        """Test bulk creation is substantially faster than single creates."""
+        items = [self._task_data(i, test_priority, test_status, test_label) for i in range(BATCH_SIZE)]
+
+        started = time.perf_counter()
+        for item in items:
+            response = await async_client.post("/tasks/create", json=item)
+            assert response.status_code == status.HTTP_201_CREATED
+        single_elapsed = time.perf_counter() - started
+
+        started = time.perf_counter()
+        response = await async_client.post("/tasks/bulk", json={"items": items})
+        bulk_elapsed = time.perf_counter() - started
+
+        assert response.status_code == status.HTTP_200_OK
+        assert all(item["error"] is None for item in response.json()["items"])
+
+        print(
+            f"\nsingle: {BATCH_SIZE / single_elapsed:.0f} rows/s, "
+            f"bulk: {BATCH_SIZE / bulk_elapsed:.0f} rows/s, "
+            f"speedup: {single_elapsed / bulk_elapsed:.1f}x"
+        )
+        assert bulk_elapsed < single_elapsed
+
+    async def test_bulk_update_and_delete(self, async_client: AsyncClient, test_priority, test_status, test_label):
+        """Test bulk update and delete report per-item results."""
+        items = [self._task_data(i, test_priority, test_status, test_label) for i in range(BATCH_SIZE)]
+        response = await async_client.post("/tasks/bulk", json={"items": items})
+        task_ids = [item["task_id"] for item in response.json()["items"]]
+
+        updates = [{"task_id": task_id, "description": "updated"} for task_id in task_ids]
+        updates.append({"task_id": 10 ** 9, "description": "missing"})
+        response = await async_client.patch("/tasks/bulk", json={"items": updates})
+        assert response.status_code == status.HTTP_200_OK
+        errors = [item["error"] for item in response.json()["items"]]
+        assert errors[:-1] == [None] * BATCH_SIZE
+        assert errors[-1] == "Task not found"
+
+        response = await async_client.request("DELETE", "/tasks/bulk", json={"task_ids": task_ids})
+        assert response.status_code == status.HTTP_200_OK
+        assert all(item["error"] is None for item in response.json()["items"])
@@ -0,0 +1,59 @@
+"""
+Benchmark of 304 Not Modified against full list responses
+"""
+import time
+
+import pytest
+from httpx import AsyncClient
+from fastapi import status
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+TASKS = 1000
+ROUNDS = 200
+
+
+async def _timed(client: AsyncClient, url: str, headers: dict | None = None, expected: int = status.HTTP_200_OK) -> float:
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        response = await client.get(url, headers=headers)
+        assert response.status_code == expected
+    return (time.perf_counter() - started) / ROUNDS
+
+
+@pytest.mark.load
+@pytest.mark.slow
+class TestConditionalGet:
+    """Compare revalidated polling against fetching the full list every time."""
+
+    async def test_not_modified_faster_than_full_response(
+        self, async_client: AsyncClient, test_session: AsyncSession, test_priority, test_status, test_label
+    ):
+        """Test 304 responses are much cheaper than full /tasks/get responses."""
+        await test_session.execute(
+            text(
+                "INSERT INTO tasks (status_id, priority_id, label_id, created_at, description) "
+                "SELECT :status_id, :priority_id, :label_id, now(), 'polled task ' || n "
+                "FROM generate_series(1, :count) AS n"
+            ),
+            {"count": TASKS, "priority_id": test_priority.id, "status_id": test_status.id, "label_id": test_label.id},
+        )
+        await test_session.commit()
+
+        url = f"/tasks/get?limit={TASKS}"
+        etag = (await async_client.get(url)).headers["etag"]
+
+        full_elapsed = await _timed(async_client, url)
+        cached_elapsed = await _timed(async_client, url, {"If-None-Match": etag}, status.HTTP_304_NOT_MODIFIED)
+
+        print(
+            f"\nfull: {full_elapsed * 1000:.2f} ms, "
+            f"304: {cached_elapsed * 1000:.2f} ms, "
+            f"speedup: {full_elapsed / cached_elapsed:.1f}x"
+        )
+        assert cached_elapsed < full_elapsed
+
+        response = await async_client.post("/tasks/create", json={"description": "new", "label_id": test_label.id})
+        assert response.status_code == status.HTTP_201_CREATED
+        assert (await async_client.get(url, headers={"If-None-Match": etag})).status_code == status.HTTP_200_OK
@@ -0,0 +1,61 @@
+"""
+Benchmark of the dashboard stats endpoint against downloading every task
+"""
+import time
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+SIZES = (10_000, 100_000)
+ROUNDS = 5
+
+
+async def _all_pages(client: AsyncClient) -> int:
+    size, cursor = 0, None
+    while True:
+        response = await client.get("/tasks/get", params={"limit": 1000, **({"after": cursor} if cursor else {})})
+        size += len(response.content)
+        cursor = response.json()["next_cursor"]
+        if cursor is None:
+            return size
+
+
+@pytest.mark.load
+@pytest.mark.slow
+class TestDashboardStats:
+    """Compare the old dashboard data path with /tasks/stats as the table grows."""
+
+    async def test_stats_payload_is_constant(self, async_client: AsyncClient, test_session: AsyncSession):
+        """Test the stats payload does not grow with task count and beats paging through all tasks."""
+        await test_session.execute(text("INSERT INTO statuses (name) SELECT 'status-' || i FROM generate_series(1, 5) i"))
+        inserted, payloads = 0, []
+        for size in SIZES:
+            await test_session.execute(text(
+                "INSERT INTO tasks (status_id, created_at, deadline, description) "
+                "SELECT i % 5 + 1, now() - i * interval '1 minute', now() + (i % 20 - 10) * interval '1 day', "
+                f"'task ' || i FROM generate_series({inserted + 1}, {size}) i"
+            ))
+            await test_session.commit()
+            inserted = size
+
+            started = time.perf_counter()
+            for _ in range(ROUNDS):
+                stats = await async_client.get("/tasks/stats")
+            stats_elapsed = (time.perf_counter() - started) / ROUNDS
+
+            started = time.perf_counter()
+            full_size = await _all_pages(async_client)
+            full_elapsed = time.perf_counter() - started
+
+            payloads.append(len(stats.content))
+            print(
+                f"\n{size} tasks: stats {stats_elapsed * 1000:.1f} ms / {len(stats.content)} B, "
+                f"all pages {full_elapsed * 1000:.1f} ms / {full_size} B"
+            )
+            assert stats.json()["total"] == size
+            assert stats_elapsed < full_elapsed
+
+        assert max(payloads) - min(payloads) < 100
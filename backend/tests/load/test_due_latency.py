@@ -0,0 +1,48 @@
+"""
+Benchmark of /tasks/due polling against a large tasks table
+"""
+import time
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+TASKS = 1_000_000
+STATUSES = 5
+ROUNDS = 20
+
+
+@pytest.mark.load
+@pytest.mark.slow
+class TestDueLatency:
+    """Measure the minute-by-minute reminder poll once the table holds millions of rows."""
+
+    async def test_due_pages_stay_fast(self, async_client: AsyncClient, test_session: AsyncSession):
+        """Test overdue and upcoming pages, with and without terminal statuses, take a few milliseconds."""
+        # Most overdue tasks are done, the case that would make a filtered deadline scan slow; one in 50 stays open.
+        await test_session.execute(text(
+            "INSERT INTO statuses (name) VALUES ('Done'), " + ", ".join(f"('status-{i}')" for i in range(1, STATUSES))
+        ))
+        await test_session.execute(text(
+            "INSERT INTO tasks (status_id, created_at, deadline, description) "
+            f"SELECT CASE WHEN i >= {TASKS * 9 // 10} THEN i % {STATUSES} + 1 WHEN i % 50 = 0 THEN 2 ELSE 1 END, now(), "
+            f"now() + (i - {TASKS * 9 // 10}) * interval '1 minute', 'task ' || i "
+            f"FROM generate_series(1, {TASKS}) i"
+        ))
+        await test_session.commit()
+        connection = await test_session.connection()
+        await connection.exec_driver_sql("ANALYZE tasks")
+        await test_session.commit()
+
+        for query in ({}, {"open": True}, {"mode": "after"}, {"mode": "after", "open": True}):
+            await async_client.get("/tasks/due", params=query)
+            started = time.perf_counter()
+            for _ in range(ROUNDS):
+                response = await async_client.get("/tasks/due", params=query)
+            elapsed = (time.perf_counter() - started) / ROUNDS
+
+            print(f"\n{TASKS} tasks, {query}: {elapsed * 1000:.1f} ms per page")
+            assert len(response.json()["items"]) == 100
+            assert elapsed < 0.05
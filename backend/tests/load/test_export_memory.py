@@ -0,0 +1,57 @@
+"""
+Memory profile of the streaming task export
+"""
+import tracemalloc
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from source.db.repositories import TaskRepository
+from source.services.task import TaskService
+from source.schemas.task import params
+
+
+async def _seed_tasks(session: AsyncSession, count: int, priority_id: int, status_id: int, label_id: int):
+    await session.execute(
+        text(
+            "INSERT INTO tasks (status_id, priority_id, label_id, created_at, description) "
+            "SELECT :status_id, :priority_id, :label_id, now(), 'exported task ' || n "
+            "FROM generate_series(1, :count) AS n"
+        ),
+        {"count": count, "priority_id": priority_id, "status_id": status_id, "label_id": label_id},
+    )
+    await session.commit()
+
+
+async def _export_peak(session: AsyncSession, format: str) -> tuple[int, int]:
+    service = TaskService(TaskRepository(session))
+    tracemalloc.start()
+    size = 0
+    async for chunk in service.export_tasks(params.ExportTasks(format=format)):
+        size += len(chunk)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    await session.rollback()
+    return size, peak
+
+
+@pytest.mark.load
+@pytest.mark.slow
+class TestExportMemory:
+    """Test export memory stays flat as the number of rows grows."""
+
+    @pytest.mark.parametrize("format", ["ndjson", "csv"])
+    async def test_export_memory_is_flat(self, test_session: AsyncSession, test_priority, test_status, test_label, format):
+        """Test a 10x larger export does not need 10x more memory."""
+        # The rollback after each export expires the fixtures, so read their ids up front.
+        references = test_priority.id, test_status.id, test_label.id
+        await _seed_tasks(test_session, 20_000, *references)
+        small_size, small_peak = await _export_peak(test_session, format)
+
+        await _seed_tasks(test_session, 180_000, *references)
+        large_size, large_peak = await _export_peak(test_session, format)
+
+        print(f"\n{format}: 20k rows peak={small_peak / 2**20:.1f}MiB, 200k rows peak={large_peak / 2**20:.1f}MiB")
+        assert large_size > 9 * small_size
+        assert large_peak < 2 * small_peak
@@ -0,0 +1,122 @@
+"""
+Benchmark of name-joined and id-filtered task list queries at 1M tasks
+"""
+import time
+
+import pytest
+from sqlalchemy import Select, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from source.db.models import Task, Priority, Label, Status
+from source.db.repositories import TaskRepository
+from source.schemas.task import params
+
+
+TASKS = 1_000_000
+LABELS = 50
+STATUSES = 10
+PRIORITIES = 5
+ROUNDS = 20
+# Single filters take a couple of milliseconds either way, too little for a stable relative comparison.
+SINGLE_FILTER_BUDGET = 0.02
+
+FILTERS = [
+    {"label": "label-7"},
+    {"status": "status-3"},
+    {"status": "status-3", "priority": "priority-2"},
+    {"label": "label-7", "status": "status-3", "priority": "priority-2"},
+]
+
+
+def _name_joined_query(parameters: params.GetTasks) -> Select:
+    query = (
+        select(
+            Task.id,
+            Task.deadline,
+            Task.description,
+            Task.created_at,
+            Priority.name.label('priority'),
+            Label.name.label('label'),
+            Status.name.label('status'),
+        )
+        .join(Priority, Priority.id == Task.priority_id)
+        .join(Label, Label.id == Task.label_id)
+        .join(Status, Status.id == Task.status_id)
+    )
+    if parameters.label is not None:
+        query = query.where(Label.name == parameters.label)
+    if parameters.priority is not None:
+        query = query.where(Priority.name == parameters.priority)
+    if parameters.status is not None:
+        query = query.where(Status.name == parameters.status)
+    return query.order_by(Task.id).limit(parameters.limit + 1)
+
+
+async def _seed(session: AsyncSession):
+    for table, prefix, count in (
+        ("labels", "label", LABELS),
+        ("statuses", "status", STATUSES),
+        ("priorities", "priority", PRIORITIES),
+    ):
+        await session.execute(text(
+            f"INSERT INTO {table} (name) SELECT '{prefix}-' || i FROM generate_series(1, {count}) i"
+        ))
+
+    # Every 20th task has no label, which the name-joined query silently drops.
+    await session.execute(text(
+        "INSERT INTO tasks (status_id, priority_id, label_id, created_at, description) "
+        f"SELECT i % {STATUSES} + 1, i % {PRIORITIES} + 1, "
+        f"CASE WHEN i % 20 = 0 THEN NULL ELSE i % {LABELS} + 1 END, now(), 'task ' || i "
+        f"FROM generate_series(1, {TASKS}) i"
+    ))
+    await session.commit()
+    await (await session.connection()).exec_driver_sql("ANALYZE")
+    await session.commit()
+
+
+async def _timed(call) -> float:
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        await call()
+    return (time.perf_counter() - started) / ROUNDS
+
+
+@pytest.mark.load
+@pytest.mark.slow
+class TestFilterQueryShapes:
+    """Compare filtering through name joins against filtering on resolved ids."""
+
+    async def test_id_filters_faster_than_name_joins(self, test_session: AsyncSession):
+        """Test id filters beat name joins when combined, stay within budget alone and keep NULL references."""
+        await _seed(test_session)
+        repo = TaskRepository(test_session)
+
+        for filters in FILTERS:
+            parameters = params.GetTasks(**filters)
+
+            async def name_joined():
+                return (await test_session.execute(_name_joined_query(parameters))).fetchall()
+
+            async def id_filtered():
+                return await repo.get_tasks(parameters)
+
+            if "label" in filters:
+                assert [row.id for row in await name_joined()] == [row.id for row in await id_filtered()]
+
+            old_elapsed = await _timed(name_joined)
+            new_elapsed = await _timed(id_filtered)
+            print(
+                f"\n{filters}: name joins {old_elapsed * 1000:.2f} ms, "
+                f"id filters {new_elapsed * 1000:.2f} ms, "
+                f"speedup {old_elapsed / new_elapsed:.1f}x"
+            )
+            if len(filters) > 1:
+                assert new_elapsed <= old_elapsed * 1.1
+            else:
+                assert new_elapsed < SINGLE_FILTER_BUDGET
+
+        unfiltered = params.GetTasks(limit=1000)
+        old_rows = (await test_session.execute(_name_joined_query(unfiltered))).fetchall()
+        new_rows = await repo.get_tasks(unfiltered)
+        assert any(row.label is None for row in new_rows)
+        assert len({row.id for row in new_rows} - {row.id for row in old_rows}) > 0
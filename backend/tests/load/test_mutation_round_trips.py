@@ -0,0 +1,107 @@
+"""
+Round-trip and latency comparison of the ORM and RETURNING mutation paths
+"""
+import statistics
+import time
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from source.db.repositories import TaskRepository
+
+
+ITERATIONS = 200
+
+
+class StatementCounter:
+    """Count statements sent to the database through an engine."""
+
+    def __init__(self, session: AsyncSession):
+        self.engine = session.bind.sync_engine  # type: ignore
+        self.count = 0
+
+    def _on_execute(self, *args):
+        self.count += 1
+
+    def __enter__(self):
+        event.listen(self.engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *args):
+        event.remove(self.engine, "before_cursor_execute", self._on_execute)
+
+
+def _report(name: str, latencies: list[float], statements: int):
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(
+        f"\n{name}: {statements / len(latencies):.1f} statements/op, "
+        f"p50={quantiles[49] * 1000:.2f}ms p99={quantiles[98] * 1000:.2f}ms"
+    )
+
+
+@pytest.mark.load
+@pytest.mark.slow
+class TestMutationRoundTrips:
+    """Compare get/mutate/commit/refresh against single-statement RETURNING."""
+
+    async def _create_tasks(self, repo: TaskRepository, count: int) -> list[int]:
+        ids = []
+        for i in range(count):
+            model = await repo.insert_returning(description=f"task {i}", created_at=datetime.now())
+            ids.append(model.id)
+        return ids
+
+    async def test_update_round_trips(self, test_session: AsyncSession):
+        """Test RETURNING updates use one statement instead of three."""
+        repo = TaskRepository(test_session)
+        ids = await self._create_tasks(repo, ITERATIONS)
+
+        legacy_latencies = []
+        with StatementCounter(test_session) as legacy:
+            for task_id in ids:
+                started = time.perf_counter()
+                model = await repo.get_by_id(task_id)
+                await repo.update(model, description="legacy")
+                legacy_latencies.append(time.perf_counter() - started)
+
+        returning_latencies = []
+        with StatementCounter(test_session) as returning:
+            for task_id in ids:
+                started = time.perf_counter()
+                await repo.update_by_id_returning(task_id, description="returning")
+                returning_latencies.append(time.perf_counter() - started)
+
+        _report("update legacy", legacy_latencies, legacy.count)
+        _report("update returning", returning_latencies, returning.count)
+
+        assert returning.count == ITERATIONS
+        assert legacy.count >= 3 * ITERATIONS
+
+    async def test_delete_round_trips(self, test_session: AsyncSession):
+        """Test RETURNING deletes use one statement instead of two."""
+        repo = TaskRepository(test_session)
+        legacy_ids = await self._create_tasks(repo, ITERATIONS)
+        returning_ids = await self._create_tasks(repo, ITERATIONS)
+
+        legacy_latencies = []
+        with StatementCounter(test_session) as legacy:
+            for task_id in legacy_ids:
+                started = time.perf_counter()
+                model = await repo.get_by_id(task_id)
+                await repo.delete(model)
+                legacy_latencies.append(time.perf_counter() - started)
+
+        returning_latencies = []
+        with StatementCounter(test_session) as returning:
+            for task_id in returning_ids:
+                started = time.perf_counter()
+                assert await repo.delete_by_id_returning(task_id) is not None
+                returning_latencies.append(time.perf_counter() - started)
+
+        _report("delete legacy", legacy_latencies, legacy.count)
+        _report("delete returning", returning_latencies, returning.count)
+
+        assert returning.count == ITERATIONS
+        assert await repo.delete_by_id_returning(returning_ids[0]) is None
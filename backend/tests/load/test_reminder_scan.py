@@ -0,0 +1,75 @@
+"""
+Benchmark of reminder scans over a tasks table with millions of deadlines
+"""
+import time
+from collections import Counter
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from source.services.reminders import ReminderScheduler, ReminderSink
+from tests.conftest import test_async_session_maker
+
+
+TASKS = 2_000_000
+DUE = 5_000
+
+
+class _CountingSink(ReminderSink):
+
+    def __init__(self):
+        self.delivered: Counter = Counter()
+
+    async def send(self, reminders):
+        self.delivered.update(reminder.task_id for reminder in reminders)
+
+
+@pytest.mark.load
+@pytest.mark.slow
+class TestReminderScan:
+    """Measure scan cost when only a sliver of millions of tasks is due."""
+
+    async def test_scan_cost_tracks_due_tasks_not_table_size(self, test_session: AsyncSession):
+        """Test a scan sends the due tasks quickly and an idle scan costs about nothing."""
+        # Already-reminded history, far-future deadlines and DUE tasks inside the reminder window.
+        await test_session.execute(text(
+            "INSERT INTO tasks (created_at, deadline, reminder_sent_at, description) "
+            f"SELECT now(), localtimestamp - i * interval '1 minute', localtimestamp, 'done ' || i "
+            f"FROM generate_series(1, {TASKS // 2}) i"
+        ))
+        await test_session.execute(text(
+            "INSERT INTO tasks (created_at, deadline, description) "
+            f"SELECT now(), localtimestamp + interval '30 days' + i * interval '1 second', 'later ' || i "
+            f"FROM generate_series(1, {TASKS // 2 - DUE}) i"
+        ))
+        await test_session.execute(text(
+            "INSERT INTO tasks (created_at, deadline, description) "
+            f"SELECT now(), localtimestamp + i * interval '100 milliseconds', 'due ' || i "
+            f"FROM generate_series(1, {DUE}) i"
+        ))
+        await test_session.commit()
+        connection = await test_session.connection()
+        await connection.exec_driver_sql("ANALYZE tasks")
+        await test_session.commit()
+
+        sink = _CountingSink()
+        scheduler = ReminderScheduler(
+            sink, session_maker=test_async_session_maker, batch_size=500,
+            lead=timedelta(hours=1), grace=timedelta(days=1),
+        )
+
+        await scheduler.scan()
+        busy = scheduler.stats.last_scan_seconds
+        started = time.perf_counter()
+        await scheduler.scan()
+        idle = time.perf_counter() - started
+
+        print(
+            f"\n{TASKS} tasks: sent {scheduler.stats.sent} in {busy * 1000:.0f} ms "
+            f"({scheduler.stats.throughput:.0f}/s, {scheduler.stats.batches} batches), idle scan {idle * 1000:.1f} ms"
+        )
+        assert len(sink.delivered) == DUE
+        assert set(sink.delivered.values()) == {1}
+        assert idle < 0.02
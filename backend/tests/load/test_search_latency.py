@@ -0,0 +1,107 @@
+"""
+Benchmark of full-text task search at 1M tasks
+"""
+import time
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from source.db.models import Task
+from source.db.repositories import TaskRepository
+from source.schemas.task import params
+
+
+TASKS = 1_000_000
+ROUNDS = 20
+# Per page, including terms that match a third of the table.
+PAGE_BUDGET = 0.1
+
+WORDS = ["invoice", "deploy", "refactor", "customer", "billing", "database", "release", "review", "urgent", "report"]
+
+RARE_WORD = "escalation"
+
+QUERIES = [
+    {"q": RARE_WORD},
+    {"q": "invoice"},
+    {"q": "urgent deploy"},
+    {"q": '"customer billing"'},
+    {"q": "database -release"},
+    {"q": "review", "status": "status-3"},
+]
+
+
+async def _seed(session: AsyncSession):
+    await session.execute(text("INSERT INTO statuses (name) SELECT 'status-' || i FROM generate_series(1, 10) i"))
+
+    # Three words from a small vocabulary match ~30% of rows each; one row in 10k has a rare word.
+    words = "ARRAY[" + ", ".join(f"'{word}'" for word in WORDS) + "]"
+    await session.execute(text(
+        "INSERT INTO tasks (status_id, created_at, description) "
+        f"SELECT i % 10 + 1, now(), "
+        f"concat_ws(' ', ({words})[i % 10 + 1], ({words})[(i / 10) % 10 + 1], ({words})[(i / 100) % 10 + 1], "
+        f"CASE WHEN i % 10000 = 0 THEN '{RARE_WORD}' END, 'task', i) "
+        f"FROM generate_series(1, {TASKS}) i"
+    ))
+    await session.commit()
+    await (await session.connection()).exec_driver_sql("ANALYZE")
+    await session.commit()
+
+
+async def _timed(call) -> float:
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        await call()
+    return (time.perf_counter() - started) / ROUNDS
+
+
+@pytest.mark.load
+@pytest.mark.slow
+class TestSearchLatency:
+    """Compare indexed ranked search against an unindexed ILIKE scan of descriptions."""
+
+    async def test_search_pages(self, test_session: AsyncSession):
+        """Test first and follow-up pages stay within budget for rare and common terms and beat a substring scan."""
+        await _seed(test_session)
+        repo = TaskRepository(test_session)
+
+        for query in QUERIES:
+            parameters = params.SearchTasks(**query)
+
+            async def first_page():
+                return await repo.search_tasks(parameters)
+
+            rows = await first_page()
+            assert rows and all("<mark>" in row.snippet for row in rows)
+            assert [row.rank for row in rows] == sorted((row.rank for row in rows), reverse=True)
+
+            last = rows[parameters.limit - 1] if len(rows) > parameters.limit else rows[-1]
+
+            async def next_page():
+                return await repo.search_tasks(parameters, after=(last.rank, last.id))
+
+            following = await next_page()
+            assert not {row.id for row in following} & {row.id for row in rows[:parameters.limit]}
+
+            first_elapsed = await _timed(first_page)
+            next_elapsed = await _timed(next_page)
+            print(f"\n{query}: first page {first_elapsed * 1000:.2f} ms, next page {next_elapsed * 1000:.2f} ms")
+            assert first_elapsed < PAGE_BUDGET
+            assert next_elapsed < PAGE_BUDGET
+
+        word = RARE_WORD
+
+        async def substring_scan():
+            query = select(Task.id).where(Task.description.ilike(f"%{word}%")).order_by(Task.id).limit(21)
+            return (await test_session.execute(query)).fetchall()
+
+        async def indexed_search():
+            return await repo.search_tasks(params.SearchTasks(q=word))
+
+        # GIN trigram indexes are only reachable through bitmap scans, so this keeps the baseline unindexed.
+        await test_session.execute(text("SET enable_bitmapscan = off"))
+        scan_elapsed = await _timed(substring_scan)
+        await test_session.execute(text("RESET enable_bitmapscan"))
+        search_elapsed = await _timed(indexed_search)
+        print(f"\nILIKE scan {scan_elapsed * 1000:.2f} ms, ranked search {search_elapsed * 1000:.2f} ms")
+        assert search_elapsed < scan_elapsed
@@ -0,0 +1,55 @@
+"""
+Benchmark of task change fan-out to many idle stream subscribers
+"""
+import time
+import tracemalloc
+from collections import namedtuple
+from datetime import datetime
+
+import pytest
+
+from source.db.changes import Change, UPDATE
+from source.services.task_stream import TaskStreamHub
+
+
+SUBSCRIBERS = 5000
+CHANGES = 50
+
+Row = namedtuple("Row", "id deadline description created_at priority label status")
+
+
+async def _load(ids: list[int]) -> list[Row]:
+    return [Row(id, None, f"Task {id}", datetime(2025, 1, 1), "High", "Bug", "Open") for id in ids]
+
+
+@pytest.mark.load
+@pytest.mark.slow
+class TestTaskStreamFanout:
+    """Measure per-change fan-out cost and memory with thousands of subscribers."""
+
+    async def test_fanout_to_idle_subscribers(self):
+        """Test every subscriber gets each event, memory stays bounded and laggards are evicted."""
+        hub = TaskStreamHub(load=_load, queue_size=CHANGES // 2, heartbeat=60, max_subscribers=SUBSCRIBERS)
+
+        tracemalloc.start()
+        subscriptions = [hub.subscribe() for _ in range(SUBSCRIBERS)]
+        started = time.perf_counter()
+        for id in range(CHANGES // 2):
+            hub.on_changes([Change("tasks", UPDATE, (id,))])
+            await hub._dispatcher
+        elapsed = (time.perf_counter() - started) / (CHANGES // 2)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(
+            f"\n{SUBSCRIBERS} subscribers: {elapsed * 1000:.2f} ms per change, "
+            f"peak {peak / 1024 / 1024:.1f} MiB"
+        )
+        assert all(subscription.queue.full() for subscription in subscriptions)
+        assert elapsed < 0.1
+
+        # Nobody drains: the next change overflows every buffer and evicts all subscribers.
+        hub.on_changes([Change("tasks", UPDATE, (0,))])
+        await hub._dispatcher
+        assert hub.evictions == SUBSCRIBERS
+        assert not hub.subscribers
@@ -0,0 +1,83 @@
+"""
+Benchmark of trigram substring search and typeahead at 1M tasks
+"""
+import time
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from source.db.models import Task
+from source.db.repositories import TaskRepository
+from source.schemas.task import params
+
+
+TASKS = 1_000_000
+ROUNDS = 20
+
+
+async def _seed(session: AsyncSession):
+    await session.execute(text("INSERT INTO labels (name) SELECT 'label-' || md5(i::text) FROM generate_series(1, 200) i"))
+
+    # Two pseudo-random words per task keep trigrams selective, as in real free text.
+    await session.execute(text(
+        "INSERT INTO tasks (created_at, description) "
+        "SELECT now(), 'task ' || substr(md5(i::text), 1, 10) || ' ' || substr(md5((i * 7)::text), 1, 10) "
+        f"FROM generate_series(1, {TASKS}) i"
+    ))
+    await session.commit()
+    await (await session.connection()).exec_driver_sql("ANALYZE")
+    await session.commit()
+
+
+async def _timed(call) -> float:
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        await call()
+    return (time.perf_counter() - started) / ROUNDS
+
+
+@pytest.mark.load
+@pytest.mark.slow
+class TestTrigramSearch:
+    """Compare trigram-indexed search against ILIKE without an index."""
+
+    async def test_typeahead_and_contains(self, test_session: AsyncSession):
+        """Test typeahead answers within milliseconds and indexed contains beats a scan."""
+        await _seed(test_session)
+        repo = TaskRepository(test_session)
+        word = (await test_session.execute(text("SELECT substr(md5('4242'), 1, 10)"))).scalar_one()
+
+        async def typeahead():
+            return await repo.typeahead(word[:6], 10, 0.3)
+
+        async def contains():
+            return await repo.search_tasks(params.SearchTasks(q=word[2:8], mode="contains"))
+
+        async def typo():
+            return await repo.search_tasks(params.SearchTasks(q=word[:4] + word[5:], mode="fuzzy", threshold=0.5))
+
+        assert any(row.kind == "task" and row.id == 4242 for row in await typeahead())
+        assert 4242 in [row.id for row in await contains()]
+        assert 4242 in [row.id for row in await typo()]
+
+        typeahead_elapsed = await _timed(typeahead)
+        contains_elapsed = await _timed(contains)
+        typo_elapsed = await _timed(typo)
+
+        await test_session.execute(text("SET LOCAL enable_bitmapscan = off"))
+        await test_session.execute(text("SET LOCAL enable_indexscan = off"))
+
+        async def scan():
+            query = select(Task.id).where(Task.description.ilike(f"%{word[2:8]}%")).limit(21)
+            return (await test_session.execute(query)).fetchall()
+
+        scan_elapsed = await _timed(scan)
+        await test_session.rollback()
+
+        print(
+            f"\ntypeahead {typeahead_elapsed * 1000:.2f} ms, contains {contains_elapsed * 1000:.2f} ms, "
+            f"fuzzy {typo_elapsed * 1000:.2f} ms, unindexed ILIKE {scan_elapsed * 1000:.2f} ms"
+        )
+        assert typeahead_elapsed < 0.05
+        assert contains_elapsed < scan_elapsed
@@ -0,0 +1,102 @@
+"""
+Unit tests for cross-worker change notifications
+"""
+import asyncio
+import json
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from source.db.changes import Change, INSERT, ORIGIN, decode_changes, subscribe, unsubscribe
+from source.db.notifications import ChangeListener
+
+
+def _payload(origin: str, *changes: Change) -> str:
+    """Encode changes the way the notify trigger does."""
+    items = [
+        {"table": change.table, "op": change.op, "ids": list(change.ids), "values": list(change.values)}
+        for change in changes
+    ]
+    return json.dumps({"origin": origin, "changes": items})
+
+
+class FakeConnection:
+    """asyncpg connection stand-in that can be terminated on demand."""
+
+    def __init__(self):
+        self.termination_listeners = []
+        self.add_listener = AsyncMock()
+        self.execute = AsyncMock()
+        self.closed = False
+
+    def add_termination_listener(self, callback):
+        self.termination_listeners.append(callback)
+
+    def is_closed(self):
+        return self.closed
+
+    def terminate(self):
+        self.closed = True
+        for callback in self.termination_listeners:
+            callback(self)
+
+
+@pytest.mark.unit
+class TestChangeNotifications:
+    """Test payload encoding and the LISTEN loop."""
+
+    @pytest.fixture
+    def published(self):
+        """Collect changes published to local subscribers."""
+        received: list[Change] = []
+        subscriber = subscribe(received.extend)
+        yield received
+        unsubscribe(subscriber)
+
+    def test_decode(self):
+        """Test trigger payloads decode into changes with their origin."""
+        # Arrange
+        change = Change("tasks", INSERT, (1, 2), ({"label_id": 1, "status_id": None, "priority_id": 2},))
+
+        # Act
+        origin, decoded = decode_changes(_payload("worker-a", change))
+
+        # Assert
+        assert origin == "worker-a"
+        assert decoded == [change]
+
+    def test_foreign_notifications_are_published(self, published):
+        """Test changes from other workers reach local subscribers and our own are skipped."""
+        # Arrange
+        listener = ChangeListener(connect=AsyncMock())
+        change = Change("labels", INSERT, (1,))
+
+        # Act
+        listener.on_notification(None, 1, "table_changes", _payload("other", change))
+        listener.on_notification(None, 1, "table_changes", _payload(ORIGIN, change))
+        listener.on_notification(None, 1, "table_changes", "not json")
+
+        # Assert
+        assert published == [change]
+
+    async def test_reconnect_flushes_everything(self, published):
+        """Test a dropped LISTEN connection reconnects with backoff and flushes all tables."""
+        # Arrange
+        first, second = FakeConnection(), FakeConnection()
+        connect = AsyncMock(side_effect=[first, OSError("refused"), second])
+        listener = ChangeListener(connect=connect, heartbeat=10, backoff_min=0.01, backoff_max=0.02)
+
+        # Act
+        await listener.start()
+        await asyncio.wait_for(listener.connected.wait(), timeout=1)
+        assert published == []
+
+        first.terminate()
+        while listener.reconnects == 0:
+            await asyncio.sleep(0.01)
+        await listener.stop()
+
+        # Assert
+        assert connect.await_count == 3
+        second.add_listener.assert_awaited_once()
+        assert {change.table for change in published} >= {"tasks", "labels", "statuses", "priorities"}
+        assert all(change.ids == () for change in published)
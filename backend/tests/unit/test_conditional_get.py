@@ -0,0 +1,110 @@
+"""
+Unit tests for ETag based conditional GETs on list endpoints
+"""
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from httpx import AsyncClient, ASGITransport
+
+from source.api.app import app
+from source.api.conditional import etag_matches, get_database_versions
+from source.db.versions import DatabaseVersions
+from source.schemas.label import responses
+from source.services import get_label_service
+
+
+class FakeVersions:
+    """Stamps kept in a dict instead of read from the database."""
+
+    def __init__(self):
+        self.versions = {"labels": "a", "tasks": "1"}
+
+    async def stamp(self, *tables: str) -> str:
+        return ":".join(f"{table}={self.versions[table]}" for table in tables)
+
+
+@pytest.mark.unit
+class TestConditionalGet:
+    """Test ETag generation and 304 responses without touching the database."""
+
+    @pytest.fixture
+    async def client(self):
+        """HTTP client with a mocked label service."""
+        service = MagicMock()
+        service.get_labels = AsyncMock(return_value=responses.GetLabels(items=[responses.Label(id=1, name="Bug")]))
+        versions = FakeVersions()
+        app.dependency_overrides[get_label_service] = lambda: service
+        app.dependency_overrides[get_database_versions] = lambda: versions
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            yield client, service, versions
+
+        app.dependency_overrides.clear()
+
+    def test_etag_matches(self):
+        """Test If-None-Match lists, wildcards and weak validators."""
+        assert etag_matches('"a", "b"', '"b"')
+        assert etag_matches('W/"b"', '"b"')
+        assert etag_matches("*", '"b"')
+        assert not etag_matches('"a"', '"b"')
+        assert not etag_matches(None, '"b"')
+
+    async def test_not_modified_skips_service(self, client):
+        """Test a matching If-None-Match answers 304 without calling the service."""
+        # Arrange
+        client, service, _ = client
+        first = await client.get("/labels/get")
+        etag = first.headers["etag"]
+
+        # Act
+        response = await client.get("/labels/get", headers={"If-None-Match": etag})
+
+        # Assert
+        assert first.status_code == 200
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+        assert response.content == b""
+        service.get_labels.assert_awaited_once()
+
+    async def test_change_invalidates_etag(self, client):
+        """Test a committed change to the table produces a new ETag."""
+        # Arrange
+        client, service, versions = client
+        etag = (await client.get("/labels/get")).headers["etag"]
+
+        # Act
+        versions.versions["labels"] = "b"
+        response = await client.get("/labels/get", headers={"If-None-Match": etag})
+
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    async def test_unrelated_change_keeps_etag(self, client):
+        """Test changes to other tables keep the ETag valid."""
+        # Arrange
+        client, service, versions = client
+        etag = (await client.get("/labels/get")).headers["etag"]
+
+        # Act
+        versions.versions["tasks"] = "2"
+        response = await client.get("/labels/get", headers={"If-None-Match": etag})
+
+        # Assert
+        assert response.status_code == 304
+
+    async def test_stamp_lists_in_flight_writers_below_newest_version(self):
+        """Test only transactions older than the newest task version are part of the stamp."""
+        # Arrange
+        session = MagicMock()
+        result = MagicMock()
+        row = MagicMock()
+        row.__getitem__.side_effect = lambda index: [100, "digest"][index]
+        row.in_flight = [90, 120]
+        result.one.return_value = row
+        session.execute = AsyncMock(return_value=result)
+
+        # Act
+        stamp = await DatabaseVersions(session).stamp("tasks", "labels")
+
+        # Assert
+        assert stamp == "tasks=100:labels=digest:90"
@@ -0,0 +1,125 @@
+"""
+Unit tests for Accept negotiation and the binary list encodings
+"""
+import io
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import msgpack
+import pytest
+from httpx import AsyncClient, ASGITransport
+
+from source.api.app import app
+from source.api.conditional import get_database_versions
+from source.services import formats, get_label_service
+from source.schemas.label import responses
+
+pyarrow = pytest.importorskip("pyarrow")
+import pyarrow.ipc
+import pyarrow.parquet
+
+
+LABELS = [SimpleNamespace(id=1, name="Bug"), SimpleNamespace(id=2, name='Quoted "ünïcode"')]
+
+
+@pytest.mark.unit
+class TestContentNegotiation:
+    """Test media type selection, 406 responses and per-representation ETags on /labels/get."""
+
+    @pytest.fixture
+    async def client(self):
+        """HTTP client with a label service encoding fixed rows."""
+        service = MagicMock()
+        service.get_labels = AsyncMock(return_value=responses.GetLabels(items=[responses.Label(id=1, name="Bug")]))
+        service.encode_labels = AsyncMock(
+            side_effect=lambda media_type: formats.encode_models(media_type, responses.Label, LABELS)
+        )
+        versions = MagicMock()
+        versions.stamp = AsyncMock(return_value="labels=a")
+        app.dependency_overrides[get_label_service] = lambda: service
+        app.dependency_overrides[get_database_versions] = lambda: versions
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            yield client, service
+
+        app.dependency_overrides.clear()
+
+    @pytest.mark.parametrize("accept,expected", [
+        (None, formats.JSON),
+        ("*/*", formats.JSON),
+        ("application/*", formats.JSON),
+        ("application/msgpack", formats.MSGPACK),
+        ("application/x-msgpack", formats.MSGPACK),
+        ("application/json;q=0.5, application/msgpack", formats.MSGPACK),
+        ("application/vnd.apache.arrow.stream;q=0.9, application/json;q=0.1", formats.ARROW),
+        ("*/*, application/json;q=0", formats.MSGPACK),
+        ("text/html, application/vnd.apache.parquet", formats.PARQUET),
+    ])
+    async def test_negotiated_media_type(self, client, accept, expected):
+        """Test the highest-quality supported type is chosen, preferring JSON on ties."""
+        # Arrange
+        client, _ = client
+        headers = {"Accept": accept} if accept else {}
+
+        # Act
+        response = await client.get("/labels/get", headers=headers)
+
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith(expected)
+        assert response.headers["vary"] == "Accept"
+
+    async def test_unsupported_type_is_406(self, client):
+        """Test nothing acceptable answers 406 listing what is offered, without calling the service."""
+        # Arrange
+        client, service = client
+
+        # Act
+        response = await client.get("/labels/get", headers={"Accept": "text/csv, application/json;q=0"})
+
+        # Assert
+        assert response.status_code == 406
+        assert formats.MSGPACK in response.json()["detail"]
+        service.get_labels.assert_not_awaited()
+        service.encode_labels.assert_not_awaited()
+
+    async def test_missing_library_is_not_offered(self, client, monkeypatch):
+        """Test a format whose library is not installed is refused rather than failing."""
+        # Arrange
+        client, _ = client
+        monkeypatch.setattr(formats, "pyarrow", None)
+
+        # Act
+        response = await client.get("/labels/get", headers={"Accept": formats.ARROW})
+
+        # Assert
+        assert response.status_code == 406
+
+    async def test_etag_per_representation(self, client):
+        """Test a JSON validator does not revalidate a msgpack request."""
+        # Arrange
+        client, _ = client
+        etag = (await client.get("/labels/get")).headers["etag"]
+
+        # Act
+        response = await client.get("/labels/get", headers={"Accept": formats.MSGPACK, "If-None-Match": etag})
+
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    async def test_binary_bodies_decode_to_json_document(self, client):
+        """Test msgpack, Arrow and Parquet bodies carry the same rows as JSON."""
+        # Arrange
+        client, _ = client
+        expected = [{"id": 1, "name": "Bug"}, {"id": 2, "name": 'Quoted "ünïcode"'}]
+
+        # Act
+        packed = await client.get("/labels/get", headers={"Accept": formats.MSGPACK})
+        arrow = await client.get("/labels/get", headers={"Accept": formats.ARROW})
+        parquet = await client.get("/labels/get", headers={"Accept": formats.PARQUET})
+
+        # Assert
+        assert msgpack.unpackb(packed.content) == {"items": expected}
+        assert pyarrow.ipc.open_stream(arrow.content).read_all().to_pylist() == expected
+        assert pyarrow.parquet.read_table(io.BytesIO(parquet.content)).to_pylist() == expected
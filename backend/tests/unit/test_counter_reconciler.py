@@ -0,0 +1,60 @@
+"""
+Unit tests for the periodic task counter reconciler
+"""
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from source.services.counters import CounterReconciler, create_reconciler
+
+
+@asynccontextmanager
+async def _session():
+    yield MagicMock()
+
+
+@pytest.mark.unit
+class TestCounterReconciler:
+    """Test reconciliation runs, their statistics and the background loop."""
+
+    @pytest.fixture
+    def repository(self, mocker, mock_task_repository):
+        """Patch the reconciler's repository with the shared mock."""
+        mocker.patch("source.services.counters.TaskRepository", return_value=mock_task_repository)
+        return mock_task_repository
+
+    async def test_reconcile_counts_repairs(self, repository):
+        """Test each run is counted and repaired keys accumulate."""
+        # Arrange
+        repository.reconcile_counters = AsyncMock(side_effect=[2, 0])
+        reconciler = CounterReconciler(session_maker=_session)
+
+        # Act
+        first = await reconciler.reconcile()
+        second = await reconciler.reconcile()
+
+        # Assert
+        assert (first, second) == (2, 0)
+        assert (reconciler.runs, reconciler.repaired) == (2, 2)
+
+    async def test_run_survives_failures(self):
+        """Test the background loop counts a failed run and keeps going."""
+        # Arrange
+        reconciler = CounterReconciler(session_maker=_session, interval=0.01)
+        reconciler.reconcile = AsyncMock(side_effect=[RuntimeError("database down"), 0, 0, 0, 0])
+
+        # Act
+        await reconciler.start()
+        await asyncio.sleep(0.05)
+        await reconciler.stop()
+
+        # Assert
+        assert reconciler.failures == 1
+        assert reconciler.reconcile.await_count >= 2
+
+    def test_zero_interval_disables(self):
+        """Test a zero interval leaves the background run off."""
+        assert create_reconciler(0) is None
+        assert create_reconciler(60).interval == 60
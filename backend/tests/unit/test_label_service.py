@@ -1,11 +1,14 @@
 """
 Unit tests for LabelService
 """
+import json
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 from fastapi import HTTPException
+from sqlalchemy import exc
 
 from source.services.label import LabelService
+from source.services.reference import ReferenceCache
 from source.schemas.label import params, responses
 from source.db.models import Label
 
@@ -16,7 +19,7 @@ class TestLabelService:
     @pytest.fixture
     def label_service(self, mock_label_repository):
         """Create LabelService instance with mocked repository."""
-        return LabelService(label_repo=mock_label_repository)
+        return LabelService(label_repo=mock_label_repository, cache=ReferenceCache())
 
     @pytest.fixture
     def mock_label_model(self):
@@ -59,14 +62,14 @@ class TestLabelService:
             name="Feature",
             description="Feature-related tasks"
         )
-        mock_label_repository.new = AsyncMock(return_value=mock_label_model)
+        mock_label_repository.insert_returning = AsyncMock(return_value=mock_label_model)
 
         # Act
         result = await label_service.create_label(create_params)
 
         # Assert
         assert isinstance(result, responses.Label)
-        mock_label_repository.new.assert_called_once()
+        mock_label_repository.insert_returning.assert_called_once()
 
     async def test_create_label_failure(self, label_service, mock_label_repository):
         """Test label creation failure."""
@@ -75,7 +78,39 @@ class TestLabelService:
             name="Feature",
             description="Feature-related tasks"
         )
-        mock_label_repository.new = AsyncMock(return_value=None)
+        mock_label_repository.insert_returning = AsyncMock(return_value=None)
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await label_service.create_label(create_params)
+
+        assert exc_info.value.status_code == 500
+
+    async def test_create_label_duplicate_name(self, label_service, mock_label_repository):
+        """Test label creation with a name that already exists."""
+        # Arrange
+        create_params = params.CreateLabel(
+            name="Feature",
+            description="Feature-related tasks"
+        )
+        error = exc.IntegrityError("INSERT", {}, MagicMock(sqlstate="23505"))
+        mock_label_repository.insert_returning = AsyncMock(side_effect=error)
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await label_service.create_label(create_params)
+
+        assert exc_info.value.status_code == 409
+
+    async def test_create_label_integrity_error(self, label_service, mock_label_repository):
+        """Test label creation when another constraint fails."""
+        # Arrange
+        create_params = params.CreateLabel(
+            name="Feature",
+            description="Feature-related tasks"
+        )
+        error = exc.IntegrityError("INSERT", {}, MagicMock(sqlstate="23502"))
+        mock_label_repository.insert_returning = AsyncMock(side_effect=error)
 
         # Act & Assert
         with pytest.raises(HTTPException) as exc_info:
@@ -87,21 +122,20 @@ class TestLabelService:
         """Test successful label deletion."""
         # Arrange
         label_id = 1
-        mock_label_repository.get_by_id = AsyncMock(return_value=mock_label_model)
-        mock_label_repository.delete = AsyncMock(return_value=True)
+        mock_label_repository.delete_by_id_returning = AsyncMock(return_value=mock_label_model)
 
         # Act
         result = await label_service.delete_label(label_id)
 
         # Assert
-        assert isinstance(result, MagicMock)
-        mock_label_repository.delete.assert_called_once()
+        assert isinstance(result, responses.Label)
+        mock_label_repository.delete_by_id_returning.assert_called_once_with(label_id)
 
     async def test_delete_label_not_found(self, label_service, mock_label_repository):
         """Test label deletion when label doesn't exist."""
         # Arrange
         label_id = 999
-        mock_label_repository.get_by_id = AsyncMock(return_value=None)
+        mock_label_repository.delete_by_id_returning = AsyncMock(return_value=None)
 
         # Act & Assert
         with pytest.raises(HTTPException) as exc_info:
@@ -121,15 +155,14 @@ class TestLabelService:
         updated_model.id = label_id
         updated_model.name = "Updated Label"
 
-        mock_label_repository.get_by_id = AsyncMock(return_value=mock_label_model)
-        mock_label_repository.update = AsyncMock(return_value=updated_model)
+        mock_label_repository.update_by_id_returning = AsyncMock(return_value=updated_model)
 
         # Act
         result = await label_service.update_label(update_params, label_id)
 
         # Assert
         assert isinstance(result, responses.Label)
-        mock_label_repository.update.assert_called_once()
+        mock_label_repository.update_by_id_returning.assert_called_once_with(label_id, name="Updated Label")
 
     async def test_update_label_not_found(self, label_service, mock_label_repository):
         """Test label update when label doesn't exist."""
@@ -138,10 +171,38 @@ class TestLabelService:
         update_params = params.UpdateLabel(
             name="Updated Label"
         )
-        mock_label_repository.get_by_id = AsyncMock(return_value=None)
+        mock_label_repository.update_by_id_returning = AsyncMock(return_value=None)
 
         # Act & Assert
         with pytest.raises(HTTPException) as exc_info:
             await label_service.update_label(update_params, label_id)
 
         assert exc_info.value.status_code == 404
+
+    async def test_update_label_duplicate_name(self, label_service, mock_label_repository):
+        """Test label rename to a name that already exists."""
+        # Arrange
+        label_id = 1
+        update_params = params.UpdateLabel(
+            name="Bug"
+        )
+        error = exc.IntegrityError("UPDATE", {}, MagicMock(sqlstate="23505"))
+        mock_label_repository.update_by_id_returning = AsyncMock(side_effect=error)
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await label_service.update_label(update_params, label_id)
+
+        assert exc_info.value.status_code == 409
+
+    async def test_encode_labels_passthrough(self, label_service, mock_label_repository):
+        """Test the passthrough path wraps the Postgres array of response fields in the items envelope."""
+        # Arrange
+        mock_label_repository.select_all_json = AsyncMock(return_value='[{"id" : 1, "name" : "First"}]')
+
+        # Act
+        encoded = await label_service.encode_labels()
+
+        # Assert
+        assert json.loads(encoded) == {"items": [{"id": 1, "name": "First"}]}
+        mock_label_repository.select_all_json.assert_awaited_once_with("id", "name")
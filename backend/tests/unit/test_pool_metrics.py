@@ -0,0 +1,62 @@
+"""
+Unit tests for connection pool instrumentation
+"""
+import pytest
+from unittest.mock import MagicMock
+from sqlalchemy import exc
+from sqlalchemy.pool import QueuePool
+
+from source.db.pool import InstrumentedPoolMixin, PoolMetrics
+
+
+class _InstrumentedSyncPool(InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+@pytest.mark.unit
+class TestPoolMetrics:
+    """Test checkout statistics collected by the instrumented pool."""
+
+    @pytest.fixture
+    def pool(self):
+        """Create a small pool backed by mock DBAPI connections."""
+        return _InstrumentedSyncPool(MagicMock, pool_size=1, max_overflow=1, timeout=0.01)
+
+    def test_histogram_is_cumulative(self):
+        """Test wait observations land in cumulative buckets."""
+        metrics = PoolMetrics(buckets=(0.01, 0.1))
+
+        metrics.observe_wait(0.005)
+        metrics.observe_wait(0.05)
+        metrics.observe_wait(1.0)
+
+        assert metrics.histogram() == {"0.01": 1, "0.1": 2, "+Inf": 3}
+        assert metrics.checkouts == 3
+
+    def test_checkouts_are_counted(self, pool):
+        """Test checked out, idle and overflow connections are reported."""
+        first = pool.connect()
+        second = pool.connect()
+
+        stats = pool.stats()
+        assert stats["checked_out"] == 2
+        assert stats["overflow"] == 1
+        assert stats["checkouts"] == 2
+
+        first.close()
+        second.close()
+
+        stats = pool.stats()
+        assert stats["checked_out"] == 0
+        assert stats["idle"] == 1
+
+    def test_checkout_timeouts_are_counted(self, pool):
+        """Test an exhausted pool records a checkout timeout."""
+        connections = [pool.connect(), pool.connect()]
+
+        with pytest.raises(exc.TimeoutError):
+            pool.connect()
+
+        assert pool.stats()["checkout_timeouts"] == 1
+        for connection in connections:
+            connection.close()
@@ -1,11 +1,14 @@
 """
 Unit tests for PriorityService
 """
+import json
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 from fastapi import HTTPException
+from sqlalchemy import exc
 
 from source.services.priority import PriorityService
+from source.services.reference import ReferenceCache
 from source.schemas.priority import params, responses
 from source.db.models import Priority
 
@@ -17,7 +20,7 @@ class TestPriorityService:
     @pytest.fixture
     def priority_service(self, mock_priority_repository):
         """Create PriorityService instance with mocked repository."""
-        return PriorityService(priority_repo=mock_priority_repository)
+        return PriorityService(priority_repo=mock_priority_repository, cache=ReferenceCache())
     
     @pytest.fixture
     def mock_priority_model(self):
@@ -60,14 +63,14 @@ class TestPriorityService:
             name="Critical",
             description="Critical priority"
         )
-        mock_priority_repository.new = AsyncMock(return_value=mock_priority_model)
+        mock_priority_repository.insert_returning = AsyncMock(return_value=mock_priority_model)
         
         # Act
         result = await priority_service.create_priority(create_params)
         
         # Assert
         assert isinstance(result, responses.Priority)
-        mock_priority_repository.new.assert_called_once()
+        mock_priority_repository.insert_returning.assert_called_once()
     
     async def test_create_priority_failure(self, priority_service, mock_priority_repository):
         """Test priority creation failure."""
@@ -76,37 +79,80 @@ class TestPriorityService:
             name="Critical",
             description="Critical priority"
         )
-        mock_priority_repository.new = AsyncMock(return_value=None)
+        mock_priority_repository.insert_returning = AsyncMock(return_value=None)
         
         # Act & Assert
         with pytest.raises(HTTPException) as exc_info:
             await priority_service.create_priority(create_params)
         
         assert exc_info.value.status_code == 500
+
+    async def test_create_priority_duplicate_name(self, priority_service, mock_priority_repository):
+        """Test priority creation with a name that already exists."""
+        # Arrange
+        create_params = params.CreatePriority(
+            name="Critical",
+            description="Critical priority"
+        )
+        error = exc.IntegrityError("INSERT", {}, MagicMock(sqlstate="23505"))
+        mock_priority_repository.insert_returning = AsyncMock(side_effect=error)
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await priority_service.create_priority(create_params)
+
+        assert exc_info.value.status_code == 409
+
+    async def test_create_priority_integrity_error(self, priority_service, mock_priority_repository):
+        """Test priority creation when another constraint fails."""
+        # Arrange
+        create_params = params.CreatePriority(
+            name="Critical",
+            description="Critical priority"
+        )
+        error = exc.IntegrityError("INSERT", {}, MagicMock(sqlstate="23502"))
+        mock_priority_repository.insert_returning = AsyncMock(side_effect=error)
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await priority_service.create_priority(create_params)
+
+        assert exc_info.value.status_code == 500
     
     async def test_delete_priority_success(self, priority_service, mock_priority_repository, mock_priority_model):
         """Test successful priority deletion."""
         # Arrange
         priority_id = 1
-        mock_priority_repository.get_by_id = AsyncMock(return_value=mock_priority_model)
-        mock_priority_repository.delete = AsyncMock(return_value=True)
+        mock_priority_repository.delete_by_id_returning = AsyncMock(return_value=mock_priority_model)
         
         # Act
         result = await priority_service.delete_priority(priority_id)
         
         # Assert
         assert isinstance(result, responses.Priority)
-        mock_priority_repository.delete.assert_called_once()
+        mock_priority_repository.delete_by_id_returning.assert_called_once_with(priority_id)
     
     async def test_delete_priority_not_found(self, priority_service, mock_priority_repository):
         """Test priority deletion when priority doesn't exist."""
         # Arrange
         priority_id = 999
-        mock_priority_repository.get_by_id = AsyncMock(return_value=None)
+        mock_priority_repository.delete_by_id_returning = AsyncMock(return_value=None)
         
         # Act & Assert
         with pytest.raises(HTTPException) as exc_info:
             await priority_service.delete_priority(priority_id)
         
         assert exc_info.value.status_code == 404
-    
\ No newline at end of file
+    
+
+    async def test_encode_priorities_passthrough(self, priority_service, mock_priority_repository):
+        """Test the passthrough path wraps the Postgres array of response fields in the items envelope."""
+        # Arrange
+        mock_priority_repository.select_all_json = AsyncMock(return_value='[{"id" : 1, "name" : "First"}]')
+
+        # Act
+        encoded = await priority_service.encode_priorities()
+
+        # Assert
+        assert json.loads(encoded) == {"items": [{"id": 1, "name": "First"}]}
+        mock_priority_repository.select_all_json.assert_awaited_once_with("id", "name")
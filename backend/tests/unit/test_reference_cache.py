@@ -0,0 +1,103 @@
+"""
+Unit tests for ReferenceCache
+"""
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from source.db.changes import Change, INSERT, publish, subscribe, unsubscribe
+from source.db.models import Label
+from source.services.reference import ReferenceCache
+
+
+@pytest.mark.unit
+class TestReferenceCache:
+    """Test caching, versioning and invalidation of reference tables."""
+
+    @pytest.fixture
+    def cache(self):
+        """Create an isolated cache subscribed to committed changes."""
+        cache = ReferenceCache(ttl=60)
+        subscribe(cache.on_changes)
+        yield cache
+        unsubscribe(cache.on_changes)
+
+    @pytest.fixture
+    def load(self):
+        """Loader returning two label rows."""
+        return AsyncMock(return_value=[MagicMock(id=1), MagicMock(id=2)])
+
+    async def test_rows_are_cached(self, cache, load):
+        """Test repeated reads are served from memory."""
+        # Act
+        first = await cache.get("labels", load)
+        second = await cache.get("labels", load)
+
+        # Assert
+        assert [row.id for row in first] == [1, 2]
+        assert [row.id for row in second] == [1, 2]
+        load.assert_awaited_once()
+
+    async def test_committed_change_invalidates(self, cache, load):
+        """Test a published change to the table bumps its version and reloads."""
+        # Arrange
+        await cache.get("labels", load)
+
+        # Act
+        publish([Change("labels", INSERT, (3,))])
+        await cache.get("labels", load)
+
+        # Assert
+        assert cache.version("labels") == 1
+        assert load.await_count == 2
+
+    async def test_unrelated_change_keeps_entry(self, cache, load):
+        """Test changes to other tables do not evict reference data."""
+        # Arrange
+        await cache.get("labels", load)
+
+        # Act
+        publish([Change("tasks", INSERT, (1,))])
+        await cache.get("labels", load)
+
+        # Assert
+        load.assert_awaited_once()
+
+    async def test_expired_entry_reloads(self, load):
+        """Test entries older than the TTL are reloaded."""
+        # Arrange
+        cache = ReferenceCache(ttl=0)
+
+        # Act
+        await cache.get("labels", load)
+        await cache.get("labels", load)
+
+        # Assert
+        assert load.await_count == 2
+
+    async def test_contains_reloads_once_on_miss(self, cache, load):
+        """Test an unknown id triggers one reload before being rejected."""
+        # Act
+        known = await cache.contains("labels", 1, load)
+        unknown = await cache.contains("labels", 5, load)
+
+        # Assert
+        assert known is True
+        assert unknown is False
+        assert load.await_count == 2
+
+    async def test_rollback_after_fill_keeps_rows_readable(self, cache):
+        """Test rows survive a rollback of the session that loaded them."""
+        # Arrange
+        session = Session()
+        label = Label(id=1, name="Bug")
+        make_transient_to_detached(label)
+        session.add(label)
+        await cache.get("labels", AsyncMock(return_value=[label]))
+
+        # Act
+        session.rollback()
+        rows = await cache.get("labels", AsyncMock(return_value=[]))
+
+        # Assert
+        assert [(row.id, row.name) for row in rows] == [(1, "Bug")]
@@ -0,0 +1,188 @@
+"""
+Unit tests for the deadline reminder scheduler and its sinks
+"""
+import asyncio
+import json
+from collections import namedtuple
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from email import message_from_bytes
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from source.services.reminders import (
+    FileSink, LogSink, ReminderScheduler, SmtpSink, create_sink,
+)
+from source.schemas.task import responses
+
+
+NOW = datetime(2025, 1, 1, 12, 0)
+
+Row = namedtuple("Row", "id deadline description created_at priority label status")
+
+
+def _row(id: int, status: str | None = "Open") -> Row:
+    return Row(id, NOW + timedelta(minutes=id), f"Task {id}", NOW, "High", "Bug", status)
+
+
+def _reminder(id: int) -> responses.Task:
+    return responses.Task.model_validate(_row(id), from_attributes=True)
+
+
+@asynccontextmanager
+async def _session():
+    yield MagicMock()
+
+
+async def _smtp_stand_in(received: list[bytes]) -> asyncio.AbstractServer:
+    # Just enough SMTP for smtplib: greet, accept every command and collect DATA bodies.
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        writer.write(b"220 stand-in\r\n")
+        while line := await reader.readline():
+            command = line.strip().upper()
+            if command == b"DATA":
+                writer.write(b"354 go ahead\r\n")
+                await writer.drain()
+                received.append(await reader.readuntil(b"\r\n.\r\n"))
+                writer.write(b"250 queued\r\n")
+            elif command == b"QUIT":
+                writer.write(b"221 bye\r\n")
+                break
+            else:
+                writer.write(b"250 ok\r\n")
+            await writer.drain()
+        writer.close()
+
+    return await asyncio.start_server(handle, "127.0.0.1", 0)
+
+
+@pytest.mark.unit
+class TestReminderScheduler:
+    """Test batched claiming, delivery and scan statistics."""
+
+    @pytest.fixture
+    def repository(self, mocker, mock_task_repository):
+        """Patch the scheduler's repository with the shared mock."""
+        mocker.patch("source.services.reminders.TaskRepository", return_value=mock_task_repository)
+        mock_task_repository.mark_reminded = AsyncMock()
+        return mock_task_repository
+
+    @pytest.fixture
+    def sink(self):
+        """Sink recording every delivered batch."""
+        sink = MagicMock()
+        sink.send = AsyncMock()
+        return sink
+
+    @pytest.fixture
+    def scheduler(self, sink):
+        """Scheduler with a fixed clock and two-row batches."""
+        return ReminderScheduler(
+            sink, session_maker=_session, batch_size=2, lead=timedelta(hours=1), grace=timedelta(days=1),
+            clock=lambda: NOW,
+        )
+
+    async def test_scan_claims_keyset_batches(self, scheduler, repository, sink):
+        """Test full batches continue after the last claimed row and terminal tasks are marked, not sent."""
+        # Arrange
+        repository.claim_reminders = AsyncMock(side_effect=[[_row(1), _row(2, "Done")], [_row(3)]])
+
+        # Act
+        claimed = await scheduler.scan()
+
+        # Assert
+        assert claimed == 3
+        first, second = repository.claim_reminders.await_args_list
+        assert first.args == (NOW - timedelta(days=1), NOW + timedelta(hours=1), 2, None)
+        assert second.args[3] == (_row(2).deadline, 2)
+        assert [[item.task_id for item in call.args[0]] for call in sink.send.await_args_list] == [[1], [3]]
+        assert [call.args[0] for call in repository.mark_reminded.await_args_list] == [[1, 2], [3]]
+        stats = scheduler.stats
+        assert (stats.scans, stats.batches, stats.sent, stats.skipped, stats.max_batch_size) == (1, 2, 2, 1, 2)
+        assert stats.lag_seconds == pytest.approx(timedelta(minutes=57).total_seconds())
+
+    async def test_empty_scan(self, scheduler, repository, sink):
+        """Test a scan with nothing due sends and marks nothing."""
+        # Arrange
+        repository.claim_reminders = AsyncMock(return_value=[])
+
+        # Act
+        claimed = await scheduler.scan()
+
+        # Assert
+        assert claimed == 0
+        sink.send.assert_not_awaited()
+        repository.mark_reminded.assert_not_awaited()
+        assert scheduler.stats.scans == 1
+
+    async def test_failed_send_is_not_marked(self, scheduler, repository, sink):
+        """Test a sink error leaves the batch unmarked so the next scan retries it."""
+        # Arrange
+        repository.claim_reminders = AsyncMock(return_value=[_row(1)])
+        sink.send.side_effect = OSError("connection refused")
+
+        # Act / Assert
+        with pytest.raises(OSError):
+            await scheduler.scan()
+        repository.mark_reminded.assert_not_awaited()
+
+    async def test_run_survives_failures(self, sink):
+        """Test the background loop counts a failed scan and keeps going."""
+        # Arrange
+        scheduler = ReminderScheduler(sink, interval=0.01)
+        scheduler.scan = AsyncMock(side_effect=[RuntimeError("database down"), 0, 0, 0])
+
+        # Act
+        await scheduler.start()
+        await asyncio.sleep(0.03)
+        await scheduler.stop()
+
+        # Assert
+        assert scheduler.stats.failures == 1
+        assert scheduler.scan.await_count >= 2
+
+
+@pytest.mark.unit
+class TestReminderSinks:
+    """Test log, file and SMTP delivery."""
+
+    def test_create_sink(self):
+        """Test sink names map to sink types and anything else disables reminders."""
+        assert isinstance(create_sink("log"), LogSink)
+        assert isinstance(create_sink("file"), FileSink)
+        assert isinstance(create_sink("smtp"), SmtpSink)
+        assert create_sink("none") is None
+
+    async def test_file_sink_appends_ndjson(self, tmp_path):
+        """Test each reminder becomes one JSON line and batches append."""
+        # Arrange
+        sink = FileSink(str(tmp_path / "reminders.ndjson"))
+
+        # Act
+        await sink.send([_reminder(1), _reminder(2)])
+        await sink.send([_reminder(3)])
+
+        # Assert
+        lines = (tmp_path / "reminders.ndjson").read_text().splitlines()
+        assert [json.loads(line)["task_id"] for line in lines] == [1, 2, 3]
+
+    async def test_smtp_sink_sends_one_message_per_task(self):
+        """Test a batch is delivered to a local SMTP stand-in over one connection."""
+        # Arrange
+        received: list[bytes] = []
+        server = await _smtp_stand_in(received)
+        port = server.sockets[0].getsockname()[1]
+        sink = SmtpSink(host="127.0.0.1", port=port, sender="tasks@test", recipient="team@test", timeout=5)
+
+        # Act
+        async with server:
+            await sink.send([_reminder(1), _reminder(2)])
+
+        # Assert
+        messages = [message_from_bytes(data) for data in received]
+        assert [message["Subject"] for message in messages] == [
+            "Task 1 is due 2025-01-01 12:01", "Task 2 is due 2025-01-01 12:02",
+        ]
+        assert messages[0]["To"] == "team@test"
+        assert "Status: Open" in messages[0].get_payload()
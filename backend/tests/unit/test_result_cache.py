@@ -0,0 +1,300 @@
+"""
+Unit tests for the task query-result cache and its backends
+"""
+import asyncio
+import time
+from collections import namedtuple
+from unittest.mock import AsyncMock
+
+import pytest
+
+from source.db.changes import Change, INSERT, UPDATE, DELETE
+from source.services.cache import MemoryBackend, RedisBackend
+from source.services.task_cache import TaskResultCache
+from source.schemas.task import params
+
+
+Row = namedtuple("Row", "id deadline description created_at priority label status priority_id label_id status_id")
+
+
+def _row(id: int, label_id: int = 1, status_id: int = 1, priority_id: int = 1) -> Row:
+    return Row(id, None, f"Task {id}", "2025-01-01T00:00:00", "High", "Bug", "Open", priority_id, label_id, status_id)
+
+
+class RespStandIn:
+    """Tiny in-memory server answering the RESP commands RedisBackend uses."""
+
+    def __init__(self):
+        self.strings: dict[bytes, tuple[bytes, float]] = {}
+        self.sets: dict[bytes, set[bytes]] = {}
+        self.zsets: dict[bytes, dict[bytes, float]] = {}
+        self.server: asyncio.Server | None = None
+
+    async def start(self) -> str:
+        self.server = await asyncio.start_server(self._serve, "127.0.0.1", 0)
+        port = self.server.sockets[0].getsockname()[1]
+        return f"redis://127.0.0.1:{port}/0"
+
+    async def stop(self):
+        assert self.server is not None
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                count = int((await reader.readuntil(b"\r\n"))[1:-2])
+                command = []
+                for _ in range(count):
+                    length = int((await reader.readuntil(b"\r\n"))[1:-2])
+                    command.append((await reader.readexactly(length + 2))[:-2])
+                writer.write(self._reply(self._handle(command[0].upper().decode(), command[1:])))
+                await writer.drain()
+        except asyncio.IncompleteReadError:
+            writer.close()
+
+    def _handle(self, name: str, args: list[bytes]):
+        if name == "SELECT":
+            return "OK"
+        if name == "GET":
+            value = self.strings.get(args[0])
+            return value[0] if value and value[1] > time.monotonic() else None
+        if name == "SET":
+            self.strings[args[0]] = (args[1], time.monotonic() + int(args[3]) / 1000)
+            return "OK"
+        if name == "DEL":
+            deleted = sum(1 for key in args if self.strings.pop(key, None) or self.sets.pop(key, None))
+            return deleted
+        if name == "PEXPIRE":
+            return 1
+        if name == "SADD":
+            self.sets.setdefault(args[0], set()).update(args[1:])
+            return len(args) - 1
+        if name == "SREM":
+            self.sets.get(args[0], set()).difference_update(args[1:])
+            return len(args) - 1
+        if name == "SMEMBERS":
+            return sorted(self.sets.get(args[0], set()))
+        zset = self.zsets.setdefault(args[0], {})
+        if name == "ZADD":
+            only_existing = args[1] == b"XX"
+            score, member = (args[2], args[3]) if only_existing else (args[1], args[2])
+            if not only_existing or member in zset:
+                zset[member] = float(score)
+            return 1
+        if name == "ZCARD":
+            return len(zset)
+        if name == "ZREM":
+            return sum(1 for member in args[1:] if zset.pop(member, None) is not None)
+        if name == "ZRANGE":
+            return sorted(zset, key=zset.get)
+        if name == "ZPOPMIN":
+            popped = sorted(zset, key=zset.get)[:int(args[1])]
+            reply = []
+            for member in popped:
+                reply += [member, repr(zset.pop(member)).encode()]
+            return reply
+        raise AssertionError(f"Unexpected command {name}")
+
+    def _reply(self, value) -> bytes:
+        if value is None:
+            return b"$-1\r\n"
+        if isinstance(value, str):
+            return f"+{value}\r\n".encode()
+        if isinstance(value, int):
+            return f":{value}\r\n".encode()
+        if isinstance(value, bytes):
+            return f"${len(value)}\r\n".encode() + value + b"\r\n"
+        return f"*{len(value)}\r\n".encode() + b"".join(self._reply(item) for item in value)
+
+
+@pytest.mark.unit
+class TestMemoryBackend:
+    """Test TTL, LRU eviction and tag invalidation of the in-process backend."""
+
+    async def test_lru_eviction(self):
+        """Test the least recently used entry is evicted when full."""
+        # Arrange
+        backend = MemoryBackend(ttl=60, max_entries=2)
+        await backend.set("a", b"1")
+        await backend.set("b", b"2")
+        await backend.get("a")
+
+        # Act
+        await backend.set("c", b"3")
+
+        # Assert
+        assert await backend.get("b") is None
+        assert await backend.get("a") == b"1"
+        assert backend.counters.evictions == 1
+
+    async def test_ttl_expiry(self):
+        """Test expired entries count as misses."""
+        # Arrange
+        backend = MemoryBackend(ttl=0, max_entries=2)
+        await backend.set("a", b"1")
+
+        # Act & Assert
+        assert await backend.get("a") is None
+        assert backend.counters.misses == 1
+
+    async def test_tag_invalidation(self):
+        """Test only entries carrying an invalidated tag are dropped."""
+        # Arrange
+        backend = MemoryBackend(ttl=60, max_entries=10)
+        await backend.set("a", b"1", ["x"])
+        await backend.set("b", b"2", ["y"])
+
+        # Act
+        backend.invalidate(["x"])
+
+        # Assert
+        assert await backend.get("a") is None
+        assert await backend.get("b") == b"2"
+        assert backend.counters.invalidations == 1
+
+
+@pytest.mark.unit
+class TestRedisBackend:
+    """Test the Redis-protocol backend against a local stand-in server."""
+
+    @pytest.fixture
+    async def backend(self):
+        """RedisBackend connected to a RESP stand-in."""
+        server = RespStandIn()
+        url = await server.start()
+        backend = RedisBackend(url=url, ttl=60, max_entries=2)
+        yield backend
+        await backend.close()
+        await server.stop()
+
+    async def test_round_trip_and_counters(self, backend):
+        """Test values round-trip and hits and misses are counted."""
+        # Act
+        await backend.set("a", b"payload", ["x"])
+        hit = await backend.get("a")
+        miss = await backend.get("missing")
+
+        # Assert
+        assert hit == b"payload"
+        assert miss is None
+        assert (backend.counters.hits, backend.counters.misses) == (1, 1)
+
+    async def test_size_bound(self, backend):
+        """Test entries beyond max_entries are evicted oldest first."""
+        # Act
+        for key in ("a", "b", "c"):
+            await backend.set(key, key.encode())
+
+        # Assert
+        assert await backend.get("a") is None
+        assert await backend.get("c") == b"c"
+        assert backend.counters.evictions == 1
+        assert await backend.size() == 2
+
+    async def test_tag_invalidation(self, backend):
+        """Test invalidated tags are applied before the next read."""
+        # Arrange
+        await backend.set("a", b"1", ["x"])
+        await backend.set("b", b"2", ["y"])
+
+        # Act
+        backend.invalidate(["x"])
+
+        # Assert
+        assert await backend.get("a") is None
+        assert await backend.get("b") == b"2"
+        assert backend.counters.invalidations == 1
+
+
+@pytest.mark.unit
+class TestTaskResultCache:
+    """Test keys and precise invalidation of cached task lists."""
+
+    @pytest.fixture
+    def cache(self):
+        """Task result cache over an in-process backend."""
+        return TaskResultCache(MemoryBackend(ttl=60, max_entries=100))
+
+    @pytest.fixture
+    def repo(self, mock_task_repository):
+        """Repository resolving label 'Bug' to id 1 and returning two tasks."""
+        labels = {"Bug": 1, "Other": 2}
+
+        async def resolve_filters(parameters):
+            if parameters.label is None:
+                return {}
+            return {"label_id": labels[parameters.label]} if parameters.label in labels else None
+
+        mock_task_repository.resolve_filters = AsyncMock(side_effect=resolve_filters)
+        mock_task_repository.get_tasks = AsyncMock(return_value=[_row(1), _row(2)])
+        return mock_task_repository
+
+    async def _load(self, cache, repo, **filters):
+        return await cache.get_tasks(repo, params.GetTasks(**filters))
+
+    async def test_hit_skips_repository(self, cache, repo):
+        """Test identical parameters are served from the cache."""
+        # Act
+        first = await self._load(cache, repo, label="Bug")
+        second = await self._load(cache, repo, label="Bug")
+
+        # Assert
+        assert first == second
+        assert [item["id"] for item in second] == [1, 2]
+        repo.get_tasks.assert_awaited_once()
+
+    async def test_task_change_invalidates_containing_entries(self, cache, repo):
+        """Test updating a cached task drops entries that contain it only."""
+        # Arrange
+        await self._load(cache, repo, label="Bug")
+        repo.get_tasks.return_value = [_row(5)]
+        await self._load(cache, repo, label="Other")
+
+        # Act
+        cache.on_changes([Change("tasks", UPDATE, (2,))])
+        await self._load(cache, repo, label="Bug")
+        await self._load(cache, repo, label="Other")
+
+        # Assert
+        assert repo.get_tasks.await_count == 3
+
+    async def test_insert_invalidates_matching_filters(self, cache, repo):
+        """Test a new task drops unfiltered and matching entries but keeps others."""
+        # Arrange
+        await self._load(cache, repo)
+        await self._load(cache, repo, label="Bug")
+
+        # Act
+        cache.on_changes([Change("tasks", INSERT, (9,), ({"label_id": 2, "status_id": 1, "priority_id": 1},))])
+        await self._load(cache, repo, label="Bug")
+        await self._load(cache, repo)
+
+        # Assert
+        assert repo.get_tasks.await_count == 3
+
+    async def test_new_label_invalidates_unresolved_filters(self, cache, repo):
+        """Test an unknown label filter is recomputed once labels change."""
+        # Arrange
+        await self._load(cache, repo, label="Missing")
+        await self._load(cache, repo, label="Missing")
+        assert repo.resolve_filters.await_count == 1
+
+        # Act
+        cache.on_changes([Change("labels", INSERT, (3,))])
+        await self._load(cache, repo, label="Missing")
+
+        # Assert
+        assert repo.resolve_filters.await_count == 2
+
+    async def test_label_delete_keeps_unrelated_entries(self, cache, repo):
+        """Test deleting an unused label keeps cached task lists."""
+        # Arrange
+        await self._load(cache, repo, label="Bug")
+
+        # Act
+        cache.on_changes([Change("labels", DELETE, (7,))])
+        await self._load(cache, repo, label="Bug")
+
+        # Assert
+        repo.get_tasks.assert_awaited_once()
@@ -1,11 +1,14 @@
 """
 Unit tests for StatusService
 """
+import json
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 from fastapi import HTTPException
+from sqlalchemy import exc
 
 from source.services.status import StatusService
+from source.services.reference import ReferenceCache
 from source.schemas.status import params, responses
 from source.db.models import Status
 
@@ -16,7 +19,7 @@ class TestStatusService:
     @pytest.fixture
     def status_service(self, mock_status_repository):
         """Create StatusService instance with mocked repository."""
-        return StatusService(status_repo=mock_status_repository)
+        return StatusService(status_repo=mock_status_repository, cache=ReferenceCache())
 
     @pytest.fixture
     def mock_status_model(self):
@@ -59,14 +62,14 @@ class TestStatusService:
             name="Completed",
             description="Tasks that are completed"
         )
-        mock_status_repository.new = AsyncMock(return_value=mock_status_model)
+        mock_status_repository.insert_returning = AsyncMock(return_value=mock_status_model)
 
         # Act
         result = await status_service.create_status(create_params)
 
         # Assert
         assert isinstance(result, responses.Status)
-        mock_status_repository.new.assert_called_once()
+        mock_status_repository.insert_returning.assert_called_once()
 
     async def test_create_status_failure(self, status_service, mock_status_repository):
         """Test status creation failure."""
@@ -75,7 +78,39 @@ class TestStatusService:
             name="Completed",
             description="Tasks that are completed"
         )
-        mock_status_repository.new = AsyncMock(return_value=None)
+        mock_status_repository.insert_returning = AsyncMock(return_value=None)
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await status_service.create_status(create_params)
+
+        assert exc_info.value.status_code == 500
+
+    async def test_create_status_duplicate_name(self, status_service, mock_status_repository):
+        """Test status creation with a name that already exists."""
+        # Arrange
+        create_params = params.CreateStatus(
+            name="Completed",
+            description="Tasks that are completed"
+        )
+        error = exc.IntegrityError("INSERT", {}, MagicMock(sqlstate="23505"))
+        mock_status_repository.insert_returning = AsyncMock(side_effect=error)
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await status_service.create_status(create_params)
+
+        assert exc_info.value.status_code == 409
+
+    async def test_create_status_integrity_error(self, status_service, mock_status_repository):
+        """Test status creation when another constraint fails."""
+        # Arrange
+        create_params = params.CreateStatus(
+            name="Completed",
+            description="Tasks that are completed"
+        )
+        error = exc.IntegrityError("INSERT", {}, MagicMock(sqlstate="23502"))
+        mock_status_repository.insert_returning = AsyncMock(side_effect=error)
 
         # Act & Assert
         with pytest.raises(HTTPException) as exc_info:
@@ -87,21 +122,20 @@ class TestStatusService:
         """Test successful status deletion."""
         # Arrange
         status_id = 1
-        mock_status_repository.get_by_id = AsyncMock(return_value=mock_status_model)
-        mock_status_repository.delete = AsyncMock(return_value=True)
+        mock_status_repository.delete_by_id_returning = AsyncMock(return_value=mock_status_model)
 
         # Act
         result = await status_service.delete_status(status_id)
 
         # Assert
         assert isinstance(result, responses.Status)
-        mock_status_repository.delete.assert_called_once()
+        mock_status_repository.delete_by_id_returning.assert_called_once_with(status_id)
 
     async def test_delete_status_not_found(self, status_service, mock_status_repository):
         """Test status deletion when status doesn't exist."""
         # Arrange
         status_id = 999
-        mock_status_repository.get_by_id = AsyncMock(return_value=None)
+        mock_status_repository.delete_by_id_returning = AsyncMock(return_value=None)
 
         # Act & Assert
         with pytest.raises(HTTPException) as exc_info:
@@ -109,3 +143,14 @@ class TestStatusService:
 
         assert exc_info.value.status_code == 404
 
+    async def test_encode_statuses_passthrough(self, status_service, mock_status_repository):
+        """Test the passthrough path wraps the Postgres array of response fields in the items envelope."""
+        # Arrange
+        mock_status_repository.select_all_json = AsyncMock(return_value='[{"id" : 1, "name" : "First"}]')
+
+        # Act
+        encoded = await status_service.encode_statuses()
+
+        # Assert
+        assert json.loads(encoded) == {"items": [{"id": 1, "name": "First"}]}
+        mock_status_repository.select_all_json.assert_awaited_once_with("id", "name")
@@ -0,0 +1,110 @@
+"""
+Unit tests for TaskImporter
+"""
+import io
+import pytest
+from unittest.mock import AsyncMock
+
+from source.services.task_import import MAX_REPORTED_ERRORS, TaskImporter, read_records
+from source.db.models import Label, Status
+
+
+CSV_DATA = """description,label,status,deadline
+First task,Bug,Open,2025-12-31T23:59:59
+Second task,Feature,Open,
+,Bug,Open,
+"""
+
+NDJSON_DATA = """{"description": "First task", "label": "Bug"}
+
+not json
+{"description": "Second task", "priority_id": 3}
+"""
+
+
+@pytest.mark.unit
+class TestTaskImporter:
+    """Test chunked parsing, validation and name resolution of task imports."""
+
+    @pytest.fixture
+    def task_importer(self, mock_task_repository):
+        """Create TaskImporter with a small chunk size and mocked repository."""
+        mock_task_repository.REFERENCES = {"label_id": Label, "status_id": Status, "priority_id": None}
+
+        async def resolve_names(model, names):
+            known = {Label: {"Bug": 1}, Status: {"Open": 2}}[model]
+            return {name: known[name] for name in names if name in known}
+
+        mock_task_repository.resolve_names = AsyncMock(side_effect=resolve_names)
+        mock_task_repository.reference_ids = AsyncMock(
+            return_value={"label_id": {1}, "status_id": {2}, "priority_id": {3}}
+        )
+        mock_task_repository.copy_insert = AsyncMock(side_effect=lambda rows: len(rows))
+        return TaskImporter(task_repo=mock_task_repository, chunk_size=2)
+
+    def test_read_records_ndjson(self):
+        """Test NDJSON lines are parsed and invalid lines are kept as errors."""
+        records = list(read_records(io.StringIO(NDJSON_DATA), "ndjson"))
+
+        assert len(records) == 3
+        assert records[0] == {"description": "First task", "label": "Bug"}
+        assert "__invalid__" in records[1]
+
+    async def test_import_csv(self, task_importer, mock_task_repository):
+        """Test CSV rows are resolved, validated and copied chunk by chunk."""
+        # Act
+        result = await task_importer.import_stream(io.StringIO(CSV_DATA), "csv")
+
+        # Assert
+        assert result.rows_read == 3
+        assert result.rows_imported == 1
+        assert result.rows_rejected == 2
+        assert [error.record for error in result.errors] == [2, 3]
+        assert "Unknown label 'Feature'" in result.errors[0].error
+        assert mock_task_repository.copy_insert.await_count == 1
+
+        status_id, priority_id, label_id, _, deadline, description = mock_task_repository.copy_insert.call_args.args[0][0]
+        assert (status_id, priority_id, label_id, description) == (2, None, 1, "First task")
+        assert deadline.year == 2025
+
+    async def test_names_are_resolved_once(self, task_importer, mock_task_repository):
+        """Test names already resolved in an earlier chunk are not queried again."""
+        data = "description,label\n" + "".join(f"Task {i},Bug\n" for i in range(6))
+
+        # Act
+        result = await task_importer.import_stream(io.StringIO(data), "csv")
+
+        # Assert
+        assert result.rows_imported == 6
+        assert mock_task_repository.copy_insert.await_count == 3
+        mock_task_repository.resolve_names.assert_awaited_once()
+
+    async def test_unknown_ids_are_row_errors(self, task_importer, mock_task_repository):
+        """Test ids missing from the reference tables reject their rows before the copy."""
+        data = (
+            '{"description": "Known", "priority_id": 3}\n'
+            '{"description": "Unknown", "priority_id": 4}\n'
+            '{"description": "Also unknown", "label_id": 9, "status": "Open"}\n'
+        )
+
+        # Act
+        result = await task_importer.import_stream(io.StringIO(data), "ndjson")
+
+        # Assert
+        assert result.rows_imported == 1
+        assert [(error.record, error.error) for error in result.errors] == [
+            (2, "Unknown priority_id 4"),
+            (3, "Unknown label_id 9"),
+        ]
+        mock_task_repository.reference_ids.assert_awaited_once()
+
+    async def test_reported_errors_are_capped(self, task_importer):
+        """Test every invalid row is counted while only the first errors are kept."""
+        data = "not json\n" * (MAX_REPORTED_ERRORS + 5)
+
+        # Act
+        result = await task_importer.import_stream(io.StringIO(data), "ndjson")
+
+        # Assert
+        assert result.rows_rejected == MAX_REPORTED_ERRORS + 5
+        assert [error.record for error in result.errors] == list(range(1, MAX_REPORTED_ERRORS + 1))
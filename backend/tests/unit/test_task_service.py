@@ -1,12 +1,20 @@
 """
 Unit tests for TaskService
 """
+import csv
+import io
+import json
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 from datetime import datetime
 from fastapi import HTTPException
+from sqlalchemy.engine import IteratorResult
+from sqlalchemy.engine.result import SimpleResultMetaData
+from sqlalchemy.exc import IntegrityError
 
 from source.services.task import TaskService
+from source.services.pagination import encode_cursor, decode_cursor
+from source.services.reference import ReferenceCache
 from source.schemas.task import params, responses
 from source.db.models import Task
 
@@ -45,7 +53,7 @@ class TestTaskService:
         # Assert
         assert isinstance(result, responses.GetTasks)
         assert len(result.items) == 1
-        mock_task_repository.get_tasks.assert_called_once_with(get_params)
+        mock_task_repository.get_tasks.assert_called_once_with(get_params, after=None, before=None)
     
     async def test_get_tasks_empty(self, task_service, mock_task_repository):
         """Test get_tasks when no tasks exist."""
@@ -60,6 +68,60 @@ class TestTaskService:
         assert isinstance(result, responses.GetTasks)
         assert len(result.items) == 0
     
+    def _task_rows(self, ids):
+        return [
+            MagicMock(id=id, description=f"Task {id}", created_at=datetime.now(), deadline=None,
+                      status=None, priority=None, label=None)
+            for id in ids
+        ]
+    
+    async def test_get_tasks_next_cursor(self, task_service, mock_task_repository):
+        """Test a full page returns a cursor that continues after its last task."""
+        # Arrange
+        get_params = params.GetTasks(limit=2)
+        mock_task_repository.get_tasks = AsyncMock(return_value=self._task_rows([1, 2, 3]))
+        
+        # Act
+        result = await task_service.get_tasks(get_params)
+        
+        # Assert
+        assert [item.task_id for item in result.items] == [1, 2]
+        assert result.prev_cursor is None
+        assert decode_cursor(result.next_cursor) == [2]
+        
+        # Act
+        next_params = params.GetTasks(limit=2, after=result.next_cursor)
+        mock_task_repository.get_tasks = AsyncMock(return_value=self._task_rows([3]))
+        result = await task_service.get_tasks(next_params)
+        
+        # Assert
+        mock_task_repository.get_tasks.assert_called_once_with(next_params, after=2, before=None)
+        assert result.next_cursor is None
+        assert decode_cursor(result.prev_cursor) == [3]
+    
+    async def test_get_tasks_before_cursor(self, task_service, mock_task_repository):
+        """Test paging backwards returns tasks in ascending order."""
+        # Arrange
+        get_params = params.GetTasks(limit=2, before=encode_cursor(5))
+        mock_task_repository.get_tasks = AsyncMock(return_value=self._task_rows([4, 3, 2]))
+        
+        # Act
+        result = await task_service.get_tasks(get_params)
+        
+        # Assert
+        mock_task_repository.get_tasks.assert_called_once_with(get_params, after=None, before=5)
+        assert [item.task_id for item in result.items] == [3, 4]
+        assert decode_cursor(result.prev_cursor) == [3]
+        assert decode_cursor(result.next_cursor) == [4]
+    
+    async def test_get_tasks_invalid_cursor(self, task_service, mock_task_repository):
+        """Test a malformed cursor is rejected."""
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await task_service.get_tasks(params.GetTasks(after="not-a-cursor"))
+        
+        assert exc_info.value.status_code == 400
+    
     async def test_create_task_success(self, task_service, mock_task_repository, mock_task_model):
         """Test successful task creation."""
         # Arrange
@@ -69,14 +131,14 @@ class TestTaskService:
             status_id=1,
             label_id=1
         )
-        mock_task_repository.new = AsyncMock(return_value=mock_task_model)
+        mock_task_repository.insert_returning = AsyncMock(return_value=mock_task_model)
         
         # Act
         result = await task_service.create_task(create_params)
         
         # Assert
         assert isinstance(result, responses.Task)
-        mock_task_repository.new.assert_called_once()
+        mock_task_repository.insert_returning.assert_called_once()
     
     async def test_create_task_failure(self, task_service, mock_task_repository):
         """Test task creation failure when repository returns None."""
@@ -87,7 +149,7 @@ class TestTaskService:
             status_id=1,
             label_id=1
         )
-        mock_task_repository.new = AsyncMock(return_value=None)
+        mock_task_repository.insert_returning = AsyncMock(return_value=None)
         
         # Act & Assert
         with pytest.raises(HTTPException) as exc_info:
@@ -95,26 +157,66 @@ class TestTaskService:
         
         assert exc_info.value.status_code == 500
     
+    async def test_create_task_unknown_reference(self, mock_task_repository, mock_label_repository):
+        """Test creating a task with an unknown label is rejected before any write."""
+        # Arrange
+        label = MagicMock(id=1)
+        mock_label_repository.select_all = AsyncMock(return_value=[label])
+        mock_task_repository.insert_returning = AsyncMock()
+        task_service = TaskService(
+            task_repo=mock_task_repository,
+            reference_repos={"label_id": mock_label_repository},
+            cache=ReferenceCache(),
+        )
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await task_service.create_task(params.CreateTask(description="New task", label_id=2))
+
+        assert exc_info.value.status_code == 422
+        assert exc_info.value.detail == "Unknown label 2"
+        mock_task_repository.insert_returning.assert_not_called()
+
+    async def test_update_task_known_reference_is_cached(
+        self, mock_task_repository, mock_label_repository, mock_task_model
+    ):
+        """Test known reference ids are checked against the cache without reloading."""
+        # Arrange
+        label = MagicMock(id=1)
+        mock_label_repository.select_all = AsyncMock(return_value=[label])
+        mock_task_repository.update_by_id_returning = AsyncMock(return_value=mock_task_model)
+        task_service = TaskService(
+            task_repo=mock_task_repository,
+            reference_repos={"label_id": mock_label_repository},
+            cache=ReferenceCache(),
+        )
+
+        # Act
+        for _ in range(3):
+            await task_service.update_task(params.UpdateTask(task_id=1, label_id=1), 1)
+
+        # Assert
+        mock_label_repository.select_all.assert_awaited_once()
+        assert mock_task_repository.update_by_id_returning.await_count == 3
+
     async def test_delete_task_success(self, task_service, mock_task_repository, mock_task_model):
         """Test successful task deletion."""
         # Arrange
         task_id = 1
-        mock_task_repository.get_by_id = AsyncMock(return_value=mock_task_model)
-        mock_task_repository.delete = AsyncMock(return_value=True)
+        mock_task_repository.delete_by_id_returning = AsyncMock(return_value=mock_task_model)
         
         # Act
         result = await task_service.delete_task(task_id)
         
         # Assert
         assert isinstance(result, responses.Task)
-        mock_task_repository.get_by_id.assert_called_once_with(task_id)
-        mock_task_repository.delete.assert_called_once_with(mock_task_model)
+        mock_task_repository.delete_by_id_returning.assert_called_once_with(task_id)
     
     async def test_delete_task_not_found(self, task_service, mock_task_repository):
         """Test task deletion when task doesn't exist."""
         # Arrange
         task_id = 999
-        mock_task_repository.get_by_id = AsyncMock(return_value=None)
+        mock_task_repository.delete_by_id_returning = AsyncMock(return_value=None)
         
         # Act & Assert
         with pytest.raises(HTTPException) as exc_info:
@@ -123,12 +225,11 @@ class TestTaskService:
         assert exc_info.value.status_code == 404
         assert "not found" in str(exc_info.value.detail).lower()
     
-    async def test_delete_task_failure(self, task_service, mock_task_repository, mock_task_model):
-        """Test task deletion failure."""
+    async def test_delete_task_failure(self, task_service, mock_task_repository):
+        """Test task deletion failure on an integrity violation."""
         # Arrange
         task_id = 1
-        mock_task_repository.get_by_id = AsyncMock(return_value=mock_task_model)
-        mock_task_repository.delete = AsyncMock(return_value=False)
+        mock_task_repository.delete_by_id_returning = AsyncMock(side_effect=IntegrityError("DELETE", {}, Exception()))
         
         # Act & Assert
         with pytest.raises(HTTPException) as exc_info:
@@ -146,20 +247,17 @@ class TestTaskService:
             priority_id=2
         )
         
-        updated_model = MagicMock(spec=Task)
-        updated_model.id = task_id
-        updated_model.description = "Updated description"
-        
-        mock_task_repository.get_by_id = AsyncMock(return_value=mock_task_model)
-        mock_task_repository.update = AsyncMock(return_value=updated_model)
+        mock_task_model.description = "Updated description"
+        mock_task_repository.update_by_id_returning = AsyncMock(return_value=mock_task_model)
         
         # Act
         result = await task_service.update_task(update_params, task_id)
         
         # Assert
         assert isinstance(result, responses.Task)
-        mock_task_repository.get_by_id.assert_called_once_with(task_id)
-        mock_task_repository.update.assert_called_once()
+        mock_task_repository.update_by_id_returning.assert_called_once_with(
+            task_id, description="Updated description", priority_id=2
+        )
     
     async def test_update_task_not_found(self, task_service, mock_task_repository):
         """Test task update when task doesn't exist."""
@@ -169,7 +267,7 @@ class TestTaskService:
             task_id=task_id,
             description="Updated description"
         )
-        mock_task_repository.get_by_id = AsyncMock(return_value=None)
+        mock_task_repository.update_by_id_returning = AsyncMock(return_value=None)
         
         # Act & Assert
         with pytest.raises(HTTPException) as exc_info:
@@ -177,19 +275,513 @@ class TestTaskService:
         
         assert exc_info.value.status_code == 404
     
-    async def test_update_task_failure(self, task_service, mock_task_repository, mock_task_model):
-        """Test task update failure."""
+    async def test_update_task_failure(self, task_service, mock_task_repository):
+        """Test task update failure on an integrity violation."""
         # Arrange
         task_id = 1
         update_params = params.UpdateTask(
             task_id=task_id,
             description="Updated description"
         )
-        mock_task_repository.get_by_id = AsyncMock(return_value=mock_task_model)
-        mock_task_repository.update = AsyncMock(return_value=None)
+        mock_task_repository.update_by_id_returning = AsyncMock(side_effect=IntegrityError("UPDATE", {}, Exception()))
         
         # Act & Assert
         with pytest.raises(HTTPException) as exc_info:
             await task_service.update_task(update_params, task_id)
         
         assert exc_info.value.status_code == 500
+    
+    async def test_bulk_create_tasks_reports_each_item(self, task_service, mock_task_repository):
+        """Test bulk creation inserts valid items and reports unknown references per item."""
+        # Arrange
+        bulk_params = params.BulkCreateTasks(items=[
+            params.CreateTask(description="First", label_id=1),
+            params.CreateTask(description="Second", label_id=42),
+            params.CreateTask(description="Third"),
+        ])
+        mock_task_repository.find_reference_ids = AsyncMock(
+            return_value={"label_id": {1}, "status_id": set(), "priority_id": set()}
+        )
+        mock_task_repository.bulk_insert = AsyncMock(return_value=[10, 11])
+        
+        # Act
+        result = await task_service.bulk_create_tasks(bulk_params)
+        
+        # Assert
+        assert [item.task_id for item in result.items] == [10, None, 11]
+        assert result.items[1].error == "Unknown label_id 42"
+        inserted = mock_task_repository.bulk_insert.call_args.args[0]
+        assert [row["description"] for row in inserted] == ["First", "Third"]
+    
+    async def test_bulk_update_tasks_reports_missing_and_duplicates(self, task_service, mock_task_repository):
+        """Test bulk update reports missing tasks and duplicate ids per item."""
+        # Arrange
+        bulk_params = params.BulkUpdateTasks(items=[
+            params.UpdateTask(task_id=1, description="Updated"),
+            params.UpdateTask(task_id=2, status_id=3),
+            params.UpdateTask(task_id=1, description="Again"),
+        ])
+        mock_task_repository.find_reference_ids = AsyncMock(
+            return_value={"label_id": set(), "status_id": {3}, "priority_id": set()}
+        )
+        mock_task_repository.bulk_update = AsyncMock(return_value={1})
+        
+        # Act
+        result = await task_service.bulk_update_tasks(bulk_params)
+        
+        # Assert
+        assert [item.error for item in result.items] == [None, "Task not found", "Duplicate task_id in batch"]
+        mock_task_repository.bulk_update.assert_called_once_with([
+            {"id": 1, "description": "Updated"},
+            {"id": 2, "status_id": 3},
+        ])
+    
+    async def test_bulk_update_tasks_reports_null_required_fields(self, task_service, mock_task_repository):
+        """Test bulk update rejects a null NOT NULL column per item and still updates the others."""
+        # Arrange
+        bulk_params = params.BulkUpdateTasks(items=[
+            params.UpdateTask(task_id=1, description=None),
+            params.UpdateTask(task_id=2, description="Updated", deadline=None),
+        ])
+        mock_task_repository.find_reference_ids = AsyncMock(
+            return_value={"label_id": set(), "status_id": set(), "priority_id": set()}
+        )
+        mock_task_repository.bulk_update = AsyncMock(return_value={2})
+        
+        # Act
+        result = await task_service.bulk_update_tasks(bulk_params)
+        
+        # Assert
+        assert [item.error for item in result.items] == ["description cannot be null", None]
+        mock_task_repository.bulk_update.assert_called_once_with([
+            {"id": 2, "description": "Updated", "deadline": None, "reminder_sent_at": None},
+        ])
+    
+    async def test_bulk_delete_tasks_reports_missing(self, task_service, mock_task_repository):
+        """Test bulk deletion reports ids that did not exist."""
+        # Arrange
+        bulk_params = params.BulkDeleteTasks(task_ids=[1, 2])
+        mock_task_repository.bulk_delete = AsyncMock(return_value={2})
+        
+        # Act
+        result = await task_service.bulk_delete_tasks(bulk_params)
+        
+        # Assert
+        assert [item.error for item in result.items] == ["Task not found", None]
+        mock_task_repository.bulk_delete.assert_called_once_with([1, 2])
+    
+    def _mock_export_stream(self, mock_task_repository, partitions):
+        async def stream_tasks(parameters):
+            for partition in partitions:
+                yield partition
+        mock_task_repository.stream_tasks = stream_tasks
+    
+    def _export_row(self, id, description, deadline=None):
+        row = MagicMock()
+        row.id = id
+        row.status = "Open"
+        row.priority = "High"
+        row.label = None
+        row.created_at = datetime(2025, 1, 1, 12, 0)
+        row.deadline = deadline
+        row.description = description
+        return row
+    
+    async def test_export_tasks_ndjson(self, task_service, mock_task_repository):
+        """Test NDJSON export emits one line per row for every streamed partition."""
+        # Arrange
+        self._mock_export_stream(mock_task_repository, [
+            [self._export_row(1, "First"), self._export_row(2, "Second", datetime(2025, 12, 31))],
+            [self._export_row(3, "Third")],
+        ])
+        
+        # Act
+        chunks = [chunk async for chunk in task_service.export_tasks(params.ExportTasks())]
+        
+        # Assert
+        assert len(chunks) == 2
+        lines = b"".join(chunks).decode().splitlines()
+        assert len(lines) == 3
+        assert json.loads(lines[1]) == {
+            "task_id": 2, "status": "Open", "priority": "High", "label": None,
+            "created_at": "2025-01-01T12:00:00", "deadline": "2025-12-31T00:00:00",
+            "description": "Second",
+        }
+    
+    async def test_export_tasks_csv(self, task_service, mock_task_repository):
+        """Test CSV export starts with a header row."""
+        # Arrange
+        self._mock_export_stream(mock_task_repository, [[self._export_row(1, "First, with comma")]])
+        
+        # Act
+        chunks = [chunk async for chunk in task_service.export_tasks(params.ExportTasks(format="csv"))]
+        
+        # Assert
+        rows = list(csv.reader(io.StringIO(b"".join(chunks).decode())))
+        assert rows[0] == ["task_id", "status", "priority", "label", "created_at", "deadline", "description"]
+        assert rows[1] == ["1", "Open", "High", "", "2025-01-01T12:00:00", "", "First, with comma"]
+    
+    def _change_row(self, id, version):
+        row = self._export_row(id, f"Task {id}")
+        row.version = version
+        return row
+    
+    def _tombstone(self, id, version):
+        row = MagicMock()
+        row.id = id
+        row.version = version
+        return row
+    
+    async def test_get_changes_without_since_requires_resync(self, task_service, mock_task_repository):
+        """Test a first sync returns the version to continue from after a full load."""
+        # Arrange
+        mock_task_repository.get_change_horizons = AsyncMock(return_value=(500, 0))
+        
+        # Act
+        result = await task_service.get_changes(params.GetTaskChanges())
+        
+        # Assert
+        assert result.resync_required
+        assert result.version == 500
+        mock_task_repository.get_changes.assert_not_called()
+    
+    async def test_get_changes_before_compaction_requires_resync(self, task_service, mock_task_repository):
+        """Test versions older than compacted tombstones cannot be answered."""
+        # Arrange
+        mock_task_repository.get_change_horizons = AsyncMock(return_value=(500, 300))
+        
+        # Act
+        result = await task_service.get_changes(params.GetTaskChanges(since=299))
+        
+        # Assert
+        assert result.resync_required
+        assert result.items == [] and result.deleted == []
+    
+    async def test_get_changes_merges_upserts_and_deletes(self, task_service, mock_task_repository):
+        """Test upserts and deletes are merged in version order and paginated."""
+        # Arrange
+        mock_task_repository.get_change_horizons = AsyncMock(return_value=(500, 0))
+        mock_task_repository.get_changes = AsyncMock(return_value=(
+            [self._change_row(1, 410), self._change_row(7, 430)],
+            [self._tombstone(4, 420), self._tombstone(2, 440)],
+        ))
+        
+        # Act
+        result = await task_service.get_changes(params.GetTaskChanges(since=400, limit=3))
+        
+        # Assert
+        mock_task_repository.get_changes.assert_awaited_once_with((400, 0), 500, 4)
+        assert [item.task_id for item in result.items] == [1, 7]
+        assert result.deleted == [4]
+        assert result.version == 400
+        assert decode_cursor(result.next_cursor) == [430, 7]
+        assert not result.resync_required
+    
+    async def test_get_changes_last_page_returns_safe_version(self, task_service, mock_task_repository):
+        """Test the final page continues from the safe version and resumes after the cursor."""
+        # Arrange
+        mock_task_repository.get_change_horizons = AsyncMock(return_value=(500, 0))
+        mock_task_repository.get_changes = AsyncMock(return_value=([], [self._tombstone(2, 440)]))
+        
+        # Act
+        result = await task_service.get_changes(
+            params.GetTaskChanges(since=400, after=encode_cursor(430, 7))
+        )
+        
+        # Assert
+        mock_task_repository.get_changes.assert_awaited_once_with((430, 7), 500, 1001)
+        assert result.deleted == [2]
+        assert result.version == 500
+        assert result.next_cursor is None
+    
+    def _search_row(self, id, rank):
+        row = self._export_row(id, f"Task {id}")
+        row.rank = rank
+        row.snippet = f"<mark>Task</mark> {id}"
+        return row
+    
+    async def test_search_tasks_next_cursor(self, task_service, mock_task_repository):
+        """Test search returns hits with snippets and a rank/id keyset cursor."""
+        # Arrange
+        mock_task_repository.search_tasks = AsyncMock(return_value=[
+            self._search_row(3, 0.5), self._search_row(1, 0.25), self._search_row(2, 0.25),
+        ])
+        
+        # Act
+        result = await task_service.search_tasks(params.SearchTasks(q="task", limit=2))
+        
+        # Assert
+        assert [(item.task_id, item.rank) for item in result.items] == [(3, 0.5), (1, 0.25)]
+        assert result.items[0].snippet == "<mark>Task</mark> 3"
+        assert decode_cursor(result.next_cursor) == [0.25, 1]
+    
+    async def test_search_tasks_resumes_after_cursor(self, task_service, mock_task_repository):
+        """Test the decoded cursor is passed to the repository."""
+        # Arrange
+        mock_task_repository.search_tasks = AsyncMock(return_value=[self._search_row(2, 0.25)])
+        parameters = params.SearchTasks(q="task", after=encode_cursor(0.25, 1))
+        
+        # Act
+        result = await task_service.search_tasks(parameters)
+        
+        # Assert
+        mock_task_repository.search_tasks.assert_awaited_once_with(parameters, after=(0.25, 1))
+        assert result.next_cursor is None
+    
+    async def test_search_tasks_invalid_cursor(self, task_service):
+        """Test malformed search cursors are rejected."""
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await task_service.search_tasks(params.SearchTasks(q="task", after=encode_cursor("x", 1)))
+        assert exc_info.value.status_code == 400
+    
+    async def test_typeahead(self, task_service, mock_task_repository):
+        """Test typeahead passes its limits through and returns suggestions in order."""
+        # Arrange
+        mock_task_repository.typeahead = AsyncMock(return_value=[
+            MagicMock(kind="label", id=2, text="Bug", score=1.0),
+            MagicMock(kind="task", id=7, text="Fix bug in login", score=0.75),
+        ])
+        
+        # Act
+        result = await task_service.typeahead(params.Typeahead(q="bug", limit=5))
+        
+        # Assert
+        mock_task_repository.typeahead.assert_awaited_once_with("bug", 5, 0.3)
+        assert [(item.kind, item.id) for item in result.items] == [("label", 2), ("task", 7)]
+    
+    async def test_get_stats_splits_grouping_sets(self, task_service, mock_task_repository):
+        """Test grouping-set rows are split into per-dimension counts and totals."""
+        # Arrange
+        def stats_row(dimension, id=None, name=None, total=0, **extra):
+            row = MagicMock(dimension=dimension, id=id, total=total, **extra)
+            row.name = name
+            return row
+        
+        recent = {"id": 9, "description": "Newest", "created_at": "2025-01-02T00:00:00", "status": "Open"}
+        mock_task_repository.get_stats = AsyncMock(return_value=[
+            stats_row("status", 1, "Open", 3),
+            stats_row("status", None, None, 1),
+            stats_row("label", 2, "Bug", 4),
+            stats_row(None, total=4, overdue=1, due_this_week=2, recent=[recent], labels=2, statuses=3, priorities=1),
+        ])
+        
+        # Act
+        result = await task_service.get_stats(params.TaskStats(recent=1))
+        
+        # Assert
+        mock_task_repository.get_stats.assert_awaited_once_with(1)
+        assert (result.total, result.overdue, result.due_this_week) == (4, 1, 2)
+        assert [(item.name, item.count) for item in result.by_status] == [("Open", 3), (None, 1)]
+        assert [(item.id, item.count) for item in result.by_label] == [(2, 4)]
+        assert result.by_priority == []
+        assert [task.task_id for task in result.recent] == [9]
+        assert (result.labels, result.statuses, result.priorities) == (2, 3, 1)
+    
+    async def test_count_tasks_uses_resolved_filters(self, task_service, mock_task_repository):
+        """Test counts are read for resolved reference ids and unknown names count zero."""
+        # Arrange
+        mock_task_repository.resolve_filters = AsyncMock(side_effect=[{"label_id": 2}, None])
+        mock_task_repository.count = AsyncMock(return_value=7)
+        
+        # Act
+        found = await task_service.count_tasks(params.TaskFilters(label="Bug"))
+        missing = await task_service.count_tasks(params.TaskFilters(label="Nope"))
+        
+        # Assert
+        mock_task_repository.count.assert_awaited_once_with(label_id=2)
+        assert (found.count, missing.count) == (7, 0)
+    
+    async def test_get_due_tasks_keyset_cursor(self, task_service, mock_task_repository):
+        """Test the next cursor carries the last deadline and id and decodes back for the next page."""
+        # Arrange
+        def due_row(id, deadline):
+            return MagicMock(id=id, deadline=deadline, description=f"Task {id}", created_at=datetime(2025, 1, 1),
+                             status=None, priority=None, label=None)
+        
+        rows = [due_row(1, datetime(2025, 1, 2)), due_row(2, datetime(2025, 1, 3))]
+        mock_task_repository.get_due_tasks = AsyncMock(return_value=rows)
+        
+        # Act
+        first = await task_service.get_due_tasks(params.DueTasks(limit=1))
+        await task_service.get_due_tasks(params.DueTasks(limit=1, after=first.next_cursor))
+        
+        # Assert
+        assert [item.task_id for item in first.items] == [1]
+        assert mock_task_repository.get_due_tasks.await_args.kwargs["after"] == (datetime(2025, 1, 2), 1)
+        with pytest.raises(HTTPException):
+            await task_service.get_due_tasks(params.DueTasks(after=encode_cursor("yesterday", 1)))
+    
+    async def test_encode_tasks_matches_model_output(self, task_service, mock_task_repository):
+        """Test the orjson fast path emits the same bytes as serialising the GetTasks model."""
+        # Arrange
+        columns = ["id", "deadline", "description", "created_at", "priority", "label", "status"]
+        rows = IteratorResult(SimpleResultMetaData(columns), iter([
+            (1, None, "Plain", datetime(2025, 1, 1), None, None, None),
+            (2, datetime(2025, 3, 4, 5, 6, 7, 891), 'Quotes " and ünïcode', datetime(2025, 1, 2), "High", "Bug", "Open"),
+            (3, None, "Extra", datetime(2025, 1, 3), None, None, None),
+        ])).fetchall()
+        mock_task_repository.get_tasks = AsyncMock(return_value=rows)
+        get_params = params.GetTasks(limit=2)
+        
+        # Act
+        encoded = await task_service.encode_tasks(get_params)
+        model = await task_service.get_tasks(get_params)
+        
+        # Assert
+        assert encoded == model.model_dump_json().encode()
+        assert json.loads(encoded)["next_cursor"] == encode_cursor(2)
+    
+    async def test_encode_tasks_from_cached_dicts(self, mock_task_repository):
+        """Test rows coming back from the result cache as dicts encode the same way."""
+        # Arrange
+        cached = {"id": 5, "deadline": None, "description": "Cached", "created_at": "2025-01-01T00:00:00",
+                  "priority": None, "label": "Bug", "status": None}
+        result_cache = MagicMock()
+        result_cache.get_tasks = AsyncMock(return_value=[cached])
+        service = TaskService(task_repo=mock_task_repository, result_cache=result_cache)
+        
+        # Act
+        encoded = await service.encode_tasks(params.GetTasks())
+        
+        # Assert
+        assert encoded == (await service.get_tasks(params.GetTasks())).model_dump_json().encode()
+    
+    async def test_encode_tasks_passthrough_wraps_postgres_items(self, task_service, mock_task_repository):
+        """Test the passthrough path splices the Postgres array in unparsed and adds the cursors."""
+        # Arrange
+        items = '[{"task_id" : 3, "description" : "From Postgres"}, {"task_id" : 4, "description" : "Next"}]'
+        mock_task_repository.get_tasks_json = AsyncMock(return_value=(items, True, 3, 4))
+        get_params = params.GetTasks(limit=2, after=encode_cursor(2))
+        
+        # Act
+        encoded = await task_service.encode_tasks(get_params, passthrough=True)
+        
+        # Assert
+        assert encoded.startswith(b'{"items":' + items.encode() + b',')
+        document = json.loads(encoded)
+        assert (document["next_cursor"], document["prev_cursor"]) == (encode_cursor(4), encode_cursor(3))
+        mock_task_repository.get_tasks_json.assert_awaited_once_with(get_params, after=2, before=None)
+        mock_task_repository.get_tasks.assert_not_called()
+    
+    async def test_encode_tasks_passthrough_empty_page(self, task_service, mock_task_repository):
+        """Test an empty passthrough page has no cursors."""
+        # Arrange
+        mock_task_repository.get_tasks_json = AsyncMock(return_value=("[]", False, None, None))
+        
+        # Act
+        encoded = await task_service.encode_tasks(params.GetTasks(), passthrough=True)
+        
+        # Assert
+        assert json.loads(encoded) == {"items": [], "next_cursor": None, "prev_cursor": None}
+    
+    @pytest.mark.parametrize("cached", [False, True])
+    async def test_encode_tasks_binary_formats(self, mock_task_repository, cached):
+        """Test msgpack and Arrow pages hold the JSON document's rows and cursors, from rows or cached dicts."""
+        pyarrow = pytest.importorskip("pyarrow")
+        import msgpack
+        import pyarrow.ipc
+        from source.services import formats
+        
+        # Arrange
+        rows = IteratorResult(SimpleResultMetaData(["id", "deadline", "description", "created_at", "priority", "label", "status"]), iter([
+            (1, None, "Plain", datetime(2025, 1, 1), None, None, None),
+            (2, datetime(2025, 3, 4, 5, 6, 7, 891), "Due", datetime(2025, 1, 2), "High", "Bug", "Open"),
+            (3, None, "Extra", datetime(2025, 1, 3), None, None, None),
+        ])).fetchall()
+        result_cache = None
+        if cached:
+            result_cache = MagicMock()
+            result_cache.get_tasks = AsyncMock(return_value=[
+                {**row._asdict(), "created_at": row.created_at.isoformat(),
+                 "deadline": row.deadline.isoformat() if row.deadline else None}
+                for row in rows
+            ])
+        else:
+            mock_task_repository.get_tasks = AsyncMock(return_value=rows)
+        service = TaskService(task_repo=mock_task_repository, result_cache=result_cache)
+        get_params = params.GetTasks(limit=2)
+        
+        # Act
+        document = json.loads(await service.encode_tasks(get_params))
+        packed = msgpack.unpackb(await service.encode_tasks(get_params, media_type=formats.MSGPACK))
+        table = pyarrow.ipc.open_stream(await service.encode_tasks(get_params, media_type=formats.ARROW)).read_all()
+        
+        # Assert
+        assert packed == document
+        assert table.column_names == list(responses.Task.model_fields)
+        assert json.loads(json.dumps(table.to_pylist(), default=datetime.isoformat)) == document["items"]
+        assert table.schema.metadata == {b"next_cursor": document["next_cursor"].encode()}
+    
+    async def test_encode_tasks_empty_arrow_page_keeps_schema(self, task_service, mock_task_repository):
+        """Test an empty page still carries typed columns."""
+        pyarrow = pytest.importorskip("pyarrow")
+        import pyarrow.ipc
+        from source.services import formats
+        
+        # Arrange
+        mock_task_repository.get_tasks = AsyncMock(return_value=[])
+        
+        # Act
+        encoded = await task_service.encode_tasks(params.GetTasks(), media_type=formats.ARROW)
+        
+        # Assert
+        table = pyarrow.ipc.open_stream(encoded).read_all()
+        assert table.num_rows == 0
+        assert str(table.schema.field("deadline").type) == "timestamp[us]"
+    
+    async def test_encode_tasks_sparse_fields(self, mock_task_repository):
+        """Test fields= picks item keys in response order, always with task_id, from rows and cached dicts."""
+        # Arrange
+        rows = IteratorResult(SimpleResultMetaData(["id", "priority_id", "label_id", "status_id", "description", "label"]), iter([
+            (1, None, 2, None, "Short", "Bug"),
+        ])).fetchall()
+        mock_task_repository.get_tasks = AsyncMock(return_value=rows)
+        result_cache = MagicMock()
+        result_cache.get_tasks = AsyncMock(return_value=[row._asdict() for row in rows])
+        get_params = params.GetTasks(fields="description,label", view="summary")
+        
+        # Act
+        direct = await TaskService(task_repo=mock_task_repository).encode_tasks(get_params)
+        cached = await TaskService(task_repo=mock_task_repository, result_cache=result_cache).encode_tasks(get_params)
+        
+        # Assert
+        assert direct == cached == b'{"items":[{"task_id":1,"label":"Bug","description":"Short"}],"next_cursor":null,"prev_cursor":null}'
+    
+    async def test_encode_tasks_only_task_id(self, task_service, mock_task_repository):
+        """Test a selection of task_id alone still yields one-key items."""
+        # Arrange
+        rows = IteratorResult(SimpleResultMetaData(["id", "priority_id", "label_id", "status_id"]), iter([(7, None, None, None)])).fetchall()
+        mock_task_repository.get_tasks = AsyncMock(return_value=rows)
+        
+        # Act
+        encoded = await task_service.encode_tasks(params.GetTasks(fields="task_id"))
+        
+        # Assert
+        assert json.loads(encoded)["items"] == [{"task_id": 7}]
+    
+    def test_fields_parameter_validation(self):
+        """Test fields= accepts only response field names, comma-separated."""
+        assert params.GetTasks(fields="label,deadline").fields == "label,deadline"
+        for invalid in ("secret", "label,", "label, deadline", ""):
+            with pytest.raises(ValueError):
+                params.GetTasks(fields=invalid)
+    
+    async def test_encode_tasks_sparse_arrow(self, task_service, mock_task_repository):
+        """Test Arrow pages carry only the selected columns."""
+        pyarrow = pytest.importorskip("pyarrow")
+        import pyarrow.ipc
+        from source.services import formats
+        
+        # Arrange
+        rows = IteratorResult(SimpleResultMetaData(["id", "priority_id", "label_id", "status_id", "deadline"]), iter([
+            (1, None, None, None, datetime(2025, 1, 1)),
+        ])).fetchall()
+        mock_task_repository.get_tasks = AsyncMock(return_value=rows)
+        
+        # Act
+        encoded = await task_service.encode_tasks(params.GetTasks(fields="deadline"), media_type=formats.ARROW)
+        
+        # Assert
+        table = pyarrow.ipc.open_stream(encoded).read_all()
+        assert table.to_pylist() == [{"task_id": 1, "deadline": datetime(2025, 1, 1)}]
@@ -0,0 +1,159 @@
+"""
+Unit tests for the task change stream fan-out
+"""
+import asyncio
+import json
+from collections import namedtuple
+from datetime import datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from source.db.changes import Change, INSERT, UPDATE, DELETE
+from source.services.task_stream import TaskStreamHub, HEARTBEAT, EVICTED
+
+
+Row = namedtuple("Row", "id deadline description created_at priority label status")
+
+
+def _row(id: int) -> Row:
+    return Row(id, None, f"Task {id}", datetime(2025, 1, 1), "High", "Bug", "Open")
+
+
+def _parse(event: bytes) -> tuple[str, dict]:
+    fields = dict(line.split(": ", 1) for line in event.decode().strip().splitlines())
+    return fields["event"], json.loads(fields["data"])
+
+
+async def _publish(hub: TaskStreamHub, changes: list[Change]):
+    hub.on_changes(changes)
+    await hub._dispatcher
+
+
+@pytest.mark.unit
+class TestTaskStreamHub:
+    """Test event encoding, fan-out and slow-consumer eviction."""
+
+    @pytest.fixture
+    def load(self):
+        """Loader returning a row for every requested id except 404."""
+        return AsyncMock(side_effect=lambda ids: [_row(id) for id in ids if id != 404])
+
+    @pytest.fixture
+    def hub(self, load):
+        """Hub with a small per-subscriber buffer."""
+        return TaskStreamHub(load=load, queue_size=2, heartbeat=60, max_subscribers=3)
+
+    async def test_upsert_fans_out_to_every_subscriber(self, hub, load):
+        """Test one committed change is loaded once and delivered to all subscribers."""
+        # Arrange
+        first, second = hub.subscribe(), hub.subscribe()
+
+        # Act
+        await _publish(hub, [Change("tasks", INSERT, (2, 1)), Change("tasks", UPDATE, (1,))])
+
+        # Assert
+        load.assert_awaited_once_with([1, 2])
+        event = first.queue.get_nowait()
+        assert event == second.queue.get_nowait()
+        name, data = _parse(event)
+        assert name == "upsert"
+        assert [item["task_id"] for item in data["items"]] == [1, 2]
+        assert data["items"][0]["created_at"] == "2025-01-01T00:00:00"
+
+    async def test_delete_and_vanished_rows(self, hub):
+        """Test deletes and rows gone before loading are sent as delete events."""
+        # Arrange
+        subscription = hub.subscribe()
+
+        # Act
+        await _publish(hub, [Change("tasks", DELETE, (3,)), Change("tasks", UPDATE, (404,))])
+
+        # Assert
+        assert _parse(subscription.queue.get_nowait()) == ("delete", {"ids": [3, 404]})
+
+    async def test_whole_table_change_resets(self, hub, load):
+        """Test changes without ids and reference renames ask clients to reload."""
+        # Arrange
+        subscription = hub.subscribe()
+
+        # Act
+        await _publish(hub, [Change("tasks", UPDATE)])
+        await _publish(hub, [Change("labels", UPDATE, (1,))])
+
+        # Assert
+        assert _parse(subscription.queue.get_nowait())[0] == "reset"
+        assert _parse(subscription.queue.get_nowait())[0] == "reset"
+        load.assert_not_awaited()
+
+    async def test_no_subscribers_skips_loading(self, hub, load):
+        """Test changes are ignored while nobody listens."""
+        # Act
+        hub.on_changes([Change("tasks", INSERT, (1,))])
+
+        # Assert
+        assert hub._dispatcher is None
+        load.assert_not_awaited()
+
+    async def test_slow_consumer_is_evicted(self, hub):
+        """Test a full buffer evicts only that subscriber."""
+        # Arrange
+        slow, fast = hub.subscribe(), hub.subscribe()
+
+        # Act
+        for id in range(3):
+            await _publish(hub, [Change("tasks", DELETE, (id,))])
+            fast.queue.get_nowait()
+
+        # Assert
+        assert slow.evicted
+        assert slow.queue.get_nowait() == EVICTED
+        assert hub.subscribers == {fast}
+        assert hub.evictions == 1
+
+    async def test_evicted_stream_ends_with_one_notice(self, hub):
+        """Test a subscriber evicted while waiting receives the eviction notice once and the stream ends."""
+        # Arrange
+        events = hub.events()
+        await anext(events)
+        (subscription,) = hub.subscribers
+
+        # Act
+        waiting = asyncio.ensure_future(anext(events))
+        await asyncio.sleep(0)
+        hub._evict(subscription)
+        received = [await waiting] + [event async for event in events]
+
+        # Assert
+        assert received == [EVICTED]
+        assert not hub.subscribers
+
+    async def test_events_unsubscribe_on_close(self, hub):
+        """Test the event iterator heartbeats, delivers and unsubscribes when closed."""
+        # Arrange
+        events = hub.events()
+
+        # Act
+        first = await anext(events)
+        await _publish(hub, [Change("tasks", DELETE, (1,))])
+        second = await anext(events)
+        await events.aclose()
+
+        # Assert
+        assert first == HEARTBEAT
+        assert _parse(second)[0] == "delete"
+        assert not hub.subscribers
+
+    async def test_idle_heartbeat(self, load):
+        """Test idle subscribers receive a heartbeat comment."""
+        # Arrange
+        hub = TaskStreamHub(load=load, heartbeat=0.01)
+        events = hub.events()
+        await anext(events)
+
+        # Act
+        beat = await asyncio.wait_for(anext(events), timeout=1)
+        await events.aclose()
+
+        # Assert
+        assert beat == HEARTBEAT
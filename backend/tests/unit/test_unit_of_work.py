@@ -0,0 +1,78 @@
+"""
+Unit tests for the request-scoped unit of work
+"""
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from source.db import dbase
+from source.db.repositories import TaskRepository
+
+
+@pytest.mark.unit
+class TestUnitOfWork:
+    """Test that a request commits once and repositories only flush."""
+
+    @pytest.fixture
+    def mock_session(self, mocker):
+        """Patch the process-wide session maker with a mock session."""
+        session = MagicMock()
+        session.info = {}
+        session.commit = AsyncMock()
+        session.rollback = AsyncMock()
+        session.flush = AsyncMock()
+
+        session_maker = MagicMock()
+        session_maker.return_value.__aenter__ = AsyncMock(return_value=session)
+        session_maker.return_value.__aexit__ = AsyncMock(return_value=None)
+        mocker.patch.object(dbase, "SESSION_MAKER", session_maker)
+        return session
+
+    async def test_commits_once_on_success(self, mock_session):
+        """Test the transaction is committed when the request succeeds."""
+        # Act
+        dependency = dbase.get_unit_of_work()
+        session = await anext(dependency)
+        with pytest.raises(StopAsyncIteration):
+            await anext(dependency)
+
+        # Assert
+        assert session.info[dbase.UNIT_OF_WORK] is True
+        mock_session.commit.assert_awaited_once()
+        mock_session.rollback.assert_not_awaited()
+
+    async def test_rolls_back_on_error(self, mock_session):
+        """Test the transaction is rolled back when the request fails."""
+        # Act
+        dependency = dbase.get_unit_of_work()
+        await anext(dependency)
+        with pytest.raises(RuntimeError):
+            await dependency.athrow(RuntimeError("boom"))
+
+        # Assert
+        mock_session.rollback.assert_awaited_once()
+        mock_session.commit.assert_not_awaited()
+
+    async def test_repository_flushes_inside_unit_of_work(self, mock_session):
+        """Test repository writes flush instead of committing inside a unit of work."""
+        # Arrange
+        mock_session.info[dbase.UNIT_OF_WORK] = True
+        repo = TaskRepository(mock_session)
+
+        # Act
+        await repo._commit()
+
+        # Assert
+        mock_session.flush.assert_awaited_once()
+        mock_session.commit.assert_not_awaited()
+
+    async def test_repository_commits_without_unit_of_work(self, mock_session):
+        """Test repository writes commit when used outside a unit of work."""
+        # Arrange
+        repo = TaskRepository(mock_session)
+
+        # Act
+        await repo._commit()
+
+        # Assert
+        mock_session.commit.assert_awaited_once()
+        mock_session.flush.assert_not_awaited()
@@ -148,10 +148,74 @@ class ApiService {
     }
 
     // Задачи (требуют авторизации)
+    async getTasksPage(params = {}) {
+        const query = new URLSearchParams(params).toString();
+        return this.makeAuthenticatedRequest(`/tasks/get${query ? `?${query}` : ''}`, {
+            method: 'GET'
+        });
+    }
+
+    // Загружает все страницы, следуя за next_cursor
     async getTasks() {
-        return this.makeAuthenticatedRequest('/tasks/get', {
+        const tasks = [];
+        let cursor = null;
+        do {
+            const params = { limit: 1000 };
+            if (cursor) {
+                params.after = cursor;
+            }
+            const data = await this.getTasksPage(params);
+            tasks.push(...(data.items || []));
+            cursor = data.next_cursor;
+        } while (cursor);
+        return tasks;
+    }
+
+    // Сводка для дашборда: счетчики и последние задачи
+    async getTaskStats(recent = 5) {
+        return this.makeAuthenticatedRequest(`/tasks/stats?recent=${recent}`, {
             method: 'GET'
-        }).then(data => data.items || []);
+        });
+    }
+
+    // Изменения задач с версии since; без since возвращает версию для начала синхронизации
+    async getTaskChanges(since = null) {
+        const result = { items: [], deleted: [], version: null, resync_required: false };
+        let cursor = null;
+        do {
+            const params = since === null ? {} : { since };
+            if (cursor) {
+                params.after = cursor;
+            }
+            const query = new URLSearchParams(params).toString();
+            const data = await this.makeAuthenticatedRequest(`/tasks/changes${query ? `?${query}` : ''}`, {
+                method: 'GET'
+            });
+            result.items.push(...data.items);
+            result.deleted.push(...data.deleted);
+            result.version = data.version;
+            result.resync_required = data.resync_required;
+            cursor = data.next_cursor;
+        } while (cursor);
+        return result;
+    }
+
+    // Подписка на изменения задач (Server-Sent Events)
+    openTaskStream(handlers = {}) {
+        const source = new EventSource(`${this.baseURL}/tasks/stream`);
+        const parse = (handler) => (event) => handler && handler(JSON.parse(event.data));
+
+        source.addEventListener('upsert', parse(handlers.onUpsert));
+        source.addEventListener('delete', parse(handlers.onDelete));
+        source.addEventListener('reset', parse(handlers.onReset));
+        source.addEventListener('evicted', (event) => {
+            // Сервер отключил отстающего клиента: переподключаемся и загружаем список заново
+            source.close();
+            handlers.onEvicted && handlers.onEvicted(event);
+        });
+        source.onopen = () => handlers.onOpen && handlers.onOpen();
+        source.onerror = () => handlers.onError && handlers.onError();
+        return source;
     }
 
     async createTask(taskData) {
@@ -8,6 +8,10 @@ class TaskManagerApp {
             priority: ''
         };
         this.allTasks = [];
+        this.taskStream = null;
+        this.taskStreamLive = false;
+        this.syncVersion = null;
+        this.dashboardRefreshTimer = null;
         this.initApp();
     }
 
@@ -32,6 +36,117 @@ class TaskManagerApp {
 
         // Периодическая проверка аутентификации
         this.startAuthCheck();
+
+        // Подписка на изменения задач
+        if (utils.checkAuth()) {
+            this.startTaskStream();
+        }
+    }
+
+    // Подписка на поток изменений задач: патчим локальный список вместо перезагрузки
+    startTaskStream() {
+        if (this.taskStream) {
+            return;
+        }
+
+        let reconnecting = false;
+        this.taskStream = api.openTaskStream({
+            onOpen: () => {
+                this.taskStreamLive = true;
+                // После обрыва связи изменения могли быть пропущены
+                if (reconnecting) {
+                    reconnecting = false;
+                    this.syncTasks();
+                }
+            },
+            onError: () => {
+                this.taskStreamLive = false;
+                reconnecting = true;
+            },
+            onUpsert: ({ items }) => {
+                this.mergeTasks(items);
+                this.refreshTaskViews();
+            },
+            onDelete: ({ ids }) => {
+                this.removeTasks(ids);
+                this.refreshTaskViews();
+            },
+            onReset: () => this.reloadTaskViews(),
+            onEvicted: () => {
+                this.taskStream = null;
+                this.taskStreamLive = false;
+                this.syncTasks();
+                this.startTaskStream();
+            }
+        });
+    }
+
+    // Заменить или добавить задачи в локальном списке
+    mergeTasks(items) {
+        const byId = new Map(items.map(task => [task.task_id, task]));
+        this.allTasks = this.allTasks.map(task => {
+            const updated = byId.get(task.task_id);
+            byId.delete(task.task_id);
+            return updated || task;
+        });
+        this.allTasks.push(...byId.values());
+    }
+
+    // Убрать удаленные задачи из локального списка
+    removeTasks(ids) {
+        const deleted = new Set(ids);
+        this.allTasks = this.allTasks.filter(task => !deleted.has(task.task_id));
+    }
+
+    // Догрузить только изменения с последней синхронизации
+    async syncTasks() {
+        if (this.syncVersion === null) {
+            return this.reloadTaskViews();
+        }
+
+        try {
+            const changes = await api.getTaskChanges(this.syncVersion);
+            if (changes.resync_required) {
+                // Сервер уже не помнит удаления с этой версии
+                return this.reloadTaskViews();
+            }
+            this.removeTasks(changes.deleted);
+            this.mergeTasks(changes.items);
+            this.syncVersion = changes.version;
+            this.refreshTaskViews();
+        } catch (error) {
+            console.error('Error syncing tasks:', error);
+        }
+    }
+
+    // Перерисовать открытую страницу из локального списка задач
+    refreshTaskViews() {
+        switch (utils.getCurrentPage()) {
+            case 'tasksPage':
+                this.applyCurrentFilters();
+                break;
+            case 'dashboardPage':
+                this.scheduleDashboardRefresh();
+                break;
+        }
+    }
+
+    // Пачка событий из потока перезапрашивает статистику один раз
+    scheduleDashboardRefresh() {
+        clearTimeout(this.dashboardRefreshTimer);
+        this.dashboardRefreshTimer = setTimeout(() => this.loadDashboardData(), 1000);
+    }
+
+    // Полная перезагрузка задач открытой страницы
+    async reloadTaskViews() {
+        switch (utils.getCurrentPage()) {
+            case 'tasksPage':
+                await this.loadTasks();
+                break;
+            case 'dashboardPage':
+                await this.loadDashboardData();
+                break;
+        }
     }
 
     // Защита страниц
@@ -282,6 +397,10 @@ class TaskManagerApp {
             return;
         }
 
+        if (utils.isProtectedPage(pageId)) {
+            this.startTaskStream();
+        }
+
         switch (pageId) {
             case 'tasksPage':
                 this.loadTasks();
@@ -313,19 +432,15 @@ class TaskManagerApp {
         }
 
         try {
-            const [tasks, labels, statuses, priorities] = await Promise.all([
-                api.getTasks(),
-                api.getLabels(),
-                api.getStatuses(),
-                api.getPriorities()
-            ]);
+            // Счетчики и последние задачи считает сервер одним запросом
+            const stats = await api.getTaskStats(5);
 
-            document.getElementById('totalTasks').textContent = tasks.length;
-            document.getElementById('totalLabels').textContent = labels.length;
-            document.getElementById('totalStatuses').textContent = statuses.length;
-            document.getElementById('totalPriorities').textContent = priorities.length;
+            document.getElementById('totalTasks').textContent = stats.total;
+            document.getElementById('totalLabels').textContent = stats.labels;
+            document.getElementById('totalStatuses').textContent = stats.statuses;
+            document.getElementById('totalPriorities').textContent = stats.priorities;
             
-            this.displayRecentTasks(tasks.slice(0, 5));
+            this.displayRecentTasks(stats.recent);
             
         } catch (error) {
             console.error('Error loading dashboard data:', error);
@@ -391,8 +506,11 @@ class TaskManagerApp {
         }
 
         try {
+            // Версию берем до загрузки, чтобы не пропустить изменения во время нее
+            const { version } = await api.getTaskChanges();
             const tasks = await api.getTasks();
             this.allTasks = tasks; // Сохраняем все задачи
+            this.syncVersion = version;
             this.applyCurrentFilters(); // Применяем текущие фильтры
         } catch (error) {
             console.error('Error loading tasks:', error);
@@ -716,9 +834,11 @@ class TaskManagerApp {
             
             this.closeTaskModal();
             
-            // Перезагружаем данные (обновляем кэш)
-            await this.loadTasks();
-            await this.loadDashboardData();
+            // Перезагружаем данные, если изменения не придут через поток
+            if (!this.taskStreamLive) {
+                await this.loadTasks();
+                await this.loadDashboardData();
+            }
             
             console.log('Task saved successfully');
             
@@ -747,9 +867,11 @@ class TaskManagerApp {
         if (confirm('Are you sure you want to delete this task?')) {
             try {
                 await api.deleteTask(taskId);
-                // Перезагружаем задачи (обновляем кэш)
-                await this.loadTasks();
-                await this.loadDashboardData();
+                // Перезагружаем задачи, если изменения не придут через поток
+                if (!this.taskStreamLive) {
+                    await this.loadTasks();
+                    await this.loadDashboardData();
+                }
             } catch (error) {
                 console.error('Error deleting task:', error);
                 utils.handleApiError(error);